@@ -1,28 +1,181 @@
 """Flair Component."""
 from __future__ import annotations
 
+import asyncio
+
+from flairaio.exceptions import FlairAuthError
+from flairaio.model import FlairData
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_CLIENT_ID
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
-
-from .const import DOMAIN, LOGGER, PLATFORMS
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.typing import ConfigType
+
+from .api import FlairApiClient
+from .const import (
+    CONF_STRUCTURE_COORDINATORS,
+    DOMAIN,
+    FLAIR_ERRORS,
+    LOGGER,
+    PLATFORMS,
+    TIMEOUT,
+)
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_device_cleanup
+from .history import remove_histories
+from .services import async_setup_services
+from .storage import SnapshotStore, WriteJournal
 from .util import NoStructuresError, NoUserError, async_validate_api
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Flair services."""
+
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Flair from a config entry."""
 
-    coordinator = FlairDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    client = FlairApiClient(
+        entry.data[CONF_CLIENT_ID],
+        entry.data[CONF_CLIENT_SECRET],
+        session=async_get_clientsession(hass),
+        timeout=TIMEOUT,
+    )
+
+    store = SnapshotStore(hass, entry.entry_id)
+    restored = await store.async_load()
+    journal = WriteJournal(hass, entry.entry_id)
+    await journal.async_load()
+
+    # Coordinators are stored by the id of the structure they fetch.
+    if entry.options.get(CONF_STRUCTURE_COORDINATORS):
+        # Each structure gets its own coordinator so a slow or failing
+        # structure doesn't hold up the others.
+        if restored is not None:
+            structure_ids = store.structure_ids or list(restored.structures)
+        else:
+            try:
+                structure_ids = list((await client.get_structures()).structures)
+            except FlairAuthError as error:
+                raise ConfigEntryAuthFailed(error) from error
+            except FLAIR_ERRORS as error:
+                raise ConfigEntryNotReady(error) from error
+            if not structure_ids:
+                raise ConfigEntryNotReady("No Structures found")
+            store.structure_ids = structure_ids
+
+        coordinators = {
+            structure_id: FlairDataUpdateCoordinator(
+                hass, entry, client, store, journal, structure_id, fetch_users=index == 0
+            )
+            for index, structure_id in enumerate(structure_ids)
+        }
+        results = await asyncio.gather(*(
+            async_first_refresh(hass, entry, coordinator, restored) for coordinator in coordinators.values()
+        ), return_exceptions=True)
+        check_first_refreshes(dict(zip(coordinators, results)))
+    else:
+        coordinator = FlairDataUpdateCoordinator(hass, entry, client, store, journal)
+        await async_first_refresh(hass, entry, coordinator, restored)
+        coordinators = {structure_id: coordinator for structure_id in coordinator.data.structures}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinators
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_device_cleanup(hass, entry, coordinators)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    if entry.options.get(CONF_STRUCTURE_COORDINATORS) and restored is not None:
+        entry.async_create_background_task(
+            hass,
+            async_reconcile_structures(hass, entry, client, store, list(coordinators)),
+            'Flair structure check',
+        )
 
     return True
 
 
+async def async_first_refresh(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: FlairDataUpdateCoordinator,
+    restored: FlairData | None,
+) -> None:
+    """Start a coordinator from the saved snapshot, or wait for its first refresh.
+
+    A coordinator started from the saved snapshot refreshes in the background
+    so that setup doesn't have to wait on the cloud.
+    """
+
+    if restored is not None and coordinator.async_restore(restored):
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f'{coordinator.name} first refresh'
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+
+def check_first_refreshes(results: dict[str, BaseException | None]) -> None:
+    """Raise the error of the first refresh of the structure coordinators, unless only some failed.
+
+    A structure whose first refresh failed keeps retrying in the background
+    and its entities are added once it succeeds. Authentication failures and
+    unexpected errors are raised right away.
+    """
+
+    errors = {structure_id: error for structure_id, error in results.items() if error is not None}
+    for error in errors.values():
+        if not isinstance(error, ConfigEntryNotReady):
+            raise error
+    if errors and len(errors) == len(results):
+        raise next(iter(errors.values()))
+    for structure_id, error in errors.items():
+        LOGGER.warning(f'Flair structure {structure_id} is not ready yet, retrying in the background: {error}')
+
+
+async def async_reconcile_structures(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: FlairApiClient,
+    store: SnapshotStore,
+    structure_ids: list[str],
+) -> None:
+    """Reload the config entry if structures were added to or removed from the account.
+
+    Coordinators started from the saved snapshot are created for the
+    structures the snapshot knew about. The structures on the account are
+    saved before reloading, so removed structures aren't restored again and
+    added structures get a coordinator.
+    """
+
+    try:
+        current = list((await client.get_structures()).structures)
+    except FLAIR_ERRORS as error:
+        LOGGER.debug(f'Failed to check the Flair structures, keeping the saved ones: {error}')
+        return
+    if not current or set(current) == set(structure_ids):
+        return
+
+    LOGGER.info(f'Flair structures changed from {structure_ids} to {current}, reloading')
+    await store.async_set_structure_ids(current)
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload Flair config entry when options are updated."""
+
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Flair config entry."""
 
@@ -33,6 +186,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved snapshot, queued writes and reading history of a removed Flair config entry."""
+
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+    await WriteJournal(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(remove_histories, hass.config.path(STORAGE_DIR), entry.entry_id)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
 
@@ -0,0 +1,319 @@
+"""Rate limited Flair API client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+from time import monotonic
+from typing import Any
+
+from aiohttp import ClientError, ClientResponse
+from flairaio import FlairClient
+from flairaio.constants import Endpoint
+from flairaio.exceptions import FlairError
+
+from .const import (
+    LANE_BACKGROUND,
+    LANE_INTERACTIVE,
+    LANES,
+    LOGGER,
+    RATE_LIMIT_BACKOFF_BASE,
+    RATE_LIMIT_BACKOFF_MAX,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_REFILL,
+    RATE_LIMIT_RESERVE,
+    RATE_LIMIT_RETRIES,
+)
+
+
+# Lane of the GET requests made by the current task. Writes are always interactive.
+REQUEST_LANE: ContextVar[str] = ContextVar('flair_request_lane', default=LANE_BACKGROUND)
+
+
+@contextmanager
+def request_lane(lane: str) -> Iterator[None]:
+    """Make the GET requests of the enclosed block, and of tasks it starts, in a lane."""
+
+    token = REQUEST_LANE.set(lane)
+    try:
+        yield
+    finally:
+        REQUEST_LANE.reset(token)
+
+
+class FlairRateLimitError(FlairError):
+    """Flair responded with 429 Too Many Requests."""
+
+    def __init__(self, retry_after: float | None) -> None:
+        """Initialize with the delay requested by Flair, if any."""
+
+        super().__init__(f'Flair API rate limit exceeded (retry after: {retry_after})')
+        self.retry_after = retry_after
+
+
+class RequestLimiter:
+    """Token bucket shared by every request made to the Flair API.
+
+    Requests in the background lane wait while fewer than `reserve` tokens
+    are left so that writes made by users are never stuck behind polling.
+    Requests also wait while a lane with a higher priority in LANES has
+    requests waiting or in flight, so a poll pauses between its requests
+    until a user's write and its confirmation are done.
+    """
+
+    def __init__(
+            self,
+            capacity: int = RATE_LIMIT_CAPACITY,
+            rate: float = RATE_LIMIT_REFILL,
+            reserve: int = RATE_LIMIT_RESERVE,
+    ) -> None:
+        """Initialize the request limiter."""
+
+        self.capacity = capacity
+        self.rate = rate
+        self.reserve = reserve
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+        self._blocked_until = 0.0
+        self.throttled = 0
+        # Requests waiting or in flight in each lane, and an event set when there are none.
+        self._busy = dict.fromkeys(LANES, 0)
+        self._idle = {lane: asyncio.Event() for lane in LANES}
+        for idle in self._idle.values():
+            idle.set()
+        # Requests made, seconds spent waiting and seconds until done, by lane.
+        self._latency = {lane: [0, 0.0, 0.0, 0.0] for lane in LANES}
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests that can be made right now."""
+
+        self._refill()
+        return int(self._tokens)
+
+    @property
+    def blocked_for(self) -> float:
+        """Return the number of seconds until requests are allowed after a 429."""
+
+        return max(self._blocked_until - monotonic(), 0.0)
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, lane: str) -> None:
+        """Wait until a request may be made in the given lane.
+
+        Every acquired request must be released once it's done.
+        """
+
+        floor = self.reserve if lane == LANE_BACKGROUND else 0
+        higher = LANES[:LANES.index(lane)]
+        self._busy[lane] += 1
+        self._idle[lane].clear()
+        try:
+            while True:
+                if (busy := next((other for other in higher if self._busy[other]), None)) is not None:
+                    await self._idle[busy].wait()
+                    continue
+                if (blocked_for := self.blocked_for) > 0:
+                    await asyncio.sleep(blocked_for)
+                    continue
+                self._refill()
+                if self._tokens - 1 >= floor:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((floor + 1 - self._tokens) / self.rate)
+        except BaseException:
+            self._leave(lane)
+            raise
+
+    def release(self, lane: str, waited: float, latency: float) -> None:
+        """Release a request, recording the seconds it waited and took in total."""
+
+        self._leave(lane)
+        stats = self._latency[lane]
+        stats[0] += 1
+        stats[1] += waited
+        stats[2] += latency
+        stats[3] = max(stats[3], latency)
+
+    def _leave(self, lane: str) -> None:
+        """Let lower lanes go ahead once a lane has no requests left."""
+
+        self._busy[lane] -= 1
+        if not self._busy[lane]:
+            self._idle[lane].set()
+
+    def block(self, seconds: float) -> None:
+        """Hold back every request for the given number of seconds."""
+
+        self.throttled += 1
+        self._blocked_until = max(self._blocked_until, monotonic() + seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current budget for diagnostics."""
+
+        return {
+            'capacity': self.capacity,
+            'refill_per_second': self.rate,
+            'interactive_reserve': self.reserve,
+            'remaining': self.remaining,
+            'blocked_for': round(self.blocked_for, 1),
+            'throttled': self.throttled,
+            'lanes': {
+                lane: {
+                    'busy': self._busy[lane],
+                    'requests': requests,
+                    'mean_wait': round(waited / requests, 3) if requests else None,
+                    'mean_latency': round(latency / requests, 3) if requests else None,
+                    'max_latency': round(max_latency, 3),
+                }
+                for lane, (requests, waited, latency, max_latency) in self._latency.items()
+            },
+        }
+
+
+class FlairApiClient(FlairClient):
+    """Flair client that draws every request from a shared budget.
+
+    GET requests are made in the lane set with request_lane, which is the
+    background lane unless set otherwise. Writes are made in the interactive
+    lane. A 429 response pauses all requests for the time requested by Flair,
+    or for a jittered exponential backoff, before the request is retried.
+
+    GET requests are conditional whenever Flair returned an ETag or
+    Last-Modified header for the endpoint before. On 304 Not Modified the
+    previously parsed response is returned as is, so callers can tell that
+    nothing changed by identity.
+    """
+
+    def __init__(self, *args: Any, limiter: RequestLimiter | None = None, **kwargs: Any) -> None:
+        """Initialize the Flair API client."""
+
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter or RequestLimiter()
+        # Validators and parsed response of each endpoint, keyed by endpoint.
+        self._validated: dict[str, tuple[str | None, str | None, dict[str, Any]]] = {}
+        self.not_modified = 0
+
+    async def _get(self, endpoint: str, data: dict[str, Any] = None) -> dict[str, Any]:
+        """Make a rate limited GET call to Flair servers."""
+
+        return await self._request(REQUEST_LANE.get(), self._conditional_get, endpoint, data)
+
+    async def _conditional_get(self, endpoint: str, data: dict[str, Any] = None) -> dict[str, Any]:
+        """Make a conditional GET call to Flair servers."""
+
+        data = data if data else {}
+        await self.check_token()
+        headers = await self._create_get_header()
+        if cached := self._validated.get(endpoint):
+            etag, last_modified, _ = cached
+            if etag:
+                headers['if-none-match'] = etag
+            if last_modified:
+                headers['if-modified-since'] = last_modified
+
+        async with self._session.get(
+                url=f'{Endpoint.BASE_URL}{endpoint}', headers=headers,
+                data=data, timeout=self.timeout) as resp:
+            if resp.status == 304 and cached:
+                self.not_modified += 1
+                return cached[2]
+            response = await self._response(resp)
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+
+        if response is not None and (etag or last_modified):
+            self._validated[endpoint] = (etag, last_modified, response)
+        else:
+            self._validated.pop(endpoint, None)
+        return response
+
+    async def _post(self, endpoint: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+        """Make a rate limited POST call to Flair servers."""
+
+        return await self._request(LANE_INTERACTIVE, super()._post, endpoint, headers, data)
+
+    async def _patch(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Make a rate limited PATCH call to Flair servers."""
+
+        return await self._request(LANE_INTERACTIVE, super()._patch, endpoint, data)
+
+    async def _delete(self, endpoint: str) -> None:
+        """Make a rate limited DELETE call to Flair servers."""
+
+        return await self._request(LANE_INTERACTIVE, super()._delete, endpoint)
+
+    async def _request(self, lane: str, method: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Make a request once the budget allows it, retrying after a 429."""
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            started = monotonic()
+            await self.limiter.acquire(lane)
+            acquired = monotonic()
+            try:
+                return await method(*args)
+            except FlairRateLimitError as error:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                backoff = min(RATE_LIMIT_BACKOFF_BASE * 2 ** attempt, RATE_LIMIT_BACKOFF_MAX)
+                delay = max(error.retry_after or 0, backoff) + random.uniform(0, backoff)
+                LOGGER.warning(f'Flair API rate limit exceeded. Retrying in {delay:.1f} seconds')
+                self.limiter.block(delay)
+            finally:
+                self.limiter.release(lane, acquired - started, monotonic() - started)
+
+    def cache_info(self) -> dict[str, Any]:
+        """Return conditional request statistics for diagnostics."""
+
+        return {
+            'validated_endpoints': len(self._validated),
+            'not_modified': self.not_modified,
+        }
+
+    async def _response(self, resp: ClientResponse) -> dict[str, Any] | None:
+        """Raise FlairRateLimitError on 429 before checking the response for other errors."""
+
+        if resp.status == 429:
+            raise FlairRateLimitError(retry_after(resp))
+        return await FlairClient._response(resp)
+
+
+def retry_after(resp: ClientResponse) -> float | None:
+    """Parse the Retry-After header, given either in seconds or as an HTTP date."""
+
+    if (value := resp.headers.get('Retry-After')) is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Determine if a failed request may succeed when it's retried.
+
+    flairaio raises FlairError with the response on 504 Gateway Timeout and
+    chains the parse error when a response isn't JSON, like the error page
+    of an unavailable server. Other FlairErrors are rejections of the request.
+    """
+
+    if isinstance(error, (asyncio.TimeoutError, ClientError, FlairRateLimitError)):
+        return True
+    if isinstance(error, FlairError):
+        return error.__cause__ is not None or any(isinstance(arg, ClientResponse) for arg in error.args)
+    return False
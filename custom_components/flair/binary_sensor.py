@@ -14,10 +14,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LOGGER, TYPE_TO_MODEL
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
+from .records import BridgeRecord, PuckRecord, VentRecord
 
 
 async def async_setup_entry(
@@ -25,32 +27,38 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Binary Sensor Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[BinarySensorEntity]:
+    """Create the binary sensor entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     binary_sensors = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    binary_sensors.append(Connectivity(coordinator, structure_id, puck_id, 'pucks'))
-            # Vents
-            if structure_data.vents:
-                for vent_id, vent_data in structure_data.vents.items():
-                    binary_sensors.append(Connectivity(coordinator, structure_id, vent_id, 'vents'))
-            # Bridges
-            if structure_data.bridges:
-                for bridge_id, bridge_data in structure_data.bridges.items():
-                    binary_sensors.append(Connectivity(coordinator, structure_id, bridge_id, 'bridges'))
+    # Pucks
+    if structure_data.pucks:
+        for puck_id, puck_data in structure_data.pucks.items():
+            binary_sensors.append(Connectivity(coordinator, structure_id, puck_id, 'pucks'))
+    # Vents
+    if structure_data.vents:
+        for vent_id, vent_data in structure_data.vents.items():
+            binary_sensors.append(Connectivity(coordinator, structure_id, vent_id, 'vents'))
+    # Bridges
+    if structure_data.bridges:
+        for bridge_id, bridge_data in structure_data.bridges.items():
+            binary_sensors.append(Connectivity(coordinator, structure_id, bridge_id, 'bridges'))
 
-    async_add_entities(binary_sensors)
+    return binary_sensors
 
 
-class Connectivity(CoordinatorEntity, BinarySensorEntity):
+class Connectivity(FlairEntity, BinarySensorEntity):
     """Representation of Bridge, Puck, and Vent connection status."""
 
     def __init__(self, coordinator, structure_id, device_id, device_type):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=((device_type, device_id),))
         self.device_id = device_id
         self.device_type = device_type
         self.structure_id = structure_id
@@ -67,12 +75,13 @@ class Connectivity(CoordinatorEntity, BinarySensorEntity):
     def device_data(self) -> Bridge | Puck | Vent:
         """Handle coordinator device data."""
 
-        if self.device_type == 'pucks':
-            return self.structure_data.pucks[self.device_id]
-        elif self.device_type == 'vents':
-            return self.structure_data.vents[self.device_id]
-        else:
-            return self.structure_data.bridges[self.device_id]
+        return self.coordinator.topology.resource(self.device_type, self.device_id)
+
+    @property
+    def device_record(self) -> BridgeRecord | PuckRecord | VentRecord:
+        """Handle coordinator device record."""
+
+        return self.coordinator.topology.record(self.device_type, self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -120,7 +129,7 @@ class Connectivity(CoordinatorEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         """Return True if device is online (connected to a gateway)."""
 
-        if not self.device_data.attributes['inactive']:
+        if not self.device_record.inactive:
             return True
         else:
             current_dt = datetime.now()
@@ -139,3 +148,9 @@ class Connectivity(CoordinatorEntity, BinarySensorEntity):
                     self.last_logged = current_dt
                     self.next_log = current_dt + timedelta(seconds=300)
             return False
+
+    @property
+    def available(self) -> bool:
+        """Return true if the device still exists."""
+
+        return super().available and self.coordinator.has_resources(self.coordinator_context)
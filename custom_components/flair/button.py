@@ -9,10 +9,11 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
 
 
 async def async_setup_entry(
@@ -20,40 +21,46 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Button Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[ButtonEntity]:
+    """Create the button entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     buttons = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
+    # Structures
+    buttons.extend((
+        HomeAwayClearHold(coordinator, structure_id),
+        HomeAwayRevert(coordinator, structure_id),
+    ))
+
+    # Rooms
+    if structure_data.rooms:
+        for room_id, room_data in structure_data.rooms.items():
             buttons.extend((
-                HomeAwayClearHold(coordinator, structure_id),
-                HomeAwayRevert(coordinator, structure_id),
+                RoomClearHold(coordinator, structure_id, room_id),
             ))
 
-            # Rooms
-            if structure_data.rooms:
-                for room_id, room_data in structure_data.rooms.items():
-                    buttons.extend((
-                        RoomClearHold(coordinator, structure_id, room_id),
-                    ))
+    # HVAC Units with only button controls
+    if structure_data.hvac_units:
+        for hvac_id, hvac_data in structure_data.hvac_units.items():
+            constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
+            if isinstance(constraints, list):
+                for constraint in constraints:
+                    buttons.append(HVACUnitControlButton(coordinator, structure_id, hvac_id, constraint))
 
-            # HVAC Units with only button controls
-            if structure_data.hvac_units:
-                for hvac_id, hvac_data in structure_data.hvac_units.items():
-                    constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
-                    if isinstance(constraints, list):
-                        for constraint in constraints:
-                            buttons.append(HVACUnitControlButton(coordinator, structure_id, hvac_id, constraint))
+    return buttons
 
-    async_add_entities(buttons)
 
-
-class HomeAwayClearHold(CoordinatorEntity, ButtonEntity):
+class HomeAwayClearHold(FlairEntity, ButtonEntity):
     """Representation of clearing home/away hold."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -106,6 +113,9 @@ class HomeAwayClearHold(CoordinatorEntity, ButtonEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -119,17 +129,16 @@ class HomeAwayClearHold(CoordinatorEntity, ButtonEntity):
             "hold-until": None
         }
 
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes, relationships={})
-        self.structure_data.attributes['hold-until'] = None
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'hold-until': None})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
 
-class HomeAwayRevert(CoordinatorEntity, ButtonEntity):
+class HomeAwayRevert(FlairEntity, ButtonEntity):
     """Representation of clearing home/away hold and reverting to previous state."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -182,6 +191,9 @@ class HomeAwayRevert(CoordinatorEntity, ButtonEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -192,12 +204,9 @@ class HomeAwayRevert(CoordinatorEntity, ButtonEntity):
         """Handle the button press."""
 
         home_attributes, hold_attributes = self.set_attributes()
-        await self.coordinator.client.update('structures', self.structure_data.id, home_attributes, relationships={})
-        await self.coordinator.client.update('structures', self.structure_data.id, hold_attributes, relationships={})
-        self.structure_data.attributes['home'] = home_attributes['home']
-        self.structure_data.attributes['hold-until'] = None
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, {**home_attributes, **hold_attributes})
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'home': home_attributes['home'], 'hold-until': None})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     def set_attributes(self) -> tuple[dict[str, bool], dict[str, None]]:
         """Creates attributes dictionary."""
@@ -219,11 +228,11 @@ class HomeAwayRevert(CoordinatorEntity, ButtonEntity):
         return home_attributes, hold_attributes
 
 
-class RoomClearHold(CoordinatorEntity, ButtonEntity):
+class RoomClearHold(FlairEntity, ButtonEntity):
     """Representation of clearing room temperature hold."""
 
     def __init__(self, coordinator, structure_id, room_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('rooms', room_id), ('structures', structure_id)))
         self.room_id = room_id
         self.structure_id = structure_id
 
@@ -231,7 +240,7 @@ class RoomClearHold(CoordinatorEntity, ButtonEntity):
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
+        return self.coordinator.topology.resource('rooms', self.room_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -283,6 +292,9 @@ class RoomClearHold(CoordinatorEntity, ButtonEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -297,18 +309,16 @@ class RoomClearHold(CoordinatorEntity, ButtonEntity):
             "hold-until-schedule-event": False
         }
 
-        await self.coordinator.client.update('rooms', self.room_data.id, attributes, relationships={})
-        self.room_data.attributes['hold-until'] = None
-        self.room_data.attributes['hold-until-schedule-event'] = False
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('rooms', self.room_data.id, attributes)
+        self.coordinator.async_set_pending('rooms', self.room_data.id, {'hold-until': None, 'hold-until-schedule-event': False})
+        await self.coordinator.async_request_resource_refresh('rooms', self.room_data.id)
 
 
-class HVACUnitControlButton(CoordinatorEntity, ButtonEntity):
+class HVACUnitControlButton(FlairEntity, ButtonEntity):
     """Representation of button available for HVAC unit."""
 
     def __init__(self, coordinator, structure_id, hvac_id, constraint):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('hvac-units', hvac_id), ('hvac-units', hvac_id, 'puck')))
         self.hvac_id = hvac_id
         self.structure_id = structure_id
         self.constraint = constraint
@@ -317,7 +327,7 @@ class HVACUnitControlButton(CoordinatorEntity, ButtonEntity):
     def hvac_data(self) -> HVACUnit:
         """Handle coordinator HVAC unit data."""
 
-        return self.coordinator.data.structures[self.structure_id].hvac_units[self.hvac_id]
+        return self.coordinator.topology.resource('hvac-units', self.hvac_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -329,8 +339,7 @@ class HVACUnitControlButton(CoordinatorEntity, ButtonEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        puck_id = self.hvac_data.relationships['puck']['data']['id']
-        return self.coordinator.data.structures[self.structure_id].pucks[puck_id]
+        return self.coordinator.topology.related('hvac-units', self.hvac_id, 'puck')
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -372,6 +381,9 @@ class HVACUnitControlButton(CoordinatorEntity, ButtonEntity):
     def available(self) -> bool:
         """Return true if associated puck is available."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.puck_data.attributes['inactive']:
             return True
         else:
@@ -384,5 +396,5 @@ class HVACUnitControlButton(CoordinatorEntity, ButtonEntity):
             "button-presses": [self.constraint]
         }
 
-        await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+        await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
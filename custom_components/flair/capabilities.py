@@ -0,0 +1,193 @@
+"""Compiled capabilities of Flair HVAC units."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+import json
+from typing import Any
+
+from homeassistant.components.climate import ClimateEntityFeature, HVACMode
+
+from .const import HVAC_CURRENT_MODE_MAP
+
+# Structure modes features are compiled for ahead of time.
+STRUCTURE_MODES = ("auto", "manual")
+# Number of compiled capabilities kept, by attributes and by serialized key.
+CAPABILITIES_CACHE_SIZE = 32
+
+# Compiled capabilities by the id of the attributes they were compiled from,
+# along with those attributes so the id can't be reused while cached.
+_capabilities_by_attributes: OrderedDict[int, tuple[dict[str, Any], HVACCapabilities]] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class HVACCapabilities:
+    """What an HVAC unit supports, compiled from its constraints and codesets.
+
+    Supported features are compiled for every combination of structure mode,
+    power state and HVAC unit mode. Combinations that aren't known ahead of
+    time are compiled on first use.
+    """
+
+    # Modes as used by the constraints, e.g. 'HEAT'.
+    modes: tuple[str, ...]
+    # Fan speeds available in each mode, e.g. 'FAN AUTO'.
+    fan_speeds: dict[str, tuple[str, ...]]
+    swing: bool
+    temperature_scale: str
+    _features: dict[tuple[str, bool, str], ClimateEntityFeature | None] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile supported features for the known structure modes and unit modes."""
+
+        for structure_mode in STRUCTURE_MODES:
+            for is_on in (True, False):
+                for mode in self.modes:
+                    self.supported_features(structure_mode, is_on, mode.title())
+
+    def supported_features(self, structure_mode: str, is_on: bool, mode: str) -> ClimateEntityFeature | None:
+        """Return the supported features for a structure mode, power state and unit mode.
+
+        mode is the unit's current mode attribute, e.g. 'Heat'.
+        """
+
+        key = (structure_mode, is_on, mode)
+        if key not in self._features:
+            self._features[key] = compile_supported_features(
+                swing_available=self.swing,
+                fan_speeds=self.fan_speeds[mode.upper()],
+                structure_mode=structure_mode,
+                is_on=is_on,
+                hvac_mode=hvac_mode(structure_mode, is_on, mode),
+            )
+        return self._features[key]
+
+
+def hvac_capabilities(attributes: dict[str, Any]) -> HVACCapabilities:
+    """Return the compiled capabilities of an HVAC unit.
+
+    Snapshots keep the attributes of unchanged units, so capabilities are
+    looked up by the identity of the attributes first. Units are only
+    serialized when their attributes were replaced, and units with
+    identical constraints, codesets and swing support share a compiled
+    table, so it is only rebuilt when any of them change.
+    """
+
+    cached = _capabilities_by_attributes.get(id(attributes))
+    if cached is not None and cached[0] is attributes:
+        _capabilities_by_attributes.move_to_end(id(attributes))
+        return cached[1]
+
+    # Keys aren't sorted as the order of modes and fan speeds is kept.
+    key = json.dumps([attributes['constraints'], attributes['codesets'], attributes['swing'] is not None])
+    capabilities = _compile_capabilities(key)
+    _capabilities_by_attributes[id(attributes)] = (attributes, capabilities)
+    if len(_capabilities_by_attributes) > CAPABILITIES_CACHE_SIZE:
+        _capabilities_by_attributes.popitem(last=False)
+    return capabilities
+
+
+@lru_cache(maxsize=CAPABILITIES_CACHE_SIZE)
+def _compile_capabilities(key: str) -> HVACCapabilities:
+    """Compile capabilities from serialized constraints, codesets and swing support."""
+
+    constraints, codesets, swing = json.loads(key)
+
+    fan_speeds: dict[str, tuple[str, ...]] = {}
+    for mode, mode_constraints in constraints['ON'].items():
+        if "ON" in mode_constraints:
+            fan_speeds[mode] = tuple(mode_constraints['ON'])
+        else:
+            fan_speeds[mode] = tuple(mode_constraints.get('OFF', ()))
+
+    if 'temperature-scale' in constraints:
+        temperature_scale = constraints['temperature-scale']
+    else:
+        temperature_scale = codesets[0]['temperature-scale']
+
+    return HVACCapabilities(
+        modes=tuple(constraints['ON']),
+        fan_speeds=fan_speeds,
+        swing=swing,
+        temperature_scale=temperature_scale,
+    )
+
+
+def hvac_mode(structure_mode: str, is_on: bool, mode: str) -> HVACMode | None:
+    """Return the HVAC mode of a unit."""
+
+    # Always revert to Off if a manual HVAC is powered off
+    if (not is_on) and (structure_mode == 'manual'):
+        return HVACMode.OFF
+
+    if mode in HVAC_CURRENT_MODE_MAP:
+        return HVAC_CURRENT_MODE_MAP[mode]
+    return None
+
+
+def compile_supported_features(
+        swing_available: bool,
+        fan_speeds: tuple[str, ...],
+        structure_mode: str,
+        is_on: bool,
+        hvac_mode: HVACMode | None,
+) -> ClimateEntityFeature | None:
+    """HVAC unit supported features."""
+
+    if swing_available and fan_speeds:
+        # Determine if Flair structure is set to auto mode.
+        if structure_mode == 'auto':
+            if is_on:
+                # Only allow setting swing and fan if HVAC is in dry or fan only mode.
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
+            else:
+                return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
+        if structure_mode == 'manual':
+            if is_on:
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+            else:
+                return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
+
+    # If only swing is available.
+    if swing_available:
+        if structure_mode == 'auto':
+            if is_on:
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.SWING_MODE
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE
+        if structure_mode == 'manual':
+            if is_on:
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+            else:
+                return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
+
+    # If only fan speeds are available.
+    if fan_speeds:
+        if structure_mode == 'auto':
+            if is_on:
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.FAN_MODE
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE
+        if structure_mode == 'manual':
+            if is_on:
+                if hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
+                    return ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+                else:
+                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+            else:
+                return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
+    return None
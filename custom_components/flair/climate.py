@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Any
 
 from flairaio.exceptions import FlairError
-from flairaio.model import HVACUnit, Puck, Room, Structure
+from flairaio.model import HVACUnit, Room, Structure
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -29,9 +29,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
+from .capabilities import HVACCapabilities, hvac_capabilities
 from .const import (
     DOMAIN,
     HVAC_AVAILABLE_FAN_SPEEDS,
@@ -44,6 +44,10 @@ from .const import (
     ROOM_HVAC_MAP,
 )
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
+from .records import HVACUnitRecord, PuckRecord, RoomRecord, StructureRecord
+from .util import generation_cached
 
 
 ROOM_HVAC_MAP_TO_FLAIR = {v: k for (k, v) in ROOM_HVAC_MAP.items()}
@@ -57,49 +61,55 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Climate Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[ClimateEntity]:
+    """Create the climate entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     climates = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
+    # Structures
+    climates.extend((
+        StructureClimate(coordinator, structure_id),
+    ))
+    # Room
+    if structure_data.rooms:
+        for room_id, room_data in structure_data.rooms.items():
             climates.extend((
-                StructureClimate(coordinator, structure_id),
+                RoomTemp(coordinator, structure_id, room_id),
             ))
-            # Room
-            if structure_data.rooms:
-                for room_id, room_data in structure_data.rooms.items():
+
+    # HVAC Units
+    if structure_data.hvac_units:
+        for hvac_id, hvac_data in structure_data.hvac_units.items():
+            # Only create climate entity for mini-split units
+            # Units that only use buttons return a list of constraints while more advanced return a dict
+            constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
+            if isinstance(constraints, dict):
+                codesets = structure_data.hvac_units[hvac_id].attributes['codesets'][0]
+                if 'temperature-scale' not in constraints and 'temperature-scale' not in codesets:
+                    unit_name = structure_data.hvac_units[hvac_id].attributes['name']
+                    LOGGER.error(f'''Flair HVAC Unit {unit_name} does not have a temperature scale.
+                                Contact Flair customer support to get this fixed.''')
+                else:
                     climates.extend((
-                        RoomTemp(coordinator, structure_id, room_id),
+                        HVAC(coordinator, structure_id, hvac_id),
                     ))
 
-            # HVAC Units
-            if structure_data.hvac_units:
-                for hvac_id, hvac_data in structure_data.hvac_units.items():
-                    # Only create climate entity for mini-split units
-                    # Units that only use buttons return a list of constraints while more advanced return a dict
-                    constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
-                    if isinstance(constraints, dict):
-                        codesets = structure_data.hvac_units[hvac_id].attributes['codesets'][0]
-                        if 'temperature-scale' not in constraints and 'temperature-scale' not in codesets:
-                            unit_name = structure_data.hvac_units[hvac_id].attributes['name']
-                            LOGGER.error(f'''Flair HVAC Unit {unit_name} does not have a temperature scale.
-                                        Contact Flair customer support to get this fixed.''')
-                        else:
-                            climates.extend((
-                                HVAC(coordinator, structure_id, hvac_id),
-                            ))
-
-    async_add_entities(climates)
-
-
-class StructureClimate(CoordinatorEntity, ClimateEntity):
+    return climates
+
+
+class StructureClimate(FlairEntity, ClimateEntity):
     """Representation of Structure Climate entity."""
 
     _enable_turn_on_off_backwards_compatibility = False
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -108,6 +118,12 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
 
         return self.coordinator.data.structures[self.structure_id]
 
+    @property
+    def structure_record(self) -> StructureRecord:
+        """Handle coordinator structure record."""
+
+        return self.coordinator.topology.record('structures', self.structure_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device registry information for this entity."""
@@ -156,7 +172,7 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
         Home Assistant is set to imperial or metric.
         """
 
-        value = self.structure_data.attributes['set-point-temperature-c']
+        value = self.structure_record.set_point_temperature_c
 
         if self.hass.config.units is METRIC_SYSTEM:
             return value
@@ -194,7 +210,7 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
     def hvac_mode(self) -> HVACMode | None:
         """Return the current hvac_mode."""
 
-        mode = self.structure_data.attributes['structure-heat-cool-mode']
+        mode = self.structure_record.heat_cool_mode
         hvac_mode = None
         if mode in ROOM_HVAC_MAP:
             hvac_mode = ROOM_HVAC_MAP[mode]
@@ -217,7 +233,7 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
     def entity_registry_enabled_default(self) -> bool:
         """Disable entity if system mode is set to manual on initial registration."""
 
-        system_mode = self.structure_data.attributes['mode']
+        system_mode = self.structure_record.mode
         if system_mode == 'manual':
             return False
         else:
@@ -227,7 +243,10 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
-        system_mode = self.structure_data.attributes['mode']
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        system_mode = self.structure_record.mode
         if system_mode == 'manual':
             return False
         else:
@@ -238,10 +257,9 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
         
         attributes = self.set_attributes('float', 'hvac_mode')
 
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = 'float'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()        
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'structure-heat-cool-mode': 'float'})
+        return await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)        
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
@@ -256,10 +274,9 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
                 temp = round(((kwargs.get(ATTR_TEMPERATURE) - 32) * (5/9)), 2)
 
             attributes = self.set_attributes(temp, 'temperature')
-            await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-            self.structure_data.attributes['set-point-temperature-c'] = temp
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+            self.coordinator.async_set_pending('structures', self.structure_data.id, {'set-point-temperature-c': temp})
+            await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         """Set new target hvac mode."""
@@ -267,10 +284,9 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
         flair_mode = ROOM_HVAC_MAP_TO_FLAIR.get(hvac_mode)
         attributes = self.set_attributes(flair_mode, 'hvac_mode')
 
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = flair_mode
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'structure-heat-cool-mode': flair_mode})
+        return await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(value: float | str, mode: str) -> dict[str, Any]:
@@ -290,13 +306,13 @@ class StructureClimate(CoordinatorEntity, ClimateEntity):
         return attributes
 
 
-class RoomTemp(CoordinatorEntity, ClimateEntity):
+class RoomTemp(FlairEntity, ClimateEntity):
     """Representation of Flair Room Climate entity."""
 
     _enable_turn_on_off_backwards_compatibility = False
 
     def __init__(self, coordinator, structure_id, room_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('rooms', room_id), ('structures', structure_id)))
         self.room_id = room_id
         self.structure_id = structure_id
 
@@ -304,7 +320,7 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
+        return self.coordinator.topology.resource('rooms', self.room_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -312,6 +328,18 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
 
         return self.coordinator.data.structures[self.structure_id]
 
+    @property
+    def room_record(self) -> RoomRecord:
+        """Handle coordinator room record."""
+
+        return self.coordinator.topology.record('rooms', self.room_id)
+
+    @property
+    def structure_record(self) -> StructureRecord:
+        """Handle coordinator structure record."""
+
+        return self.coordinator.topology.record('structures', self.structure_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device registry information for this entity."""
@@ -358,7 +386,7 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
     def hvac_mode(self) -> HVACMode | None:
         """Return the current hvac_mode."""
 
-        mode = self.structure_data.attributes['structure-heat-cool-mode']
+        mode = self.structure_record.heat_cool_mode
         hvac_mode = None
         if mode in ROOM_HVAC_MAP:
             hvac_mode = ROOM_HVAC_MAP[mode]
@@ -375,19 +403,19 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
     def current_temperature(self) -> float:
         """Return the current temperature."""
 
-        return self.room_data.attributes['current-temperature-c']
+        return self.room_record.temperature_c
 
     @property
     def target_temperature(self) -> float:
         """Return the temperature currently set to be reached."""
 
-        return self.room_data.attributes['set-point-c']
+        return self.room_record.set_point_c
 
     @property
     def current_humidity(self) -> int:
         """Return the current humidity."""
 
-        return self.room_data.attributes['current-humidity']
+        return self.room_record.humidity
 
     @property
     def supported_features(self) -> int:
@@ -399,7 +427,7 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
     def entity_registry_enabled_default(self) -> bool:
         """Disable entity if system mode is set to manual on initial registration."""
 
-        system_mode = self.structure_data.attributes['mode']
+        system_mode = self.structure_record.mode
         if system_mode == 'manual':
             return False
         else:
@@ -409,10 +437,13 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
     def available(self) -> bool:
         """Return true only if room has temp reading."""
 
-        system_mode = self.structure_data.attributes['mode']
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        system_mode = self.structure_record.mode
         if system_mode == 'manual':
             return False
-        elif self.room_data.attributes['current-temperature-c'] is not None:
+        elif self.room_record.temperature_c is not None:
             return True
         else:
             return False
@@ -422,10 +453,9 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
         
         attributes = self.set_attributes('float', 'hvac_mode')
 
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = 'float'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()  
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'structure-heat-cool-mode': 'float'})
+        return await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)  
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
@@ -434,10 +464,9 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
         attributes = self.set_attributes(temp, 'temperature')
 
         if temp is not None:
-            await self.coordinator.client.update('rooms', self.room_data.id, attributes=attributes, relationships={})
-            self.room_data.attributes['set-point-c'] = temp
-            self.async_write_ha_state()
-            return await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write('rooms', self.room_data.id, attributes=attributes)
+            self.coordinator.async_set_pending('rooms', self.room_data.id, {'set-point-c': temp})
+            return await self.coordinator.async_request_resource_refresh('rooms', self.room_data.id)
         else:
             LOGGER.error(f'Missing valid arguments for set_temperature in {kwargs}')
 
@@ -447,10 +476,9 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
         flair_mode = ROOM_HVAC_MAP_TO_FLAIR.get(hvac_mode)
         attributes = self.set_attributes(flair_mode, 'hvac_mode')
 
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = flair_mode
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'structure-heat-cool-mode': flair_mode})
+        return await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(value: float | str, mode: str) -> dict[str, Any]:
@@ -471,13 +499,18 @@ class RoomTemp(CoordinatorEntity, ClimateEntity):
         return attributes
 
 
-class HVAC(CoordinatorEntity, ClimateEntity):
+class HVAC(FlairEntity, ClimateEntity):
     """Representation of Flair HVAC unit climate entity."""
 
     _enable_turn_on_off_backwards_compatibility = False
 
     def __init__(self, coordinator, structure_id, hvac_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(
+            ('hvac-units', hvac_id),
+            ('structures', structure_id),
+            ('hvac-units', hvac_id, 'room'),
+            ('hvac-units', hvac_id, 'puck'),
+        ))
         self.hvac_id = hvac_id
         self.structure_id = structure_id
         self.missing_puck_warning = False
@@ -486,7 +519,7 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     def hvac_data(self) -> HVACUnit:
         """Handle coordinator HVAC unit data."""
 
-        return self.coordinator.data.structures[self.structure_id].hvac_units[self.hvac_id]
+        return self.coordinator.topology.resource('hvac-units', self.hvac_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -495,21 +528,34 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         return self.coordinator.data.structures[self.structure_id]
 
     @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
+    def room_data(self) -> Room:
+        """Handle coordinator room data."""
 
-        puck_data = self.hvac_data.relationships['puck']['data']
-        if puck_data is None:
-            return None
-        puck_id = puck_data['id']
-        return self.coordinator.data.structures[self.structure_id].pucks[puck_id]
+        return self.coordinator.topology.related('hvac-units', self.hvac_id, 'room')
 
     @property
-    def room_data(self) -> Room:
-        """Handle coordinator room data."""
+    def hvac_record(self) -> HVACUnitRecord:
+        """Handle coordinator HVAC unit record."""
+
+        return self.coordinator.topology.record('hvac-units', self.hvac_id)
+
+    @property
+    def structure_record(self) -> StructureRecord:
+        """Handle coordinator structure record."""
+
+        return self.coordinator.topology.record('structures', self.structure_id)
+
+    @property
+    def puck_record(self) -> PuckRecord | None:
+        """Handle coordinator record of the associated puck."""
+
+        return self.coordinator.topology.related_record('hvac-units', self.hvac_id, 'puck')
+
+    @property
+    def room_record(self) -> RoomRecord | None:
+        """Handle coordinator record of the room the HVAC unit is in."""
 
-        room_id = self.hvac_data.relationships['room']['data']['id']
-        return self.coordinator.data.structures[self.structure_id].rooms[room_id]
+        return self.coordinator.topology.related_record('hvac-units', self.hvac_id, 'room')
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -547,90 +593,66 @@ class HVAC(CoordinatorEntity, ClimateEntity):
 
         return 'mdi:hvac'
 
-    @property
+    @generation_cached
+    def capabilities(self) -> HVACCapabilities:
+        """Return the compiled capabilities of the HVAC unit."""
+
+        return hvac_capabilities(self.hvac_data.attributes)
+
+    @generation_cached
     def temperature_unit(self) -> UnitOfTemperature:
         """Return temp scale unit of measurement."""
 
-        if 'temperature-scale' in self.hvac_data.attributes['constraints']:
-            scale = self.hvac_data.attributes['constraints']['temperature-scale']
-        else:
-            scale = self.hvac_data.attributes['codesets'][0]['temperature-scale']
-
-        if scale == 'F':
+        if self.capabilities.temperature_scale == 'F':
             return UnitOfTemperature.FAHRENHEIT
         else:
             return UnitOfTemperature.CELSIUS
 
-    @property
+    @generation_cached
     def is_on(self) -> bool:
         """Return true if HVAC unit is on."""
 
-        if self.hvac_data.attributes['power'] == 'On':
+        if self.hvac_record.power == 'On':
             return True
         else:
             return False
 
-    @property
+    @generation_cached
     def available_hvac_modes(self) -> list[str]:
         """Return what modes are available for HVAC unit."""
 
-        hvac_modes = []
-        for key in self.hvac_data.attributes['constraints']['ON'].keys():
-            hvac_modes.append(key)
-        return hvac_modes
+        return list(self.capabilities.modes)
 
-    @property
+    @generation_cached
     def available_fan_speeds(self) -> list[str]:
         """Returns available fan speeds based on current hvac mode."""
 
-        mode = self.hvac_data.attributes['mode'].upper()
-        fan_speeds = []
+        mode = self.hvac_record.mode.upper()
+        return list(self.capabilities.fan_speeds[mode])
 
-        if "ON" in self.hvac_data.attributes['constraints']['ON'][mode].keys():
-            for key in self.hvac_data.attributes['constraints']['ON'][mode]['ON'].keys():
-                fan_speeds.append(key)
-            return fan_speeds
-        else:
-            for key in self.hvac_data.attributes['constraints']['ON'][mode]['OFF'].keys():
-                fan_speeds.append(key)
-            return fan_speeds
-
-    @property
+    @generation_cached
     def fan_only_fan_speeds(self) -> list[str]:
         """Returns available fan speeds when in fan only hvac mode."""
 
-        mode = "FAN"
-        fan_speeds = []
-
-        if "ON" in self.hvac_data.attributes['constraints']['ON'][mode].keys():
-            for key in self.hvac_data.attributes['constraints']['ON'][mode]['ON'].keys():
-                fan_speeds.append(key)
-            return fan_speeds
-        else:
-            for key in self.hvac_data.attributes['constraints']['ON'][mode]['OFF'].keys():
-                fan_speeds.append(key)
-            return fan_speeds
+        return list(self.capabilities.fan_speeds["FAN"])
 
-    @property
+    @generation_cached
     def swing_available(self) -> bool:
         """Determine if swing mode is available."""
 
-        if self.hvac_data.attributes['swing'] is not None:
-            return True
-        else:
-            return False
+        return self.capabilities.swing
 
-    @property
+    @generation_cached
     def structure_mode(self) -> str:
         """Return structure mode of associated structure."""
 
-        return self.structure_data.attributes['mode']
+        return self.structure_record.mode
 
-    @property
+    @generation_cached
     def hvac_mode(self) -> HVACMode:
         """Return the current hvac_mode."""
 
-        mode = self.hvac_data.attributes['mode']
+        mode = self.hvac_record.mode
 
         # Always revert to Off if a manual HVAC is powered off
         if (not self.is_on) and (self.structure_mode == 'manual'):
@@ -639,11 +661,11 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         if mode in HVAC_CURRENT_MODE_MAP:
             return HVAC_CURRENT_MODE_MAP[mode]
 
-    @property
+    @generation_cached
     def hvac_modes(self) -> list[str]:
         """Return the Supported Modes."""
 
-        current_mode = self.hvac_data.attributes['mode']
+        current_mode = self.hvac_record.mode
 
         # Can't change modes when structure mode is
         # auto regardless of power state. So, we
@@ -680,7 +702,7 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     def fan_mode(self) -> str | None:
         """Return current fan speed."""
 
-        fan_speed = self.hvac_data.attributes['fan-speed']
+        fan_speed = self.hvac_record.fan_speed
 
         if fan_speed is not None:
             if fan_speed in HVAC_CURRENT_FAN_SPEED:
@@ -689,7 +711,7 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         else:
             return None
 
-    @property
+    @generation_cached
     def fan_modes(self) -> list[str]:
         """Return supported fan speeds."""
 
@@ -705,14 +727,10 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     def swing_mode(self) -> str | None:
         """Return current swing mode."""
 
-        if 'swing' in self.hvac_data.attributes:
-            swing_mode = self.hvac_data.attributes['swing']
-            if swing_mode is not None:
-                if swing_mode in HVAC_SWING_STATE:
-                    hvac_swing_state = HVAC_SWING_STATE[swing_mode]
-                    return hvac_swing_state
-        else:
-            return None
+        swing_mode = self.hvac_record.swing
+        if swing_mode in HVAC_SWING_STATE:
+            return HVAC_SWING_STATE[swing_mode]
+        return None
 
     @property
     def swing_modes(self) -> list[str]:
@@ -725,7 +743,7 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     def current_temperature(self) -> float:
         """Return the current temperature of the room HVAC unit is in."""
 
-        temp = self.room_data.attributes['current-temperature-c']
+        temp = self.room_record.temperature_c
 
         if self.temperature_unit is UnitOfTemperature.CELSIUS:
             return temp
@@ -736,77 +754,30 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     def target_temperature(self) -> float:
         """Return the temperature currently set to be reached by the HVAC unit."""
 
-        return float(self.hvac_data.attributes['temperature'])
+        return float(self.hvac_record.temperature)
 
     @property
     def current_humidity(self) -> int:
         """Return the current humidity of room where HVAC unit is located."""
 
-        return self.room_data.attributes['current-humidity']
+        return self.room_record.humidity
 
-    @property
+    @generation_cached
     def supported_features(self) -> int:
         """HVAC unit supported features."""
 
-        if self.swing_available and self.available_fan_speeds:
-            # Determine if Flair structure is set to auto mode.
-            if self.structure_mode == 'auto':
-                if self.is_on:
-                    # Only allow setting swing and fan if HVAC is in dry or fan only mode.
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
-                else:
-                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE
-            if self.structure_mode == 'manual':
-                if self.is_on:
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                else:
-                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
-
-        # If only swing is available.
-        if self.swing_available:
-            if self.structure_mode == 'auto':
-                if self.is_on:
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.SWING_MODE
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE
-            if self.structure_mode == 'manual':
-                if self.is_on:
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                else:
-                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
-
-        # If only fan speeds are available.
-        if self.available_fan_speeds:
-            if self.structure_mode == 'auto':
-                if self.is_on:
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.FAN_MODE
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE
-            if self.structure_mode == 'manual':
-                if self.is_on:
-                    if self.hvac_mode in (HVACMode.DRY, HVACMode.FAN_ONLY):
-                        return ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                    else:
-                        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-                else:
-                    return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_ON
+        return self.capabilities.supported_features(
+            self.structure_mode, self.is_on, self.hvac_record.mode
+        )
 
     @property
     def available(self) -> bool:
         """Return true if associated puck is available."""
         
-        if self.puck_data is None:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if self.puck_record is None:
             if not self.missing_puck_warning:
                 LOGGER.warning(
                     f'No puck is associated with Flair HVAC unit {self.hvac_data.attributes["name"]}. '
@@ -819,7 +790,7 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         # Reset missing puck warning back to false in case warning has been
         # sent before and puck has been associated since
         self.missing_puck_warning = False
-        if not self.puck_data.attributes['inactive']:
+        if not self.puck_record.inactive:
             return True
         else:
             return False
@@ -828,20 +799,18 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         """Turn IR HVAC unit off."""
         
         power_attributes = {"power": "Off"}
-        await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-        self.hvac_data.attributes['power'] = 'Off'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=power_attributes)
+        self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'power': 'Off'})
+        return await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
     async def async_turn_on(self) -> None:
         """Turn IR HVAC unit on."""
 
         mode = self.hvac_data.attributes['mode']
         power_attributes = {"power": "On"}
-        await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-        self.hvac_data.attributes['power'] = 'On'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=power_attributes)
+        self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'power': 'On'})
+        return await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
@@ -868,16 +837,14 @@ class HVAC(CoordinatorEntity, ClimateEntity):
                 # property, eliminates us from having to do this conversion when setting the HVAC 'temperature' attribute.
                 converted = ((temp - 32) * (5/9))
                 attributes = self.set_attributes('temp', converted, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write(type, type_id, attributes=attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'temperature': temp})
+                await self.coordinator.async_request_resource_refresh(type, type_id)
             else:
                 attributes = self.set_attributes('temp', temp, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write(type, type_id, attributes=attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'temperature': temp})
+                await self.coordinator.async_request_resource_refresh(type, type_id)
 
         if self.structure_mode == 'manual':
             if not self.is_on:
@@ -887,10 +854,9 @@ class HVAC(CoordinatorEntity, ClimateEntity):
                 type_id = self.hvac_data.id
                 type = 'hvac-units'
                 attributes = self.set_attributes('temp', temp, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write(type, type_id, attributes=attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'temperature': temp})
+                await self.coordinator.async_request_resource_refresh(type, type_id)
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         """Set new target hvac mode."""
@@ -898,14 +864,14 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         # Power off manual HVAC unit
         if hvac_mode == HVACMode.OFF:
             power_attributes = {"power": "Off"}
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-            self.hvac_data.attributes['power'] = 'Off'
+            await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=power_attributes)
+            self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'power': 'Off'})
         elif self.structure_mode == 'manual':
             # Turn the HVAC unit on before sending desired mode
             if not self.is_on:
                 power_attributes = {"power": "On"}
-                await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-                self.hvac_data.attributes['power'] = 'On'
+                await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=power_attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'power': 'On'})
 
             mode = HASS_HVAC_MODE_TO_FLAIR.get(hvac_mode)
 
@@ -913,19 +879,17 @@ class HVAC(CoordinatorEntity, ClimateEntity):
                 # When switching to Dry or Heat_Cool (Auto) mode,
                 # a fan speed of Auto is expected
 
-                mode_attributes = self.set_attributes('hvac_mode', mode, False)
                 flair_speed = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(FAN_AUTO)
                 if self.hvac_data.attributes['fan-speed'] != flair_speed:
-                    fan_attributes = self.set_attributes('fan_mode', flair_speed, False)
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=mode_attributes, relationships={})
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=fan_attributes, relationships={})
-                    self.hvac_data.attributes['fan-speed'] = flair_speed
+                    attributes = self.set_attributes('hvac_mode-fan_speed', mode, False, flair_speed)
+                    await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+                    self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'fan-speed': flair_speed})
                 else:
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=mode_attributes, relationships={})
+                    mode_attributes = self.set_attributes('hvac_mode', mode, False)
+                    await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=mode_attributes)
 
-                self.hvac_data.attributes['mode'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'mode': mode})
+                await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
                 return None
 
             if hvac_mode == HVACMode.FAN_ONLY:
@@ -933,29 +897,26 @@ class HVAC(CoordinatorEntity, ClimateEntity):
                 # We have to set a non-Auto fan speed if current mode is using
                 # Auto fan speed.
 
-                mode_attributes = self.set_attributes('hvac_mode', mode, False)
                 if self.hvac_data.attributes['fan-speed'] == "Auto": 
                     valid_fan_speed = HVAC_AVAILABLE_FAN_SPEEDS[self.fan_only_fan_speeds[0]]
                     flair_speed = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(valid_fan_speed)
-                    fan_attributes = self.set_attributes('fan_mode', flair_speed, False)
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=mode_attributes, relationships={})
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=fan_attributes, relationships={})
-                    self.hvac_data.attributes['fan-speed'] = flair_speed
+                    attributes = self.set_attributes('hvac_mode-fan_speed', mode, False, flair_speed)
+                    await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+                    self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'fan-speed': flair_speed})
                 else:
-                    await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=mode_attributes, relationships={})
-                self.hvac_data.attributes['mode'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                    mode_attributes = self.set_attributes('hvac_mode', mode, False)
+                    await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=mode_attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'mode': mode})
+                await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
                 return None
 
             # Handle all other HVAC modes
             attributes = self.set_attributes('hvac_mode', mode, False)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-            self.hvac_data.attributes['mode'] = mode
+            await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+            self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'mode': mode})
         else:
             return None
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
     async def async_set_fan_mode(self, fan_mode) -> None:
         """Set new target fan mode."""
@@ -963,27 +924,24 @@ class HVAC(CoordinatorEntity, ClimateEntity):
         if self.structure_mode == "auto":
             mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(fan_mode).upper()
             attributes = self.set_attributes('fan_mode', mode, True)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
+            await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
             # Key for default-fan-speed uses all capital letters while fan-speed only capitalizes first letter.
-            self.hvac_data.attributes['fan-speed'] = mode.title()
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'fan-speed': mode.title()})
+            await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
         if self.structure_mode == 'manual':
             if self.hvac_mode == HVACMode.DRY:
                 mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(FAN_AUTO)
                 attributes = self.set_attributes('fan_mode', mode, False)
-                await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['fan-speed'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'fan-speed': mode})
+                await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
             else:
                 mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(fan_mode)
                 attributes = self.set_attributes('fan_mode', mode, False)
-                await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['fan-speed'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+                self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'fan-speed': mode})
+                await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
     async def async_set_swing_mode(self, swing_mode) -> None:
         """Set new target swing operation."""
@@ -992,19 +950,17 @@ class HVAC(CoordinatorEntity, ClimateEntity):
             # Auto mode takes True or False for swing mode.
             mode = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode) == 'On'
             attributes = self.set_attributes('swing_mode', mode, True)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
+            await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
             # 'swing-auto' key uses boolean while 'swing' uses On and Off.
-            self.hvac_data.attributes['swing'] = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode)
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'swing': HASS_HVAC_SWING_TO_FLAIR.get(swing_mode)})
+            await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
         if self.structure_mode == 'manual':
             mode = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode)
             attributes = self.set_attributes('swing_mode', mode, False)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-            self.hvac_data.attributes['swing'] = mode
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write('hvac-units', self.hvac_data.id, attributes=attributes)
+            self.coordinator.async_set_pending('hvac-units', self.hvac_data.id, {'swing': mode})
+            await self.coordinator.async_request_resource_refresh('hvac-units', self.hvac_data.id)
 
     @staticmethod
     def set_attributes(setting: str, value: Any, auto_mode: bool, extra_val: str = None) -> dict[str, Any]:
@@ -9,10 +9,21 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .const import DEFAULT_NAME, DOMAIN
+from .const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_NUMBER_WRITE_DELAY,
+    CONF_STRUCTURE_COORDINATORS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_NUMBER_WRITE_DELAY,
+    DEFAULT_NAME,
+    DOMAIN,
+)
 from .util import NoStructuresError, NoUserError, async_validate_api
 
 
@@ -31,6 +42,15 @@ class FlairConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     entry: config_entries.ConfigEntry | None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+            config_entry: config_entries.ConfigEntry,
+    ) -> FlairOptionsFlow:
+        """Get the options flow for this handler."""
+
+        return FlairOptionsFlow(config_entry)
+
     async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
         """Handle re-authentication with Flair."""
 
@@ -117,3 +137,53 @@ class FlairConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=DATA_SCHEMA,
             errors=errors,
         )
+
+
+class FlairOptionsFlow(config_entries.OptionsFlow):
+    """Handle Flair options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize Flair options flow."""
+
+        self.config_entry = config_entry
+
+    async def async_step_init(
+            self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage Flair options."""
+
+        errors: dict[str, str] = {}
+
+        if user_input:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_scan_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        options_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_STRUCTURE_COORDINATORS,
+                    default=options.get(CONF_STRUCTURE_COORDINATORS, False),
+                ): bool,
+                vol.Required(
+                    CONF_NUMBER_WRITE_DELAY,
+                    default=options.get(CONF_NUMBER_WRITE_DELAY, DEFAULT_NUMBER_WRITE_DELAY),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=options_schema,
+            errors=errors,
+        )
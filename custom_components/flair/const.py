@@ -22,6 +22,12 @@ LOGGER = logging.getLogger(__package__)
 
 
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_MIN_SCAN_INTERVAL = 15
+DEFAULT_MAX_SCAN_INTERVAL = 300
+# Seconds a number entity waits for further changes before writing its last value.
+DEFAULT_NUMBER_WRITE_DELAY = 1.0
+# Factor the poll interval grows by after each poll without any activity.
+SCAN_INTERVAL_BACKOFF = 1.5
 DOMAIN = "flair"
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -34,9 +40,94 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_NUMBER_WRITE_DELAY = "number_write_delay"
+CONF_STRUCTURE_COORDINATORS = "structure_coordinators"
+
 DEFAULT_NAME = "Flair"
 TIMEOUT = 20
 
+# Request budget shared by every call made to the Flair API. The bucket holds up to
+# RATE_LIMIT_CAPACITY tokens and refills at RATE_LIMIT_REFILL tokens per second.
+# Background requests (polling) leave RATE_LIMIT_RESERVE tokens for user initiated
+# writes so a burst of polling can't starve them.
+RATE_LIMIT_CAPACITY = 60
+RATE_LIMIT_REFILL = 1.0
+RATE_LIMIT_RESERVE = 10
+# Backoff applied after Flair responds with 429 Too Many Requests.
+RATE_LIMIT_BACKOFF_BASE = 2
+RATE_LIMIT_BACKOFF_MAX = 120
+RATE_LIMIT_RETRIES = 3
+
+LANE_BACKGROUND = "background"
+LANE_CONFIRMATION = "confirmation"
+LANE_INTERACTIVE = "interactive"
+# Lanes from highest to lowest priority. Requests wait while a higher lane
+# has requests waiting or in flight.
+LANES = (LANE_INTERACTIVE, LANE_CONFIRMATION, LANE_BACKGROUND)
+
+# Writes are confirmed by fetching only the resources that were written. Requests
+# made within the cooldown are batched. Batches larger than the maximum fall back
+# to a full refresh as it takes fewer requests.
+RESOURCE_REFRESH_COOLDOWN = 2
+RESOURCE_REFRESH_MAX = 10
+
+# Number of seconds written values are shown while waiting for Flair to report them.
+PENDING_WRITE_TTL = 90
+
+# Number of seconds writes are held so that writes to the same resource made
+# around the same time are sent to Flair as a single PATCH.
+WRITE_COALESCE_DELAY = 0.05
+
+# Attributes that trigger an action rather than hold a value. Writes carrying
+# them are always sent, even if they match what Flair last reported, and are
+# never retried as Flair may have acted on them before the request failed.
+ALWAYS_WRITTEN_ATTRIBUTES = ("button-presses",)
+
+# Writes that fail because Flair can't be reached are queued and retried with
+# an exponential backoff, in seconds, until they are older than the TTL.
+WRITE_RETRY_BACKOFF_BASE = 5
+WRITE_RETRY_BACKOFF_MAX = 300
+WRITE_QUEUE_TTL = 900
+
+# Services and the number of bulk update targets written to Flair at the same time.
+SERVICE_BULK_UPDATE = "bulk_update"
+BULK_UPDATE_CONCURRENCY = 5
+# Resource types the bulk update service writes to.
+BULK_UPDATE_TYPES = ("vents", "rooms", "pucks", "hvac-units")
+
+SERVICE_SAVE_PROFILE = "save_profile"
+SERVICE_APPLY_PROFILE = "apply_profile"
+# Attributes captured by a structure profile, by resource type.
+PROFILE_ATTRIBUTES = {
+    "structures": (
+        "mode",
+        "structure-away-mode",
+        "home-away-mode",
+        "set-point-mode",
+        "default-hold-duration",
+        "active-schedule-id",
+        "temp-away-min-c",
+        "temp-away-max-c",
+    ),
+    "rooms": ("active", "set-point-c"),
+    "vents": ("percent-open",),
+}
+
+# The last good snapshot is saved to storage so setup doesn't have to wait on
+# the cloud. Saves are delayed and coalesced as the snapshot changes every poll.
+STORAGE_SAVE_DELAY = 60
+STORAGE_VERSION = 1
+
+# Puck and vent readings are appended to a fixed size history file per structure
+# whenever they change. Once full, the oldest readings are overwritten.
+HISTORY_CAPACITY = 50000
+
+# Debug snapshots are only built when the flair logger is enabled for DEBUG.
+# Anything longer than the limit below is truncated before being logged.
+DEBUG_SNAPSHOT_MAX_LENGTH = 20000
+
 FLAIR_ERRORS = (
     asyncio.TimeoutError,
     ClientConnectionError,
@@ -46,6 +137,15 @@ FLAIR_ERRORS = (
 
 # Dictionaries and lists.
 
+# Attributes whose changes indicate that the HVAC system is actively being
+# controlled. Polling speeds up to the minimum interval when any of them change.
+ACTIVITY_ATTRIBUTES = {
+    "structures": ["mode", "structure-heat-cool-mode", "set-point-temperature-c", "home"],
+    "rooms": ["set-point-c", "active"],
+    "vents": ["percent-open"],
+    "hvac-units": ["power", "mode", "temperature", "fan-speed"],
+}
+
 AWAY_MODES = [
     "Smart Away",
     "Off Only",
@@ -147,6 +247,48 @@ TEMPERATURE_SCALES = {
     "K": "Kelvin",
 }
 
+# Minimum number of seconds between fetches of each resource type. Types holding
+# live readings or settings users change often (0) are fetched on every poll.
+RESOURCE_REFRESH_INTERVALS = {
+    "structures": 0,
+    "rooms": 0,
+    "pucks": 0,
+    "vents": 0,
+    "hvac-units": 0,
+    "bridges": 300,
+    "thermostats": 900,
+    "zones": 900,
+    "schedules": 900,
+    "users": 3600,
+}
+
+# Resource types that report a separate current reading for active devices.
+RESOURCES_WITH_READINGS = [
+    "pucks",
+    "vents",
+    "bridges",
+]
+
+# Structure attributes holding related resources, mapped to their resource type.
+STRUCTURE_RESOURCES = {
+    "rooms": "rooms",
+    "pucks": "pucks",
+    "vents": "vents",
+    "bridges": "bridges",
+    "thermostats": "thermostats",
+    "hvac_units": "hvac-units",
+    "zones": "zones",
+    "schedules": "schedules",
+}
+
+# Resource types that structure level entities render (e.g. schedule names).
+# A change to any of them is treated as a change to the structure itself.
+STRUCTURE_METADATA = [
+    "schedules",
+    "thermostats",
+    "zones",
+]
+
 TYPE_TO_MODEL = {
     "users": "User",
     "structures": "Structure",
@@ -1,22 +1,85 @@
 """DataUpdateCoordinator for the Flair integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from dataclasses import replace
 from datetime import timedelta
 import json
+import logging
+from math import nan
+from time import monotonic, time
+from typing import Any
 
-from flairaio import FlairClient
 from flairaio.exceptions import FlairAuthError, FlairError
-from flairaio.model import FlairData
+from flairaio.model import Bridge, FlairData, Puck, Structure, User, Vent
 
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, TIMEOUT
+from .api import FlairApiClient, is_transient, request_lane
+from .history import HISTORY_METRICS, ReadingHistory, history_path
+from .readings import READING_METRICS, ReadingColumns
+from .storage import SnapshotStore, WriteJournal
+from .topology import Topology
+from .const import (
+    ACTIVITY_ATTRIBUTES,
+    ALWAYS_WRITTEN_ATTRIBUTES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_NUMBER_WRITE_DELAY,
+    DEBUG_SNAPSHOT_MAX_LENGTH,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_NUMBER_WRITE_DELAY,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    FLAIR_ERRORS,
+    HISTORY_CAPACITY,
+    LANE_CONFIRMATION,
+    LOGGER,
+    PENDING_WRITE_TTL,
+    RESOURCE_REFRESH_COOLDOWN,
+    RESOURCE_REFRESH_INTERVALS,
+    RESOURCE_REFRESH_MAX,
+    RESOURCES_WITH_READINGS,
+    SCAN_INTERVAL_BACKOFF,
+    STRUCTURE_METADATA,
+    STRUCTURE_RESOURCES,
+    WRITE_COALESCE_DELAY,
+    WRITE_QUEUE_TTL,
+    WRITE_RETRY_BACKOFF_BASE,
+    WRITE_RETRY_BACKOFF_MAX,
+)
+from .util import (
+    RESOURCE_MODELS,
+    ResourceKey,
+    resource_changed,
+    serialize_snapshot,
+    snapshot_diff,
+    truncate,
+)
+
+
+# Structure attribute holding each type of related resource.
+RESOURCE_ATTRIBUTES = {
+    resource_type: attribute for attribute, resource_type in STRUCTURE_RESOURCES.items()
+}
+
+# Client methods that fetch a single resource of the types entities write to.
+RESOURCE_GETTERS = {
+    "structures": "get_structure",
+    "rooms": "get_room",
+    "pucks": "get_puck",
+    "vents": "get_vent",
+    "bridges": "get_bridge",
+    "hvac-units": "get_hvac_unit",
+}
 
 
 class FlairDataUpdateCoordinator(DataUpdateCoordinator):
@@ -24,33 +87,944 @@ class FlairDataUpdateCoordinator(DataUpdateCoordinator):
 
     data: FlairData
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the Flair coordinator."""
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            client: FlairApiClient,
+            store: SnapshotStore,
+            journal: WriteJournal,
+            structure_id: str | None = None,
+            fetch_users: bool = True,
+    ) -> None:
+        """Initialize the Flair coordinator.
 
-        self.client = FlairClient(
-            entry.data[CONF_CLIENT_ID],
-            entry.data[CONF_CLIENT_SECRET],
-            session=async_get_clientsession(hass),
-            timeout=TIMEOUT,
-        )
+        If structure_id is given, the coordinator only fetches that structure.
+        Users belong to the account, so only one of the structure coordinators
+        of an entry fetches them.
+        """
+
+        self.client = client
+        self.structure_id = structure_id
+        self.fetch_users = fetch_users
+        self._store = store
+        # Writes queued for retry, shared with the other coordinators of the entry.
+        self.journal = journal
+        # Timer of the next retry of queued writes, or the task retrying them.
+        self._retry: asyncio.Handle | asyncio.Task | None = None
+        # Number of retries in a row that failed, which sets the backoff.
+        self._retry_attempts = 0
+        self.write_retries = 0
+        # Last snapshot that was logged. Only populated while debug logging is enabled.
+        self._debug_snapshot: dict[str, Any] | None = None
+        # Index of the current snapshot, rebuilt whenever a snapshot is published.
+        self.topology = Topology()
+        # Set while the current snapshot is the one restored from storage.
+        self.restored = False
+        # Incremented whenever a snapshot is published. Values derived from a
+        # snapshot can be cached for as long as the generation stays the same.
+        self.generation = 0
+        # Latest puck and vent readings of the current snapshot, by device type.
+        self.readings = {device_type: ReadingColumns(device_type) for device_type in READING_METRICS}
+        # Reading history of each structure, opened when readings are first appended.
+        self.histories: dict[str, ReadingHistory] = {}
+        # History appends running in the executor, waited for before the histories are closed.
+        self._history_jobs: set[asyncio.Future[None]] = set()
+        self._entry_id = entry.entry_id
+        # Resources that changed during the last refresh. None means all listeners
+        # should be updated (first refresh, recovery from a failed refresh, etc.).
+        self._changed_resources: set[ResourceKey] | None = None
+        # Related resource payloads last fetched for each structure and the models
+        # built from them, keyed by structure id and attribute. The client returns
+        # the same payload object when Flair responds with 304 Not Modified.
+        self._payloads: dict[tuple[str, str], tuple[Any, dict[str, Any]]] = {}
+        # Monotonic time each resource type was last fetched successfully.
+        self._last_fetched: dict[str, float] = {}
+        # Bounds for the adaptive poll interval.
+        self.min_interval: float = entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        self.max_interval: float = entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        # Set when a write was made or a refresh showed the HVAC system being controlled.
+        self._activity = False
+        # Values written to each resource that Flair hasn't reported yet, keyed by
+        # resource and attribute, with the monotonic time they expire at and the
+        # value Flair last reported.
+        self._pending: dict[ResourceKey, dict[str, tuple[Any, float, Any]]] = {}
+        # Resources waiting to be refreshed after a write.
+        self._pending_refresh: set[ResourceKey] = set()
+        # Writes waiting to be sent to each resource: the merged attributes and
+        # relationships, and a future for every caller waiting on the result.
+        self._writes: dict[ResourceKey, tuple[dict[str, Any], dict[str, Any], list[asyncio.Future]]] = {}
+        # Number of PATCHes being sent to each resource.
+        self._sending: dict[ResourceKey, int] = {}
+        # Resources written to since they were last refreshed.
+        self.unconfirmed_writes: set[ResourceKey] = set()
+        # Number of writes skipped as they wouldn't have changed anything.
+        self.suppressed_writes = 0
+        # Quiet period before a scheduled write is sent.
+        self.write_delay: float = entry.options.get(CONF_NUMBER_WRITE_DELAY, DEFAULT_NUMBER_WRITE_DELAY)
+        # Scheduled writes by resource and written attribute names. Holds the timer
+        # while waiting for the quiet period to pass and the task once it's sent.
+        self._scheduled_writes: dict[tuple[str, str, tuple[str, ...]], asyncio.TimerHandle | asyncio.Task] = {}
         super().__init__(
             hass,
             LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            name=DOMAIN if structure_id is None else f'{DOMAIN}_{structure_id}',
+            update_interval=timedelta(
+                seconds=min(max(DEFAULT_SCAN_INTERVAL, self.min_interval), self.max_interval)
+            ),
+        )
+        self._resource_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=RESOURCE_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_resources,
         )
 
     async def _async_update_data(self) -> FlairData:
         """Fetch data from Flair."""
 
+        self._changed_resources = None
         try:
-            data = await self.client.get_flair_data()
-            nl = '\n'
-            LOGGER.debug(f'Found the following Flair structures/devices: {nl}{json.dumps(data, default=vars, indent=4)}')
+            data = await self._async_fetch_data()
         except FlairAuthError as error:
             raise ConfigEntryAuthFailed(error) from error
         except FlairError as error:
             raise UpdateFailed(error) from error
         if not data.structures:
             raise UpdateFailed("No Structures found")
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            message = await self.hass.async_add_executor_job(self._build_debug_snapshot, data)
+            LOGGER.debug(message)
+        else:
+            # Don't diff against a stale snapshot if debug logging is turned back on later.
+            self._debug_snapshot = None
+
+        data = self._share_unchanged(self._apply_pending(data))
+        self._changed_resources = self._detect_changes(data)
+        if self._changed_resources is None or self._changed_resources:
+            self._store.async_save(data, self.structure_id)
+            self._async_record_history(self._changed_resources)
+        self.restored = False
+        self._adapt_update_interval()
+        self._async_replay_writes()
+        return data
+
+    @callback
+    def async_restore(self, restored: FlairData) -> bool:
+        """Use a snapshot restored from storage until the first refresh completes.
+
+        Entities created from the restored snapshot show its values, marked
+        as stale, until live data arrives. Returns False if the snapshot doesn't cover this coordinator.
+        """
+
+        if self.structure_id is not None:
+            if self.structure_id not in restored.structures:
+                return False
+            restored = FlairData(
+                users=restored.users,
+                structures={self.structure_id: restored.structures[self.structure_id]},
+            )
+
+        self.data = restored
+        self._index(restored)
+        self.restored = True
+        return True
+
+    async def async_request_refresh(self) -> None:
+        """Request a full refresh, treating the request as activity.
+
+        Keep polling at the minimum interval until things settle down.
+        """
+
+        self._activity = True
+        await super().async_request_refresh()
+
+    async def async_write(
+            self,
+            resource_type: str,
+            resource_id: str,
+            attributes: dict[str, Any],
+            relationships: dict[str, Any] | None = None,
+            skip_unchanged: bool = True,
+    ) -> dict[str, Any] | None:
+        """Write attributes and relationships to a resource.
+
+        Writes to the same resource made within WRITE_COALESCE_DELAY of each
+        other are merged into a single PATCH, with later values replacing
+        earlier ones. Returns Flair's response, or raises the error of the
+        PATCH that carried the write.
+
+        Unless skip_unchanged is False, attribute writes that match the
+        current snapshot, including values that are still pending, aren't
+        sent and None is returned.
+
+        Writes that fail because Flair can't be reached are queued in the
+        journal and retried, and None is returned. While Flair is known to be
+        unreachable or hasn't been reached since the snapshot was restored,
+        or the resource already has queued writes, writes are queued right
+        away.
+        """
+
+        key = (resource_type, resource_id)
+        if skip_unchanged and not relationships and self._is_unchanged(key, attributes):
+            self.suppressed_writes += 1
+            LOGGER.debug(f'Skipped writing {attributes} to Flair {resource_type} {resource_id} as nothing would change')
+            return None
+
+        if (key in self.journal or self.restored or not self.last_update_success) and self._async_queue_write(
+            key, attributes, relationships or {}
+        ):
+            LOGGER.debug(f'Queued writing {attributes} to Flair {resource_type} {resource_id} until Flair can be reached')
+            return None
+
+        self.unconfirmed_writes.add(key)
+        if (write := self._writes.get(key)) is None:
+            write = self._writes[key] = ({}, {}, [])
+            self.hass.loop.call_later(WRITE_COALESCE_DELAY, self._async_flush_write, key)
+        write[0].update(attributes)
+        write[1].update(relationships or {})
+        future: asyncio.Future[dict[str, Any]] = self.hass.loop.create_future()
+        write[2].append(future)
+        return await future
+
+    def _is_unchanged(self, key: ResourceKey, attributes: dict[str, Any]) -> bool:
+        """Determine if writing attributes to a resource wouldn't change anything.
+
+        Resources with writes buffered, being sent or queued are never
+        considered unchanged, as the snapshot doesn't show those writes yet.
+        """
+
+        if key in self._writes or key in self._sending or key in self.journal:
+            return False
+        if not attributes.keys().isdisjoint(ALWAYS_WRITTEN_ATTRIBUTES):
+            return False
+        if (resource := self.topology.resources.get(key)) is None:
+            return False
+        current = resource.attributes
+        return all(
+            attribute in current and current[attribute] == value
+            for attribute, value in attributes.items()
+        )
+
+    @callback
+    def _async_flush_write(self, key: ResourceKey) -> None:
+        """Send the writes buffered for a resource."""
+
+        attributes, relationships, futures = self._writes.pop(key)
+        if len(futures) > 1:
+            LOGGER.debug(f'Merged {len(futures)} writes to Flair {key[0]} {key[1]} into one')
+        self.hass.async_create_task(self._async_send_write(key, attributes, relationships, futures))
+
+    async def _async_send_write(
+            self,
+            key: ResourceKey,
+            attributes: dict[str, Any],
+            relationships: dict[str, Any],
+            futures: list[asyncio.Future],
+    ) -> None:
+        """PATCH a resource and hand the result to every caller that wrote to it.
+
+        If Flair can't be reached the write is queued for retry and callers
+        get None instead of the error.
+        """
+
+        self._sending[key] = self._sending.get(key, 0) + 1
+        try:
+            response = await self.client.update(*key, attributes=attributes, relationships=relationships)
+        except Exception as error:
+            queued = is_transient(error) and self._async_queue_write(key, attributes, relationships)
+            if queued:
+                LOGGER.warning(f'Failed to write to Flair {key[0]} {key[1]}, retrying later: {error}')
+                self.unconfirmed_writes.discard(key)
+                self._async_schedule_retry()
+            for future in futures:
+                if not future.done():
+                    if queued:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            if (sending := self._sending.pop(key) - 1) > 0:
+                self._sending[key] = sending
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    @callback
+    def _async_queue_write(self, key: ResourceKey, attributes: dict[str, Any], relationships: dict[str, Any]) -> bool:
+        """Queue a write in the journal. Returns False if the write can't be retried."""
+
+        if not attributes.keys().isdisjoint(ALWAYS_WRITTEN_ATTRIBUTES):
+            return False
+        self.journal.async_add(key, attributes, relationships)
+        return True
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Retry the queued writes after a backoff, unless a retry is already on its way."""
+
+        if self._retry is not None:
+            return
+        delay = min(WRITE_RETRY_BACKOFF_BASE * 2 ** self._retry_attempts, WRITE_RETRY_BACKOFF_MAX)
+        self._retry = self.hass.loop.call_later(delay, self._async_start_retry)
+
+    @callback
+    def _async_replay_writes(self) -> None:
+        """Retry the queued writes right away now that Flair can be reached."""
+
+        if not self.journal or isinstance(self._retry, asyncio.Task):
+            return
+        if self._retry is not None:
+            self._retry.cancel()
+        self._retry_attempts = 0
+        self._retry = self.hass.loop.call_soon(self._async_start_retry)
+
+    @callback
+    def _async_start_retry(self) -> None:
+        """Start retrying the queued writes."""
+
+        self._retry = self.hass.async_create_task(self._async_retry_writes())
+
+    async def _async_retry_writes(self) -> None:
+        """Send the queued writes of the resources this coordinator fetches.
+
+        Stops at the first write that fails because Flair can't be reached
+        and tries again after a longer backoff. Writes that Flair rejects or
+        that were queued for longer than WRITE_QUEUE_TTL are dropped.
+        """
+
+        try:
+            for key, attributes in self.journal.async_expire():
+                LOGGER.warning(f'Gave up writing to Flair {key[0]} {key[1]} after {WRITE_QUEUE_TTL} seconds')
+                self.async_clear_pending(*key, attributes)
+            for key in self.journal.keys():
+                if key not in self.topology.resources or (write := self.journal.get(key)) is None:
+                    continue
+                attributes, relationships = dict(write[0]), dict(write[1])
+                self.write_retries += 1
+                try:
+                    await self.client.update(*key, attributes=attributes, relationships=relationships)
+                except Exception as error:
+                    if is_transient(error):
+                        LOGGER.debug(f'Retrying writes to Flair {key[0]} {key[1]} failed: {error}')
+                        self._retry_attempts += 1
+                        break
+                    LOGGER.error(f'Flair rejected the queued write of {attributes} to {key[0]} {key[1]}: {error}')
+                    self.journal.async_mark_written(key, attributes, relationships)
+                    self.async_clear_pending(*key, attributes)
+                    continue
+                self._retry_attempts = 0
+                self.journal.async_mark_written(key, attributes, relationships)
+                self.async_set_pending(*key, attributes)
+                self.unconfirmed_writes.add(key)
+                await self.async_request_resource_refresh(*key)
+        finally:
+            self._retry = None
+        if any(key in self.topology.resources for key in self.journal.keys()):
+            self._async_schedule_retry()
+
+    @callback
+    def async_schedule_write(self, resource_type: str, resource_id: str, attributes: dict[str, Any]) -> None:
+        """Write attributes to a resource once they stop changing.
+
+        The write is sent once no new values were scheduled for the same
+        attributes for write_delay seconds, so only the last value is written.
+        A write that is superseded while still being sent is cancelled.
+        Failures are logged as there is no caller left to report them to.
+
+        Values that match the current snapshot aren't scheduled, unless they
+        replace a value that is still waiting to be written. Schedule before
+        setting the values as pending, as the snapshot would match otherwise.
+        """
+
+        key = (resource_type, resource_id, tuple(sorted(attributes)))
+        if key not in self._scheduled_writes and self._is_unchanged(key[:2], attributes):
+            self.suppressed_writes += 1
+            LOGGER.debug(f'Skipped writing {attributes} to Flair {resource_type} {resource_id} as nothing would change')
+            return
+        if (previous := self._scheduled_writes.pop(key, None)) is not None:
+            previous.cancel()
+        self._scheduled_writes[key] = self.hass.loop.call_later(
+            self.write_delay, self._async_start_scheduled_write, key, attributes
+        )
+
+    @callback
+    def _async_start_scheduled_write(self, key: tuple[str, str, tuple[str, ...]], attributes: dict[str, Any]) -> None:
+        """Send a scheduled write whose quiet period passed."""
+
+        self._scheduled_writes[key] = self.hass.async_create_task(self._async_scheduled_write(key, attributes))
+
+    async def _async_scheduled_write(self, key: tuple[str, str, tuple[str, ...]], attributes: dict[str, Any]) -> None:
+        """Send a scheduled write and refresh the resource it was written to."""
+
+        resource_type, resource_id, _ = key
+        try:
+            # The values were already compared when they were scheduled.
+            await self.async_write(resource_type, resource_id, attributes, skip_unchanged=False)
+        except FlairError as error:
+            LOGGER.error(f'Failed to write {attributes} to Flair {resource_type} {resource_id}: {error}')
+            # Show what Flair has so writing the same value again isn't skipped.
+            self.async_clear_pending(resource_type, resource_id, attributes)
+            return
+        finally:
+            if self._scheduled_writes.get(key) is asyncio.current_task():
+                del self._scheduled_writes[key]
+        await self.async_request_resource_refresh(resource_type, resource_id)
+
+    async def async_request_resource_refresh(self, resource_type: str, resource_id: str) -> None:
+        """Request a refresh of a single resource after it was written to.
+
+        Requests made within RESOURCE_REFRESH_COOLDOWN of each other are
+        fetched together and merged into the current snapshot. The regular
+        poll schedule is left untouched. Nothing is refreshed if the resource
+        wasn't written to since it was last refreshed, as its writes were
+        skipped.
+        """
+
+        key = (resource_type, resource_id)
+        if key not in self.unconfirmed_writes:
+            return
+        self.unconfirmed_writes.discard(key)
+        self._activity = True
+        self._pending_refresh.add(key)
+        await self._resource_debouncer.async_call()
+
+    async def _async_refresh_resources(self) -> None:
+        """Fetch the resources waiting to be refreshed and merge them into the snapshot."""
+
+        keys, self._pending_refresh = self._pending_refresh, set()
+        if not keys or self.data is None:
+            return
+        if len(keys) > RESOURCE_REFRESH_MAX:
+            await self.async_refresh()
+            return
+
+        keys = [key for key in keys if key in self.topology.resources]
+        try:
+            # Confirmations of writes go ahead of polls.
+            with request_lane(LANE_CONFIRMATION):
+                resources = await asyncio.gather(*(
+                    getattr(self.client, RESOURCE_GETTERS[resource_type])(resource_id)
+                    for resource_type, resource_id in keys
+                ))
+        except FLAIR_ERRORS as error:
+            LOGGER.debug(f'Failed to refresh Flair resources {keys}, waiting for the next poll: {error}')
+            return
+
+        # The snapshot may have been replaced by a poll while fetching.
+        data = self.data
+        changed: set[ResourceKey] = set()
+        for key, resource in zip(keys, resources):
+            if (previous := self.topology.resources.get(key)) is None:
+                continue
+            # Readings aren't part of the resource itself and are carried over.
+            if resource.type in RESOURCES_WITH_READINGS:
+                resource.current_reading = previous.current_reading
+            resource = self._overlay_pending(resource)
+            if not resource_changed(previous, resource):
+                continue
+            data = self._merge_resource(data, resource)
+            changed.add(key)
+            if self._is_activity(previous, resource):
+                self._activity = True
+
+        if changed:
+            self.data = data
+            self._index(data)
+            self._changed_resources = changed
+            self.async_update_listeners()
+
+    @callback
+    def async_set_pending(self, resource_type: str, resource_id: str, attributes: dict[str, Any]) -> None:
+        """Show values written to a resource until Flair reports them.
+
+        The values are applied to the current snapshot right away and on top
+        of every fetched snapshot until Flair reports the same values or
+        PENDING_WRITE_TTL passes. Values the snapshot already shows are left
+        alone so listeners aren't updated for nothing.
+        """
+
+        key = (resource_type, resource_id)
+        if (resource := self.topology.resources.get(key)) is None:
+            return
+        if all(
+            attribute in resource.attributes and resource.attributes[attribute] == value
+            for attribute, value in attributes.items()
+        ):
+            return
+
+        expires = monotonic() + PENDING_WRITE_TTL
+        pending = self._pending.setdefault(key, {})
+        for attribute, value in attributes.items():
+            reported = pending[attribute][2] if attribute in pending else resource.attributes.get(attribute)
+            pending[attribute] = (value, expires, reported)
+
+        resource = replace(resource, attributes={**resource.attributes, **attributes})
+        self.data = self._merge_resource(self.data, resource)
+        self._index(self.data)
+        self._changed_resources = {key}
+        self.async_update_listeners()
+
+    @callback
+    def async_clear_pending(self, resource_type: str, resource_id: str, attributes: dict[str, Any]) -> None:
+        """Stop showing values that Flair didn't accept and show what it last reported instead.
+
+        Only values that are still pending are cleared, values written since
+        are left alone.
+        """
+
+        key = (resource_type, resource_id)
+        if (pending := self._pending.get(key)) is None:
+            return
+
+        reported: dict[str, Any] = {}
+        for attribute, value in attributes.items():
+            if attribute in pending and pending[attribute][0] == value:
+                reported[attribute] = pending.pop(attribute)[2]
+        if not pending:
+            del self._pending[key]
+        if not reported or (resource := self.topology.resources.get(key)) is None:
+            return
+
+        resource = replace(resource, attributes={**resource.attributes, **reported})
+        self.data = self._merge_resource(self.data, resource)
+        self._index(self.data)
+        self._changed_resources = {key}
+        self.async_update_listeners()
+
+    def _apply_pending(self, data: FlairData) -> FlairData:
+        """Apply values that Flair hasn't reported yet on top of a fetched snapshot."""
+
+        for key in list(self._pending):
+            if (resource := self._find_resource(data, key)) is None:
+                del self._pending[key]
+            elif (overlaid := self._overlay_pending(resource)) is not resource:
+                data = self._merge_resource(data, overlaid)
         return data
+
+    def _overlay_pending(self, resource: Any) -> Any:
+        """Return a copy of a fetched resource with pending values applied.
+
+        Values Flair reports or that expired are dropped. Values whose write
+        is still queued for retry don't expire. The resource itself is
+        returned if none are left.
+        """
+
+        key = (resource.type, resource.id)
+        if (pending := self._pending.get(key)) is None:
+            return resource
+
+        now = monotonic()
+        queued = self.journal.get(key)
+        overlay: dict[str, Any] = {}
+        for attribute, (value, expires, _) in list(pending.items()):
+            reported = resource.attributes.get(attribute)
+            # Values are shown for as long as their write is queued for retry.
+            if queued is not None and attribute in queued[0] and queued[0][attribute] == value:
+                expires = max(expires, now + PENDING_WRITE_TTL)
+            if expires <= now or reported == value:
+                del pending[attribute]
+            else:
+                overlay[attribute] = value
+                pending[attribute] = (value, expires, reported)
+        if not pending:
+            del self._pending[key]
+        if not overlay:
+            return resource
+        return replace(resource, attributes={**resource.attributes, **overlay})
+
+    @staticmethod
+    def _find_resource(data: FlairData, key: ResourceKey) -> Any | None:
+        """Return the resource with the given key from a snapshot."""
+
+        resource_type, resource_id = key
+        if resource_type == 'structures':
+            return data.structures.get(resource_id)
+        attribute = RESOURCE_ATTRIBUTES[resource_type]
+        for structure in data.structures.values():
+            resources = getattr(structure, attribute)
+            if isinstance(resources, dict) and resource_id in resources:
+                return resources[resource_id]
+        return None
+
+    @staticmethod
+    def _merge_resource(data: FlairData, resource: Any) -> FlairData:
+        """Return a copy of the snapshot with a single resource replaced.
+
+        Only the containers leading to the resource are copied.
+        """
+
+        if resource.type == 'structures':
+            structure = replace(
+                data.structures[resource.id],
+                attributes=resource.attributes,
+                relationships=resource.relationships,
+            )
+        else:
+            attribute = RESOURCE_ATTRIBUTES[resource.type]
+            structure = next(
+                structure for structure in data.structures.values()
+                if resource.id in getattr(structure, attribute)
+            )
+            structure = replace(
+                structure,
+                **{attribute: {**getattr(structure, attribute), resource.id: resource}},
+            )
+        return replace(data, structures={**data.structures, structure.id: structure})
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending resource refreshes and write retries when shutting down.
+
+        Queued writes stay in the journal and are retried after a restart.
+        """
+
+        await super().async_shutdown()
+        await self._resource_debouncer.async_shutdown()
+        for scheduled in self._scheduled_writes.values():
+            scheduled.cancel()
+        if self._retry is not None:
+            self._retry.cancel()
+        if self._history_jobs:
+            await asyncio.wait(self._history_jobs)
+        for history in self.histories.values():
+            await self.hass.async_add_executor_job(history.close)
+
+    @callback
+    def _async_record_history(self, changed: set[ResourceKey] | None) -> None:
+        """Append the readings of pucks and vents that changed to their structure's history.
+
+        The readings are written in the background so the refresh doesn't wait
+        for the disk before the snapshot is published.
+        """
+
+        timestamp = time()
+        readings: defaultdict[ReadingHistory, list[tuple[float, str, str, tuple[float, ...]]]] = defaultdict(list)
+        for device_type, columns in self.readings.items():
+            # Vents report fewer metrics than pucks.
+            padding = (nan,) * (HISTORY_METRICS - len(columns.columns))
+            for device_id, slot in columns.slots.items():
+                key = (device_type, device_id)
+                if changed is not None and key not in changed:
+                    continue
+                structure_id = self.topology.structures[key]
+                if (history := self.histories.get(structure_id)) is None:
+                    history = self.histories[structure_id] = ReadingHistory(
+                        history_path(self.hass.config.path(STORAGE_DIR), self._entry_id, structure_id),
+                        HISTORY_CAPACITY,
+                    )
+                metrics = tuple(column[slot] for column in columns.columns.values())
+                readings[history].append((timestamp, device_type, device_id, metrics + padding))
+
+        for history, history_readings in readings.items():
+            job = self.hass.async_add_executor_job(self._append_history, history, history_readings)
+            self._history_jobs.add(job)
+            job.add_done_callback(self._history_jobs.discard)
+
+    @staticmethod
+    def _append_history(history: ReadingHistory, readings: list[tuple[float, str, str, tuple[float, ...]]]) -> None:
+        """Append readings to a history, logging a failure instead of raising it."""
+
+        try:
+            history.append(readings)
+        except OSError as error:
+            LOGGER.warning(f'Failed to write Flair reading history to {history.path}: {error}')
+
+    def _adapt_update_interval(self) -> None:
+        """Poll faster while the HVAC system is active and back off while it is idle.
+
+        Any activity drops the interval to the configured minimum. Each poll
+        without activity grows it by SCAN_INTERVAL_BACKOFF up to the maximum.
+        """
+
+        if self._activity:
+            self._activity = False
+            seconds = self.min_interval
+        else:
+            seconds = min(self.update_interval.total_seconds() * SCAN_INTERVAL_BACKOFF, self.max_interval)
+
+        if seconds != self.update_interval.total_seconds():
+            LOGGER.debug(f'Flair poll interval set to {seconds:.0f} seconds')
+            self.update_interval = timedelta(seconds=seconds)
+
+    async def _async_fetch_data(self) -> FlairData:
+        """Fetch the resource types that are due and merge them with cached ones.
+
+        Each resource type is fetched on its own cadence as defined by
+        RESOURCE_REFRESH_INTERVALS. Resource types that aren't due are carried
+        over from the current snapshot so the result is always complete.
+        Coordinators bound to a structure only fetch that structure.
+        """
+
+        now = monotonic()
+        due = {
+            resource_type for resource_type, interval in RESOURCE_REFRESH_INTERVALS.items()
+            if now - self._last_fetched.get(resource_type, float('-inf')) >= interval
+        }
+        previous = self.data
+
+        if not self.fetch_users:
+            users: dict[str, User] = previous.users if previous is not None else {}
+        elif previous is None or 'users' in due:
+            users = (await self.client.get_users()).users
+        else:
+            users = previous.users
+
+        if self.structure_id is None:
+            fetched = (await self.client.get_structures()).structures
+        else:
+            fetched = {self.structure_id: await self.client.get_structure(self.structure_id)}
+        structures = await asyncio.gather(*(
+            self._async_fetch_structure(
+                structure,
+                due,
+                previous.structures.get(structure_id) if previous else None,
+            )
+            for structure_id, structure in fetched.items()
+        ))
+
+        for resource_type in due:
+            self._last_fetched[resource_type] = now
+        return FlairData(
+            users=users,
+            structures={structure.id: structure for structure in structures},
+        )
+
+    async def _async_fetch_structure(
+        self, structure: Structure, due: set[str], previous: Structure | None
+    ) -> Structure:
+        """Fetch due resources related to a structure.
+
+        All related resources are fetched for structures that weren't part
+        of the previous snapshot.
+        """
+
+        attributes = [
+            attribute for attribute, resource_type in STRUCTURE_RESOURCES.items()
+            if previous is None or resource_type in due
+        ]
+        related = await asyncio.gather(*(
+            self.client.get_related(structure, STRUCTURE_RESOURCES[attribute])
+            for attribute in attributes
+        ))
+
+        collections: dict[str, dict[str, Any]] = {
+            attribute: getattr(previous, attribute)
+            for attribute in STRUCTURE_RESOURCES
+            if attribute not in attributes
+        }
+        for attribute, payloads in zip(attributes, related):
+            resource_type = STRUCTURE_RESOURCES[attribute]
+            cached = self._payloads.get((structure.id, attribute))
+            if cached is not None and payloads is cached[0]:
+                # Not modified since the last fetch, reuse the models built from it.
+                # Models with readings are copied as their readings are fetched again.
+                collections[attribute] = {
+                    resource_id: replace(resource) if resource_type in RESOURCES_WITH_READINGS else resource
+                    for resource_id, resource in cached[1].items()
+                }
+                continue
+            model = RESOURCE_MODELS[resource_type]
+            collections[attribute] = {
+                payload['id']: model(
+                    id=payload['id'],
+                    attributes=payload['attributes'],
+                    relationships=payload['relationships'],
+                )
+                for payload in payloads or []
+            }
+            self._payloads[(structure.id, attribute)] = (payloads, collections[attribute])
+
+        await self._async_fetch_readings([
+            resource
+            for attribute in attributes
+            if STRUCTURE_RESOURCES[attribute] in RESOURCES_WITH_READINGS
+            for resource in collections[attribute].values()
+        ])
+
+        return Structure(
+            id=structure.id,
+            attributes=structure.attributes,
+            relationships=structure.relationships,
+            **collections,
+        )
+
+    async def _async_fetch_readings(self, resources: list[Bridge | Puck | Vent]) -> None:
+        """Fetch the current reading of active pucks, vents and bridges in parallel.
+
+        Inactive devices don't report readings and are given an empty one.
+        """
+
+        active = [resource for resource in resources if not resource.attributes['inactive']]
+        readings = await asyncio.gather(*(
+            self.client.get_related(resource, 'current-reading') for resource in active
+        ))
+        for resource in resources:
+            resource.current_reading = {}
+        for resource, reading in zip(active, readings):
+            resource.current_reading = reading['attributes']
+
+    def _share_unchanged(self, data: FlairData) -> FlairData:
+        """Reuse the objects of the current snapshot for everything that didn't change.
+
+        Unchanged resources, collections and structures keep their identity
+        across polls, so change detection and generation cached values only
+        have to deal with what actually changed. If nothing changed at all
+        the current snapshot itself is returned.
+        """
+
+        if (previous := self.data) is None:
+            return data
+
+        structures: dict[str, Structure] = {}
+        for structure_id, structure in data.structures.items():
+            if (old := previous.structures.get(structure_id)) is None:
+                structures[structure_id] = structure
+                continue
+
+            collections: dict[str, Any] = {}
+            for attribute in STRUCTURE_RESOURCES:
+                resources, old_resources = getattr(structure, attribute), getattr(old, attribute)
+                # flairaio uses a placeholder string for collections it didn't fetch.
+                if resources is old_resources or not (isinstance(resources, dict) and isinstance(old_resources, dict)):
+                    collections[attribute] = resources
+                    continue
+                shared = {
+                    resource_id: (
+                        old_resources[resource_id]
+                        if resource_id in old_resources and not resource_changed(old_resources[resource_id], resource)
+                        else resource
+                    )
+                    for resource_id, resource in resources.items()
+                }
+                if shared.keys() == old_resources.keys() and all(
+                    resource is old_resources[resource_id] for resource_id, resource in shared.items()
+                ):
+                    shared = old_resources
+                collections[attribute] = shared
+
+            if not resource_changed(old, structure) and all(
+                collections[attribute] is getattr(old, attribute) for attribute in STRUCTURE_RESOURCES
+            ):
+                structures[structure_id] = old
+            else:
+                structures[structure_id] = replace(structure, **collections)
+
+        users = previous.users if data.users == previous.users else data.users
+        if users is previous.users and structures.keys() == previous.structures.keys() and all(
+            structure is previous.structures[structure_id] for structure_id, structure in structures.items()
+        ):
+            return previous
+        return FlairData(users=users, structures=structures)
+
+    def _index(self, data: FlairData) -> None:
+        """Index a snapshot that is being published and start a new generation."""
+
+        self.topology = Topology.build(data, self.topology)
+        self.generation += 1
+        for columns in self.readings.values():
+            columns.update(self.topology)
+
+    def _detect_changes(self, data: FlairData) -> set[ResourceKey] | None:
+        """Compare newly fetched data against the current snapshot, resource by resource.
+
+        Indexes the new snapshot as the current topology. Returns the keys of all resources that were added, removed or changed,
+        or None if every listener needs to be updated.
+        """
+
+        if data is self.data and self.last_update_success and not self.restored:
+            # Nothing changed, keep the current topology and generation.
+            return set()
+
+        previous = self.topology.resources
+        self._index(data)
+        topology = self.topology
+        current = topology.resources
+        changed: set[ResourceKey] = set()
+
+        for key, resource in current.items():
+            if key not in previous or resource_changed(previous[key], resource):
+                changed.add(key)
+                if key in previous and self._is_activity(previous[key], resource):
+                    self._activity = True
+                # Structure entities render schedule and thermostat details.
+                if key[0] in STRUCTURE_METADATA:
+                    changed.add(('structures', topology.structures[key]))
+
+        if not previous or not self.last_update_success or self.restored:
+            return None
+
+        removed = previous.keys() - current.keys()
+        if any(key[0] in STRUCTURE_METADATA for key in removed):
+            return None
+        return changed | removed
+
+    @staticmethod
+    def _is_activity(old: Any, new: Any) -> bool:
+        """Determine if any attribute that indicates HVAC activity changed."""
+
+        return any(
+            old.attributes.get(attribute) != new.attributes.get(attribute)
+            for attribute in ACTIVITY_ATTRIBUTES.get(new.type, ())
+        )
+
+    def resolve_context(self, context: tuple[tuple[str, ...], ...]) -> set[ResourceKey]:
+        """Resolve an entity's listener context into the resources it depends on.
+
+        Each item of the context is either a resource key, e.g. ('vents', vent_id),
+        or a resource key followed by the name of a to-one relationship, e.g.
+        ('vents', vent_id, 'room'). Relationships are resolved against the current
+        snapshot so entities follow a device that moves to a different room.
+        """
+
+        keys: set[ResourceKey] = set()
+        for item in context:
+            if len(item) == 2:
+                keys.add(item)
+            elif (target := self.topology.relations.get(item)) is not None:
+                keys.add(target)
+        return keys
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners that depend on resources that changed."""
+
+        changed, self._changed_resources = self._changed_resources, None
+        # Listeners without a context, like entity discovery and device cleanup,
+        # go first so devices that are gone are removed before their entities
+        # are updated.
+        listeners = sorted(self._listeners.values(), key=lambda listener: listener[1] is not None)
+        for update_callback, context in listeners:
+            if changed is None or context is None or not changed.isdisjoint(self.resolve_context(context)):
+                update_callback()
+
+    def has_resources(self, context: tuple[tuple[str, ...], ...]) -> bool:
+        """Determine if every resource in an entity's listener context is part of the snapshot."""
+
+        return all(item in self.topology.resources for item in context if len(item) == 2)
+
+    def _build_debug_snapshot(self, data: FlairData) -> str:
+        """Serialize fetched data for debug logging.
+
+        The first snapshot is logged in full. Subsequent polls only log
+        what changed since the previous poll. Runs in the executor.
+        """
+
+        snapshot = serialize_snapshot(data)
+        previous = self._debug_snapshot
+        self._debug_snapshot = snapshot
+        nl = '\n'
+
+        if previous is None:
+            message = f'Found the following Flair structures/devices: {nl}{json.dumps(snapshot, indent=4)}'
+        elif changes := snapshot_diff(previous, snapshot):
+            message = f'Flair structures/devices changed since last poll: {nl}{nl.join(changes)}'
+        else:
+            message = 'No changes to Flair structures/devices since last poll'
+
+        return truncate(message, DEBUG_SNAPSHOT_MAX_LENGTH)
@@ -14,10 +14,11 @@ from homeassistant.components.cover import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LOGGER
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
 
 
 async def async_setup_entry(
@@ -25,26 +26,36 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Cover Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[CoverEntity]:
+    """Create the cover entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     covers = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Vents
-            if structure_data.vents:
-                for vent_id, vent_data in structure_data.vents.items():
-                    covers.extend((
-                        FlairVent(coordinator, structure_id, vent_id),
-                    ))
+    # Vents
+    if structure_data.vents:
+        for vent_id, vent_data in structure_data.vents.items():
+            covers.extend((
+                FlairVent(coordinator, structure_id, vent_id),
+            ))
 
-    async_add_entities(covers)
+    return covers
 
 
-class FlairVent(CoordinatorEntity, CoverEntity):
+class FlairVent(FlairEntity, CoverEntity):
     """Representation of Vent device."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(
+            ('vents', vent_id),
+            ('structures', structure_id),
+            ('vents', vent_id, 'room'),
+        ))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -52,7 +63,7 @@ class FlairVent(CoordinatorEntity, CoverEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -64,8 +75,7 @@ class FlairVent(CoordinatorEntity, CoverEntity):
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        room_id = self.vent_data.relationships['room']['data']['id']
-        return self.coordinator.data.structures[self.structure_id].rooms[room_id]
+        return self.coordinator.topology.related('vents', self.vent_id, 'room')
 
     @property
     def manual_struct_room(self) -> bool:
@@ -144,6 +154,9 @@ class FlairVent(CoordinatorEntity, CoverEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.vent_data.attributes['inactive']:
             return True
         else:
@@ -153,10 +166,9 @@ class FlairVent(CoordinatorEntity, CoverEntity):
         """Open the vent."""
 
         attributes = self.set_attributes(100)
-        await self.coordinator.client.update('vents', self.vent_data.id, attributes=attributes, relationships={})
-        self.vent_data.attributes['percent-open'] = 100
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('vents', self.vent_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('vents', self.vent_data.id, {'percent-open': 100})
+        await self.coordinator.async_request_resource_refresh('vents', self.vent_data.id)
 
         if not self.manual_struct_room:
             LOGGER.warning(f'''Flair structure or room not in manual mode.
@@ -169,10 +181,9 @@ class FlairVent(CoordinatorEntity, CoverEntity):
         """Close the vent."""
 
         attributes = self.set_attributes(0)
-        await self.coordinator.client.update('vents', self.vent_data.id, attributes=attributes, relationships={})
-        self.vent_data.attributes['percent-open'] = 0
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('vents', self.vent_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('vents', self.vent_data.id, {'percent-open': 0})
+        await self.coordinator.async_request_resource_refresh('vents', self.vent_data.id)
 
         if not self.manual_struct_room:
             LOGGER.warning(f'''Flair structure or room not in manual mode.
@@ -191,10 +202,9 @@ class FlairVent(CoordinatorEntity, CoverEntity):
             await self.async_open_cover_tilt()
         else:
             attributes = self.set_attributes(50)
-            await self.coordinator.client.update('vents', self.vent_data.id, attributes=attributes, relationships={})
-            self.vent_data.attributes['percent-open'] = 50
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write('vents', self.vent_data.id, attributes=attributes)
+            self.coordinator.async_set_pending('vents', self.vent_data.id, {'percent-open': 50})
+            await self.coordinator.async_request_resource_refresh('vents', self.vent_data.id)
 
             if not self.manual_struct_room:
                 LOGGER.warning(f'''Flair structure or room not in manual mode.
@@ -0,0 +1,63 @@
+"""Diagnostics support for Flair."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import FlairDataUpdateCoordinator
+from .discovery import coordinator_structure_ids
+
+TO_REDACT = {CONF_CLIENT_ID, CONF_CLIENT_SECRET, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
+    # All structures share a single coordinator unless structure coordinators are enabled.
+    unique_coordinators = list(dict.fromkeys(coordinators.values()))
+    # Structures added after setup are only known to the coordinator's snapshot.
+    structures = {
+        structure_id: coordinator
+        for coordinator in unique_coordinators if coordinator.data is not None
+        for structure_id in coordinator_structure_ids(coordinator)
+    }
+
+    history = {
+        structure_id: await hass.async_add_executor_job(coordinator.histories[structure_id].as_dict)
+        for structure_id, coordinator in structures.items()
+        if structure_id in coordinator.histories
+    }
+
+    return {
+        'entry': async_redact_data(entry.as_dict(), TO_REDACT),
+        'coordinators': [
+            {
+                'name': coordinator.name,
+                'update_interval': coordinator.update_interval.total_seconds(),
+                'last_update_success': coordinator.last_update_success,
+                'restored': coordinator.restored,
+                'suppressed_writes': coordinator.suppressed_writes,
+                'write_retries': coordinator.write_retries,
+            }
+            for coordinator in unique_coordinators
+        ],
+        'rate_limit': unique_coordinators[0].client.limiter.as_dict(),
+        'conditional_requests': unique_coordinators[0].client.cache_info(),
+        'write_queue': unique_coordinators[0].journal.as_dict(),
+        'readings': {
+            structure_id: {
+                device_type: columns.aggregates(structure_id)
+                for device_type, columns in coordinator.readings.items()
+            }
+            for structure_id, coordinator in structures.items()
+        },
+        'history': history,
+    }
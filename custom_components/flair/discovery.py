@@ -0,0 +1,144 @@
+"""Discovery of Flair resources added or removed after setup."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOGGER
+from .coordinator import FlairDataUpdateCoordinator
+from .topology import Topology
+from .util import ResourceKey
+
+
+def coordinator_structure_ids(coordinator: FlairDataUpdateCoordinator) -> list[str]:
+    """Return the ids of the structures a coordinator fetches."""
+
+    if coordinator.structure_id is not None:
+        return [coordinator.structure_id]
+    return list(coordinator.data.structures)
+
+
+@callback
+def async_setup_entity_discovery(
+    entry: ConfigEntry,
+    coordinators: dict[str, FlairDataUpdateCoordinator],
+    async_add_entities: AddEntitiesCallback,
+    build_entities: Callable[[FlairDataUpdateCoordinator, str], Iterable[Entity]],
+) -> None:
+    """Add a platform's entities and keep adding entities for resources that show up later.
+
+    build_entities creates every entity of the platform for a structure.
+    It's only called again when a coordinator publishes resources that it
+    didn't have before. Entities that were already added are skipped, unless
+    their device moved to another structure coordinator. Entities removed
+    along with their device are added again if the device comes back.
+    """
+
+    # Entities added by unique id, until they are removed.
+    added: dict[str, Entity] = {}
+    # Resources each coordinator had when it last published a snapshot.
+    built: dict[FlairDataUpdateCoordinator, tuple[Topology, set[ResourceKey]]] = {}
+
+    @callback
+    def async_forget(entity: Entity) -> None:
+        """Allow an entity to be added again once it was removed."""
+
+        if added.get(entity.unique_id) is entity:
+            del added[entity.unique_id]
+
+    async def async_replace(moved: list[Entity], entities: list[Entity]) -> None:
+        """Remove the entities of devices that moved before adding their new entities."""
+
+        for entity in moved:
+            await entity.async_remove()
+        async_add_entities(entities)
+
+    @callback
+    def async_add_new_entities(coordinator: FlairDataUpdateCoordinator) -> None:
+        """Add the entities of resources that are new to a coordinator."""
+
+        if coordinator.data is None:
+            # The first refresh failed, entities are added once it succeeds.
+            return
+        topology = coordinator.topology
+        previous = built.get(coordinator)
+        if previous is not None and topology is previous[0]:
+            return
+        # Resources that left are forgotten, so they count as new if they come back.
+        built[coordinator] = (topology, set(topology.resources))
+        if previous is not None and topology.resources.keys() <= previous[1]:
+            return
+
+        entities: list[Entity] = []
+        moved: list[Entity] = []
+        for structure_id in coordinator_structure_ids(coordinator):
+            for entity in build_entities(coordinator, structure_id):
+                if (existing := added.get(entity.unique_id)) is not None:
+                    if existing.coordinator is coordinator or existing.coordinator.has_resources(
+                        existing.coordinator_context
+                    ):
+                        continue
+                    # The device moved to a structure fetched by another coordinator.
+                    moved.append(existing)
+                added[entity.unique_id] = entity
+                entity.async_on_remove(lambda entity=entity: async_forget(entity))
+                entities.append(entity)
+        if not entities:
+            return
+        if previous is not None:
+            LOGGER.info(f'Adding {len(entities)} entities for new Flair devices')
+        if moved:
+            coordinator.hass.async_create_task(async_replace(moved, entities))
+        else:
+            async_add_entities(entities)
+
+    for coordinator in dict.fromkeys(coordinators.values()):
+        async_add_new_entities(coordinator)
+        entry.async_on_unload(
+            coordinator.async_add_listener(lambda coordinator=coordinator: async_add_new_entities(coordinator))
+        )
+
+
+@callback
+def async_setup_device_cleanup(
+    hass: HomeAssistant, entry: ConfigEntry, coordinators: dict[str, FlairDataUpdateCoordinator]
+) -> None:
+    """Remove devices of resources that no longer exist in Flair from the device registry.
+
+    Devices are only removed once every coordinator has fetched live data,
+    so a failing or restored coordinator never causes devices to be removed.
+    """
+
+    unique_coordinators = list(dict.fromkeys(coordinators.values()))
+    checked: list[Topology] = []
+
+    @callback
+    def async_remove_stale_devices() -> None:
+        """Remove devices that none of the coordinators know about."""
+
+        if not all(
+            coordinator.last_update_success and not coordinator.restored for coordinator in unique_coordinators
+        ):
+            return
+        topologies = [coordinator.topology for coordinator in unique_coordinators]
+        if len(topologies) == len(checked) and all(new is old for new, old in zip(topologies, checked)):
+            return
+        checked[:] = topologies
+
+        resource_ids = {key[1] for topology in topologies for key in topology.resources}
+        device_registry = dr.async_get(hass)
+        for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+            if not any(
+                domain == DOMAIN and identifier in resource_ids
+                for domain, identifier in device.identifiers
+            ):
+                LOGGER.info(f'Removing Flair device {device.name} as it no longer exists')
+                device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+
+    for coordinator in unique_coordinators:
+        entry.async_on_unload(coordinator.async_add_listener(async_remove_stale_devices))
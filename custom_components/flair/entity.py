@@ -0,0 +1,22 @@
+"""Base entity for Flair integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import FlairDataUpdateCoordinator
+
+
+class FlairEntity(CoordinatorEntity):
+    """Representation of an entity backed by a Flair coordinator."""
+
+    coordinator: FlairDataUpdateCoordinator
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as stale while it comes from the saved snapshot."""
+
+        if self.coordinator.restored:
+            return {'stale': True}
+        return None
@@ -0,0 +1,169 @@
+"""Memory mapped history of Flair puck and vent readings."""
+from __future__ import annotations
+
+import glob
+import mmap
+import os
+import struct
+import threading
+from typing import Any
+
+from .const import DOMAIN
+
+HISTORY_MAGIC = b'FLRH'
+HISTORY_VERSION = 1
+# Metric columns per reading. Vents report fewer metrics and are padded with NaN.
+HISTORY_METRICS = 6
+
+# Magic, version, reading size, capacity, index of the next reading and number of readings.
+HEADER = struct.Struct('<4sHHIQQ')
+# Timestamp, device type, device id and metric columns.
+READING = struct.Struct(f'<d5s36s{HISTORY_METRICS}d')
+
+
+def history_path(storage_dir: str, entry_id: str, structure_id: str) -> str:
+    """Return the path of a structure's history file."""
+
+    return os.path.join(storage_dir, f'{DOMAIN}.{entry_id}.{structure_id}.history')
+
+
+def remove_histories(storage_dir: str, entry_id: str) -> None:
+    """Remove the history files of every structure of a config entry."""
+
+    for path in glob.glob(os.path.join(glob.escape(storage_dir), f'{DOMAIN}.{entry_id}.*.history')):
+        os.remove(path)
+
+
+class ReadingHistory:
+    """Fixed size ring of readings stored in a memory mapped file.
+
+    The file holds a header followed by capacity fixed size readings. Once
+    full, the oldest readings are overwritten. Readings about to be
+    overwritten are dropped from the header first, and new readings are
+    flushed before the header that counts them, so a crash can at worst
+    lose the readings of the poll that was being written along with the
+    ones it replaced. A file that doesn't match the expected layout is
+    started over.
+
+    All methods do blocking I/O and must be run in the executor. They hold a
+    lock, so appends written in the background can't interleave with reads.
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Initialize the history without opening the file yet."""
+
+        self.path = path
+        self.capacity = capacity
+        self._mmap: mmap.mmap | None = None
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Return the number of readings held."""
+
+        return self._count
+
+    def _open(self) -> mmap.mmap:
+        """Map the history file, creating or starting it over if needed."""
+
+        if self._mmap is not None:
+            return self._mmap
+
+        size = HEADER.size + self.capacity * READING.size
+        with open(self.path, 'a+b') as file:
+            file.seek(0)
+            header = file.read(HEADER.size)
+            valid = False
+            if len(header) == HEADER.size and os.fstat(file.fileno()).st_size == size:
+                magic, version, reading_size, capacity, head, count = HEADER.unpack(header)
+                valid = (
+                    (magic, version, reading_size, capacity) == (HISTORY_MAGIC, HISTORY_VERSION, READING.size, self.capacity)
+                    and head < capacity and count <= capacity
+                )
+            if not valid:
+                file.truncate(0)
+                file.truncate(size)
+                head = count = 0
+            self._mmap = mmap.mmap(file.fileno(), size)
+
+        self._head, self._count = head, count
+        if not valid:
+            self._write_header()
+        return self._mmap
+
+    def _write_header(self) -> None:
+        """Write and flush the header."""
+
+        HEADER.pack_into(
+            self._mmap, 0,
+            HISTORY_MAGIC, HISTORY_VERSION, READING.size, self.capacity, self._head, self._count,
+        )
+        self._mmap.flush(0, HEADER.size)
+
+    def append(self, readings: list[tuple[float, str, str, tuple[float, ...]]]) -> None:
+        """Append (timestamp, device type, device id, metrics) readings."""
+
+        if not readings:
+            return
+        with self._lock:
+            buffer = self._open()
+            head, count = self._head, self._count
+            # Stop counting the oldest readings before their slots are reused.
+            if (overwritten := min(count + len(readings) - self.capacity, count)) > 0:
+                self._count = count = count - overwritten
+                self._write_header()
+            for timestamp, device_type, device_id, metrics in readings:
+                READING.pack_into(
+                    buffer, HEADER.size + head * READING.size,
+                    timestamp, device_type.encode(), device_id.encode(), *metrics,
+                )
+                head = (head + 1) % self.capacity
+                count = min(count + 1, self.capacity)
+            buffer.flush()
+            self._head, self._count = head, count
+            self._write_header()
+
+    def readings(self) -> list[tuple[float, str, str, tuple[float, ...]]]:
+        """Return every reading held, oldest first.
+
+        Readings are unpacked straight from the mapped file without copying it.
+        """
+
+        readings = []
+        with self._lock:
+            buffer = self._open()
+            start = (self._head - self._count) % self.capacity
+            # The readings wrap around the end of the file once it's full.
+            spans = [(start, min(start + self._count, self.capacity))]
+            if start + self._count > self.capacity:
+                spans.append((0, self._head))
+            with memoryview(buffer) as view:
+                for first, last in spans:
+                    offset = HEADER.size + first * READING.size
+                    with view[offset:HEADER.size + last * READING.size] as span:
+                        readings.extend(
+                            (timestamp, device_type.rstrip(b'\0').decode(), device_id.rstrip(b'\0').decode(), tuple(metrics))
+                            for timestamp, device_type, device_id, *metrics in READING.iter_unpack(span)
+                        )
+        return readings
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the history and the span it covers for each device, for diagnostics."""
+
+        devices: dict[str, dict[str, Any]] = {}
+        for timestamp, device_type, device_id, _ in self.readings():
+            if (device := devices.get(f'{device_type}/{device_id}')) is None:
+                device = devices[f'{device_type}/{device_id}'] = {'readings': 0, 'first': timestamp}
+            device['readings'] += 1
+            device['last'] = timestamp
+        return {'capacity': self.capacity, 'count': self._count, 'devices': devices}
+
+    def close(self) -> None:
+        """Unmap the history file."""
+
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
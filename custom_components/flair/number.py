@@ -14,12 +14,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from .const import DOMAIN
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
 
 
 async def async_setup_entry(
@@ -27,39 +28,45 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Number Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[NumberEntity]:
+    """Create the number entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     numbers = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
+    # Structures
+    numbers.extend((
+        TempAwayMin(coordinator, structure_id),
+        TempAwayMax(coordinator, structure_id),
+    ))
+
+    # Pucks
+    if structure_data.pucks:
+        for puck_id, puck_data in structure_data.pucks.items():
             numbers.extend((
-                TempAwayMin(coordinator, structure_id),
-                TempAwayMax(coordinator, structure_id),
+                PuckLowerLimit(coordinator, structure_id, puck_id),
+                PuckUpperLimit(coordinator, structure_id, puck_id),
+                TempCalibration(coordinator, structure_id, puck_id),
             ))
 
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    numbers.extend((
-                        PuckLowerLimit(coordinator, structure_id, puck_id),
-                        PuckUpperLimit(coordinator, structure_id, puck_id),
-                        TempCalibration(coordinator, structure_id, puck_id),
-                    ))
-
-            # Bridge
-            if structure_data.bridges:
-                for bridge_id, bridge_data in structure_data.bridges.items():
-                    numbers.append(BridgeLED(coordinator, structure_id, bridge_id))
+    # Bridge
+    if structure_data.bridges:
+        for bridge_id, bridge_data in structure_data.bridges.items():
+            numbers.append(BridgeLED(coordinator, structure_id, bridge_id))
 
-    async_add_entities(numbers)
+    return numbers
 
 
-class TempAwayMin(CoordinatorEntity, NumberEntity):
+class TempAwayMin(FlairEntity, NumberEntity):
     """Representation of minimum away temperature."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -194,6 +201,9 @@ class TempAwayMin(CoordinatorEntity, NumberEntity):
         and system mode is set to auto
         """
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         set_point_mode = self.structure_data.attributes['set-point-mode']
         structure_away_mode = self.structure_data.attributes['structure-away-mode']
         system_mode = self.structure_data.attributes['mode'] 
@@ -212,10 +222,8 @@ class TempAwayMin(CoordinatorEntity, NumberEntity):
             temp = round(((value - 32) * (5/9)), 2)
 
         attributes = self.set_attributes(temp)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['temp-away-min-c'] = temp
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('structures', self.structure_data.id, attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'temp-away-min-c': temp})
 
     @staticmethod
     def set_attributes(value: float) -> dict[str, float]:
@@ -227,11 +235,11 @@ class TempAwayMin(CoordinatorEntity, NumberEntity):
         return attributes
 
 
-class TempAwayMax(CoordinatorEntity, NumberEntity):
+class TempAwayMax(FlairEntity, NumberEntity):
     """Representation of max away temperature."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -366,6 +374,9 @@ class TempAwayMax(CoordinatorEntity, NumberEntity):
         and system mode is set to auto
         """
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         set_point_mode = self.structure_data.attributes['set-point-mode']
         structure_away_mode = self.structure_data.attributes['structure-away-mode']
         system_mode = self.structure_data.attributes['mode'] 
@@ -383,10 +394,8 @@ class TempAwayMax(CoordinatorEntity, NumberEntity):
         else:
             temp = round(((value - 32) * (5/9)), 2)
         attributes = self.set_attributes(temp)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['temp-away-max-c'] = temp
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('structures', self.structure_data.id, attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'temp-away-max-c': temp})
 
     @staticmethod
     def set_attributes(value: float) -> dict[str, float]:
@@ -398,11 +407,11 @@ class TempAwayMax(CoordinatorEntity, NumberEntity):
         return attributes
 
 
-class PuckLowerLimit(CoordinatorEntity, NumberEntity):
+class PuckLowerLimit(FlairEntity, NumberEntity):
     """Representation of puck set point lower limit."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -410,7 +419,7 @@ class PuckLowerLimit(CoordinatorEntity, NumberEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -527,6 +536,9 @@ class PuckLowerLimit(CoordinatorEntity, NumberEntity):
     def available(self) -> bool:
         """Return true if puck is active."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.puck_data.attributes['inactive']:
             return True
         else:
@@ -541,10 +553,8 @@ class PuckLowerLimit(CoordinatorEntity, NumberEntity):
             temp = round(((value - 32) * (5/9)), 2)
 
         attributes = self.set_attributes(temp)
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['setpoint-bound-low'] = temp
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('pucks', self.puck_data.id, attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'setpoint-bound-low': temp})
 
     @staticmethod
     def set_attributes(value: float) -> dict[str, float]:
@@ -556,11 +566,11 @@ class PuckLowerLimit(CoordinatorEntity, NumberEntity):
         return attributes
 
 
-class PuckUpperLimit(CoordinatorEntity, NumberEntity):
+class PuckUpperLimit(FlairEntity, NumberEntity):
     """Representation of puck set point upper limit."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -568,7 +578,7 @@ class PuckUpperLimit(CoordinatorEntity, NumberEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -685,6 +695,9 @@ class PuckUpperLimit(CoordinatorEntity, NumberEntity):
     def available(self) -> bool:
         """Return true if puck is active."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.puck_data.attributes['inactive']:
             return True
         else:
@@ -699,10 +712,8 @@ class PuckUpperLimit(CoordinatorEntity, NumberEntity):
             temp = round(((value - 32) * (5/9)), 2)
 
         attributes = self.set_attributes(temp)
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['setpoint-bound-high'] = temp
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('pucks', self.puck_data.id, attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'setpoint-bound-high': temp})
 
     @staticmethod
     def set_attributes(value: float) -> dict[str, float]:
@@ -714,11 +725,11 @@ class PuckUpperLimit(CoordinatorEntity, NumberEntity):
         return attributes
 
 
-class TempCalibration(CoordinatorEntity, NumberEntity):
+class TempCalibration(FlairEntity, NumberEntity):
     """Representation of puck temperature calibration."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -726,7 +737,7 @@ class TempCalibration(CoordinatorEntity, NumberEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -846,6 +857,9 @@ class TempCalibration(CoordinatorEntity, NumberEntity):
     def available(self) -> bool:
         """Return true if puck is active and offset exists."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         puck_inactive = self.puck_data.attributes['inactive']
         temp_offset = self.puck_data.attributes['temperature-offset-override-c']
 
@@ -870,10 +884,8 @@ class TempCalibration(CoordinatorEntity, NumberEntity):
             ha_to_flair = (value_to_c - zero_f_to_c)
 
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['temperature-offset-override-c'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('pucks', self.puck_data.id, attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'temperature-offset-override-c': ha_to_flair})
 
     @staticmethod
     def set_attributes(value: float) -> dict[str, float]:
@@ -885,11 +897,11 @@ class TempCalibration(CoordinatorEntity, NumberEntity):
         return attributes
 
 
-class BridgeLED(CoordinatorEntity, NumberEntity):
+class BridgeLED(FlairEntity, NumberEntity):
     """Representation of bridge LED brightness."""
 
     def __init__(self, coordinator, structure_id, bridge_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('bridges', bridge_id),))
         self.bridge_id = bridge_id
         self.structure_id = structure_id
 
@@ -897,7 +909,7 @@ class BridgeLED(CoordinatorEntity, NumberEntity):
     def bridge_data(self) -> Bridge:
         """Handle coordinator bridge data."""
 
-        return self.coordinator.data.structures[self.structure_id].bridges[self.bridge_id]
+        return self.coordinator.topology.resource('bridges', self.bridge_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -975,6 +987,9 @@ class BridgeLED(CoordinatorEntity, NumberEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.bridge_data.attributes['inactive']:
             return True
         else:
@@ -984,10 +999,8 @@ class BridgeLED(CoordinatorEntity, NumberEntity):
         """Update the current value."""
 
         attributes = self.set_attributes(value)
-        await self.coordinator.client.update('bridges', self.bridge_data.id, attributes=attributes, relationships={})
-        self.bridge_data.attributes['led-brightness'] = value
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_write('bridges', self.bridge_data.id, attributes)
+        self.coordinator.async_set_pending('bridges', self.bridge_data.id, {'led-brightness': value})
 
     @staticmethod
     def set_attributes(value: int) -> dict[str, int]:
@@ -0,0 +1,109 @@
+"""Columnar store of the latest Flair puck and vent readings."""
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict
+from math import inf, isnan, nan
+from typing import Any
+
+from .topology import Topology
+
+# Record fields stored for each device type.
+READING_METRICS = {
+    "pucks": ("temperature_c", "humidity", "pressure", "light", "voltage", "rssi"),
+    "vents": ("duct_temperature_c", "duct_pressure", "voltage", "rssi"),
+}
+
+
+class ReadingColumns:
+    """Latest readings of one device type, stored as one array column per metric.
+
+    Each device is given a slot the first time it shows up. A device keeps
+    its slot for as long as it exists and the slot is reused once it's
+    removed. Missing readings are stored as NaN.
+    """
+
+    def __init__(self, device_type: str) -> None:
+        """Initialize empty columns for a device type."""
+
+        self.device_type = device_type
+        self.columns: dict[str, array] = {metric: array('d') for metric in READING_METRICS[device_type]}
+        # Slot of every device by device id.
+        self.slots: dict[str, int] = {}
+        self._free: list[int] = []
+        # Slots of the devices that belong to each structure.
+        self._structure_slots: dict[str, list[int]] = {}
+
+    def update(self, topology: Topology) -> None:
+        """Write the readings of every device in a snapshot in place."""
+
+        records = {
+            key[1]: record for key, record in topology.records.items()
+            if key[0] == self.device_type
+        }
+
+        for device_id in self.slots.keys() - records.keys():
+            slot = self.slots.pop(device_id)
+            for column in self.columns.values():
+                column[slot] = nan
+            self._free.append(slot)
+
+        structure_slots: defaultdict[str, list[int]] = defaultdict(list)
+        for device_id, record in records.items():
+            slot = self._slot(device_id)
+            for metric, column in self.columns.items():
+                value = getattr(record, metric)
+                column[slot] = value if isinstance(value, (int, float)) else nan
+            structure_slots[topology.structures[(self.device_type, device_id)]].append(slot)
+        self._structure_slots = dict(structure_slots)
+
+    def _slot(self, device_id: str) -> int:
+        """Return the slot of a device, assigning one if it doesn't have one yet."""
+
+        if (slot := self.slots.get(device_id)) is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(next(iter(self.columns.values())))
+                for column in self.columns.values():
+                    column.append(nan)
+            self.slots[device_id] = slot
+        return slot
+
+    def value(self, device_id: str, metric: str) -> float | None:
+        """Return the latest reading of a device, or None if it doesn't have one."""
+
+        if (slot := self.slots.get(device_id)) is None:
+            return None
+        value = self.columns[metric][slot]
+        return None if isnan(value) else value
+
+    def aggregate(self, structure_id: str, metric: str) -> dict[str, Any] | None:
+        """Return the minimum, maximum and mean of a metric across a structure's devices.
+
+        Returns None if none of the structure's devices report the metric.
+        """
+
+        column = self.columns[metric]
+        count, low, high, total = 0, inf, -inf, 0.0
+        # A single pass over the column, without copying the values out of it.
+        for slot in self._structure_slots.get(structure_id, ()):
+            if isnan(value := column[slot]):
+                continue
+            count += 1
+            total += value
+            low = min(low, value)
+            high = max(high, value)
+        if not count:
+            return None
+        return {
+            'min': low,
+            'max': high,
+            'mean': round(total / count, 2),
+            'count': count,
+        }
+
+    def aggregates(self, structure_id: str) -> dict[str, dict[str, Any] | None]:
+        """Return the aggregate of every metric across a structure's devices."""
+
+        return {metric: self.aggregate(structure_id, metric) for metric in self.columns}
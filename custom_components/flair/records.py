@@ -0,0 +1,185 @@
+"""Compact records of the Flair resource fields read by entity state."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp, returning None if it isn't set."""
+
+    return datetime.fromisoformat(value) if value else None
+
+
+def _reading(resource: Any) -> dict[str, Any]:
+    """Return the current reading of a device, or an empty dict if it wasn't fetched."""
+
+    # flairaio uses a placeholder string for readings it didn't fetch.
+    reading = getattr(resource, 'current_reading', None)
+    return reading if isinstance(reading, dict) else {}
+
+
+@dataclass(frozen=True, slots=True)
+class StructureRecord:
+    """Structure fields read by entity state."""
+
+    name: str
+    mode: str
+    hold_until: datetime | None
+    heat_cool_mode: str | None
+    set_point_temperature_c: float | None
+
+    @classmethod
+    def from_resource(cls, structure: Any) -> StructureRecord:
+        """Project a structure."""
+
+        attributes = structure.attributes
+        return cls(
+            name=attributes.get('name'),
+            mode=attributes.get('mode'),
+            hold_until=_parse_datetime(attributes.get('hold-until')),
+            heat_cool_mode=attributes.get('structure-heat-cool-mode'),
+            set_point_temperature_c=attributes.get('set-point-temperature-c'),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RoomRecord:
+    """Room fields read by entity state."""
+
+    name: str
+    hold_until: datetime | None
+    temperature_c: float | None
+    humidity: float | None
+    set_point_c: float | None
+
+    @classmethod
+    def from_resource(cls, room: Any) -> RoomRecord:
+        """Project a room."""
+
+        attributes = room.attributes
+        return cls(
+            name=attributes.get('name'),
+            hold_until=_parse_datetime(attributes.get('hold-until')),
+            temperature_c=attributes.get('current-temperature-c'),
+            humidity=attributes.get('current-humidity'),
+            set_point_c=attributes.get('set-point-c'),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PuckRecord:
+    """Puck fields read by entity state."""
+
+    name: str
+    inactive: bool
+    temperature_c: float | None
+    humidity: float | None
+    voltage: float | None
+    rssi: float | None
+    light: float | None
+    pressure: float | None
+
+    @classmethod
+    def from_resource(cls, puck: Any) -> PuckRecord:
+        """Project a puck."""
+
+        attributes = puck.attributes
+        reading = _reading(puck)
+        return cls(
+            name=attributes.get('name'),
+            inactive=attributes.get('inactive'),
+            temperature_c=attributes.get('current-temperature-c'),
+            humidity=attributes.get('current-humidity'),
+            voltage=attributes.get('voltage'),
+            rssi=attributes.get('current-rssi'),
+            light=reading.get('light'),
+            pressure=reading.get('room-pressure'),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VentRecord:
+    """Vent fields read by entity state."""
+
+    name: str
+    inactive: bool
+    voltage: float | None
+    rssi: float | None
+    duct_temperature_c: float | None
+    duct_pressure: float | None
+    reported_percent_open: int | None
+
+    @classmethod
+    def from_resource(cls, vent: Any) -> VentRecord:
+        """Project a vent."""
+
+        attributes = vent.attributes
+        reading = _reading(vent)
+        return cls(
+            name=attributes.get('name'),
+            inactive=attributes.get('inactive'),
+            voltage=attributes.get('voltage'),
+            rssi=attributes.get('current-rssi'),
+            duct_temperature_c=reading.get('duct-temperature-c'),
+            duct_pressure=reading.get('duct-pressure'),
+            reported_percent_open=reading.get('percent-open'),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BridgeRecord:
+    """Bridge fields read by entity state."""
+
+    name: str
+    inactive: bool
+    rssi: float | None
+
+    @classmethod
+    def from_resource(cls, bridge: Any) -> BridgeRecord:
+        """Project a bridge."""
+
+        attributes = bridge.attributes
+        return cls(
+            name=attributes.get('name'),
+            inactive=attributes.get('inactive'),
+            rssi=attributes.get('current-rssi'),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HVACUnitRecord:
+    """HVAC unit fields read by entity state."""
+
+    name: str
+    power: str | None
+    mode: str | None
+    fan_speed: str | None
+    swing: str | None
+    temperature: float | None
+
+    @classmethod
+    def from_resource(cls, hvac_unit: Any) -> HVACUnitRecord:
+        """Project an HVAC unit."""
+
+        attributes = hvac_unit.attributes
+        return cls(
+            name=attributes.get('name'),
+            power=attributes.get('power'),
+            mode=attributes.get('mode'),
+            fan_speed=attributes.get('fan-speed'),
+            swing=attributes.get('swing'),
+            temperature=attributes.get('temperature'),
+        )
+
+
+# Record type of every resource type that has one.
+RECORD_TYPES = {
+    "structures": StructureRecord,
+    "rooms": RoomRecord,
+    "pucks": PuckRecord,
+    "vents": VentRecord,
+    "bridges": BridgeRecord,
+    "hvac-units": HVACUnitRecord,
+}
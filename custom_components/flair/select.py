@@ -10,7 +10,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import(
     AWAY_MODES,
@@ -25,6 +24,8 @@ from .const import(
     TEMPERATURE_SCALES,
 )
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
 
 
 DEFAULT_HOLD_TO_FLAIR = {v: k for (k, v) in DEFAULT_HOLD_DURATION.items()}
@@ -38,45 +39,51 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Select Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[SelectEntity]:
+    """Create the select entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     selects = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
+    # Structures
+    selects.extend((
+        SystemMode(coordinator, structure_id),
+        HomeAwayMode(coordinator, structure_id),
+        HomeAwaySetBy(coordinator, structure_id),
+        DefaultHoldDuration(coordinator, structure_id),
+        SetPointController(coordinator, structure_id),
+        Schedule(coordinator, structure_id),
+        AwayMode(coordinator, structure_id),
+    ))
+
+    # Rooms
+    if structure_data.rooms:
+        for room_id, room_data in structure_data.rooms.items():
             selects.extend((
-                SystemMode(coordinator, structure_id),
-                HomeAwayMode(coordinator, structure_id),
-                HomeAwaySetBy(coordinator, structure_id),
-                DefaultHoldDuration(coordinator, structure_id),
-                SetPointController(coordinator, structure_id),
-                Schedule(coordinator, structure_id),
-                AwayMode(coordinator, structure_id),
+                RoomActivity(coordinator, structure_id, room_id),
             ))
 
-            # Rooms
-            if structure_data.rooms:
-                for room_id, room_data in structure_data.rooms.items():
-                    selects.extend((
-                        RoomActivity(coordinator, structure_id, room_id),
-                    ))
-
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    selects.extend((
-                        PuckBackground(coordinator, structure_id, puck_id),
-                        PuckTempScale(coordinator, structure_id, puck_id),
-                    ))
+    # Pucks
+    if structure_data.pucks:
+        for puck_id, puck_data in structure_data.pucks.items():
+            selects.extend((
+                PuckBackground(coordinator, structure_id, puck_id),
+                PuckTempScale(coordinator, structure_id, puck_id),
+            ))
 
-    async_add_entities(selects)
+    return selects
 
 
-class SystemMode(CoordinatorEntity, SelectEntity):
+class SystemMode(FlairEntity, SelectEntity):
     """Representation of System Mode."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -134,15 +141,20 @@ class SystemMode(CoordinatorEntity, SelectEntity):
 
         return SYSTEM_MODES
 
+    @property
+    def available(self) -> bool:
+        """Return true if the device still exists."""
+
+        return super().available and self.coordinator.has_resources(self.coordinator_context)
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
 
         lowercase_option = option[0].lower() + option[1:]
         attributes = self.set_attributes(str(lowercase_option))
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['mode'] = lowercase_option
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'mode': lowercase_option})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(mode: str) -> dict[str, str]:
@@ -154,11 +166,11 @@ class SystemMode(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class HomeAwayMode(CoordinatorEntity, SelectEntity):
+class HomeAwayMode(FlairEntity, SelectEntity):
     """Representation of Home/Away Mode."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -238,6 +250,9 @@ class HomeAwayMode(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -248,10 +263,9 @@ class HomeAwayMode(CoordinatorEntity, SelectEntity):
         """Change the selected option."""
 
         attributes = self.set_attributes(option)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['home'] = attributes['home']
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'home': attributes['home']})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(mode: str) -> dict[str, bool]:
@@ -269,11 +283,11 @@ class HomeAwayMode(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class HomeAwaySetBy(CoordinatorEntity, SelectEntity):
+class HomeAwaySetBy(FlairEntity, SelectEntity):
     """Representation of what sets Home/Away Mode."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -365,6 +379,9 @@ class HomeAwaySetBy(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -376,10 +393,9 @@ class HomeAwaySetBy(CoordinatorEntity, SelectEntity):
 
         ha_to_flair = HOME_AWAY_SET_BY_TO_FLAIR.get(option)
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['home-away-mode'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'home-away-mode': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(setter: str) -> dict[str, str]:
@@ -391,11 +407,11 @@ class HomeAwaySetBy(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class DefaultHoldDuration(CoordinatorEntity, SelectEntity):
+class DefaultHoldDuration(FlairEntity, SelectEntity):
     """Representation of default hold duration setting."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -477,6 +493,9 @@ class DefaultHoldDuration(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -488,10 +507,9 @@ class DefaultHoldDuration(CoordinatorEntity, SelectEntity):
 
         ha_to_flair = DEFAULT_HOLD_TO_FLAIR.get(option)
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['default-hold-duration'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'default-hold-duration': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(duration: str) -> dict[str, str]:
@@ -503,11 +521,11 @@ class DefaultHoldDuration(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class SetPointController(CoordinatorEntity, SelectEntity):
+class SetPointController(FlairEntity, SelectEntity):
     """Representation of set point controller setting."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -592,6 +610,9 @@ class SetPointController(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -603,10 +624,9 @@ class SetPointController(CoordinatorEntity, SelectEntity):
 
         ha_to_flair = SET_POINT_CONTROLLER_TO_FLAIR.get(option)
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['set-point-mode'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'set-point-mode': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(option: str) -> dict[str, str]:
@@ -618,11 +638,11 @@ class SetPointController(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class Schedule(CoordinatorEntity, SelectEntity):
+class Schedule(FlairEntity, SelectEntity):
     """Representation of available structure schedules."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -712,6 +732,9 @@ class Schedule(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -729,10 +752,9 @@ class Schedule(CoordinatorEntity, SelectEntity):
             ha_to_flair = schedule_name_to_id.get(option)
 
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['active-schedule-id'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'active-schedule-id': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(option: str) -> dict[str, str]:
@@ -744,11 +766,11 @@ class Schedule(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class AwayMode(CoordinatorEntity, SelectEntity):
+class AwayMode(FlairEntity, SelectEntity):
     """Representation of structure away mode setting."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -825,6 +847,9 @@ class AwayMode(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -835,10 +860,9 @@ class AwayMode(CoordinatorEntity, SelectEntity):
         """Change the selected option."""
 
         attributes = self.set_attributes(option)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-away-mode'] = option
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'structure-away-mode': option})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(option: str) -> dict[str, str]:
@@ -850,11 +874,11 @@ class AwayMode(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class RoomActivity(CoordinatorEntity, SelectEntity):
+class RoomActivity(FlairEntity, SelectEntity):
     """Representation of Flair room activity setting."""
 
     def __init__(self, coordinator, structure_id, room_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('rooms', room_id), ('structures', structure_id)))
         self.room_id = room_id
         self.structure_id = structure_id
 
@@ -862,7 +886,7 @@ class RoomActivity(CoordinatorEntity, SelectEntity):
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
+        return self.coordinator.topology.resource('rooms', self.room_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -940,6 +964,9 @@ class RoomActivity(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Marks entity as unavailable if system mode is set to Manual."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         system_mode = self.structure_data.attributes['mode']
         if system_mode == 'manual':
             return False
@@ -955,10 +982,9 @@ class RoomActivity(CoordinatorEntity, SelectEntity):
             ha_to_flair = False
 
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('rooms', self.room_data.id, attributes=attributes, relationships={})
-        self.room_data.attributes['active'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('rooms', self.room_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('rooms', self.room_data.id, {'active': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('rooms', self.room_data.id)
 
     @staticmethod
     def set_attributes(option: bool) -> dict[str, bool]:
@@ -970,11 +996,11 @@ class RoomActivity(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class PuckBackground(CoordinatorEntity, SelectEntity):
+class PuckBackground(FlairEntity, SelectEntity):
     """Representation of puck background color."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -982,7 +1008,7 @@ class PuckBackground(CoordinatorEntity, SelectEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1042,6 +1068,9 @@ class PuckBackground(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Return true if puck is active."""
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         if not self.puck_data.attributes['inactive']:
             return True
         else:
@@ -1052,10 +1081,9 @@ class PuckBackground(CoordinatorEntity, SelectEntity):
 
         ha_to_flair = option.lower()
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['puck-display-color'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('pucks', self.puck_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'puck-display-color': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('pucks', self.puck_data.id)
 
     @staticmethod
     def set_attributes(option: str) -> dict[str, str]:
@@ -1067,11 +1095,11 @@ class PuckBackground(CoordinatorEntity, SelectEntity):
         return attributes
 
 
-class PuckTempScale(CoordinatorEntity, SelectEntity):
+class PuckTempScale(FlairEntity, SelectEntity):
     """Representation of puck temp scale selection."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id), ('structures', structure_id)))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -1079,7 +1107,7 @@ class PuckTempScale(CoordinatorEntity, SelectEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -1149,15 +1177,20 @@ class PuckTempScale(CoordinatorEntity, SelectEntity):
 
         return list(TEMPERATURE_SCALES.values())
 
+    @property
+    def available(self) -> bool:
+        """Return true if the device still exists."""
+
+        return super().available and self.coordinator.has_resources(self.coordinator_context)
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
 
         ha_to_flair = TEMP_SCALE_TO_FLAIR.get(option)
         attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['temperature-scale'] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'temperature-scale': ha_to_flair})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     @staticmethod
     def set_attributes(option: str) -> dict[str, str]:
@@ -24,10 +24,12 @@ from homeassistant.const import(
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, TYPE_TO_MODEL
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
+from .records import BridgeRecord, PuckRecord, RoomRecord, StructureRecord, VentRecord
 
 
 async def async_setup_entry(
@@ -35,66 +37,72 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Sensor Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[SensorEntity]:
+    """Create the sensor entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     sensors = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
+    # Structures
+    sensors.extend((
+        HomeAwayHoldUntil(coordinator, structure_id),
+    ))
+
+    # Pucks
+    if structure_data.pucks:
+        for puck_id, puck_data in structure_data.pucks.items():
+            sensors.extend((
+                PuckTemp(coordinator, structure_id, puck_id),
+                PuckHumidity(coordinator, structure_id, puck_id),
+                PuckLight(coordinator, structure_id, puck_id),
+                PuckVoltage(coordinator, structure_id, puck_id),
+                PuckRSSI(coordinator, structure_id, puck_id),
+                PuckPressure(coordinator, structure_id, puck_id),
+                Gateway(coordinator, structure_id, puck_id, 'pucks')
+            ))
+    # Vents
+    if structure_data.vents:
+        for vent_id, vent_data in structure_data.vents.items():
             sensors.extend((
-                HomeAwayHoldUntil(coordinator, structure_id),
+                DuctTemp(coordinator, structure_id, vent_id),
+                DuctPressure(coordinator, structure_id, vent_id),
+                VentVoltage(coordinator, structure_id, vent_id),
+                VentRSSI(coordinator, structure_id, vent_id),
+                VentReportedState(coordinator, structure_id, vent_id),
+                Gateway(coordinator, structure_id, vent_id, 'vents')
             ))
+    # Rooms
+    if structure_data.rooms:
+        for room_id, room_data in structure_data.rooms.items():
+            sensors.extend((
+                HoldTempUntil(coordinator, structure_id, room_id),
+            ))
+
+    # HVAC Units with only button controls
+    if structure_data.hvac_units:
+        for hvac_id, hvac_data in structure_data.hvac_units.items():
+            constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
+            if isinstance(constraints, list):
+                sensors.append(LastButtonPressed(coordinator, structure_id, hvac_id))
+
+    # Bridges
+    if structure_data.bridges:
+        for bridge_id, bridge_data in structure_data.bridges.items():
+            sensors.append(BridgeRSSI(coordinator, structure_id, bridge_id))
+
+    return sensors
+
 
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    sensors.extend((
-                        PuckTemp(coordinator, structure_id, puck_id),
-                        PuckHumidity(coordinator, structure_id, puck_id),
-                        PuckLight(coordinator, structure_id, puck_id),
-                        PuckVoltage(coordinator, structure_id, puck_id),
-                        PuckRSSI(coordinator, structure_id, puck_id),
-                        PuckPressure(coordinator, structure_id, puck_id),
-                        Gateway(coordinator, structure_id, puck_id, 'pucks')
-                    ))
-            # Vents
-            if structure_data.vents:
-                for vent_id, vent_data in structure_data.vents.items():
-                    sensors.extend((
-                        DuctTemp(coordinator, structure_id, vent_id),
-                        DuctPressure(coordinator, structure_id, vent_id),
-                        VentVoltage(coordinator, structure_id, vent_id),
-                        VentRSSI(coordinator, structure_id, vent_id),
-                        VentReportedState(coordinator, structure_id, vent_id),
-                        Gateway(coordinator, structure_id, vent_id, 'vents')
-                    ))
-            # Rooms
-            if structure_data.rooms:
-                for room_id, room_data in structure_data.rooms.items():
-                    sensors.extend((
-                        HoldTempUntil(coordinator, structure_id, room_id),
-                    ))
-
-            # HVAC Units with only button controls
-            if structure_data.hvac_units:
-                for hvac_id, hvac_data in structure_data.hvac_units.items():
-                    constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
-                    if isinstance(constraints, list):
-                        sensors.append(LastButtonPressed(coordinator, structure_id, hvac_id))
-
-            # Bridges
-            if structure_data.bridges:
-                for bridge_id, bridge_data in structure_data.bridges.items():
-                    sensors.append(BridgeRSSI(coordinator, structure_id, bridge_id))
-
-    async_add_entities(sensors)
-
-
-class HomeAwayHoldUntil(CoordinatorEntity, SensorEntity):
+class HomeAwayHoldUntil(FlairEntity, SensorEntity):
     """Representation of default hold duration setting."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -103,6 +111,12 @@ class HomeAwayHoldUntil(CoordinatorEntity, SensorEntity):
 
         return self.coordinator.data.structures[self.structure_id]
 
+    @property
+    def structure_record(self) -> StructureRecord:
+        """Handle coordinator structure record."""
+
+        return self.coordinator.topology.record('structures', self.structure_id)
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device registry information for this entity."""
@@ -142,8 +156,7 @@ class HomeAwayHoldUntil(CoordinatorEntity, SensorEntity):
         than 'until next scheduled event'
         """
 
-        if self.structure_data.attributes['hold-until']:
-            return datetime.fromisoformat(self.structure_data.attributes['hold-until'])
+        return self.structure_record.hold_until
 
     @property
     def device_class(self) -> SensorDeviceClass:
@@ -169,17 +182,20 @@ class HomeAwayHoldUntil(CoordinatorEntity, SensorEntity):
         has a default hold duration other than next event.
         """
 
-        if self.structure_data.attributes['hold-until']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if self.structure_record.hold_until:
             return True
         else:
             return False
 
 
-class PuckTemp(CoordinatorEntity, SensorEntity):
+class PuckTemp(FlairEntity, SensorEntity):
     """Representation of Puck Temperature."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -187,7 +203,13 @@ class PuckTemp(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -223,7 +245,7 @@ class PuckTemp(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return current temperature in Celsius."""
 
-        return self.puck_data.attributes['current-temperature-c']
+        return self.puck_record.temperature_c
 
     @property
     def native_unit_of_measurement(self) -> UnitOfTemperature:
@@ -247,17 +269,20 @@ class PuckTemp(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class PuckHumidity(CoordinatorEntity, SensorEntity):
+class PuckHumidity(FlairEntity, SensorEntity):
     """Representation of Puck Humidity."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -265,7 +290,13 @@ class PuckHumidity(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -301,7 +332,7 @@ class PuckHumidity(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return current humidity."""
 
-        return self.puck_data.attributes['current-humidity']
+        return self.puck_record.humidity
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -325,17 +356,20 @@ class PuckHumidity(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class PuckLight(CoordinatorEntity, SensorEntity):
+class PuckLight(FlairEntity, SensorEntity):
     """Representation of Puck Light."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -343,7 +377,13 @@ class PuckLight(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -383,7 +423,7 @@ class PuckLight(CoordinatorEntity, SensorEntity):
         for 200 lux per Volt.
         """
 
-        return (self.puck_data.current_reading['light'] / 100) * 200
+        return (self.puck_record.light / 100) * 200
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -407,18 +447,21 @@ class PuckLight(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if (self.puck_data.attributes['inactive'] == False) and \
-                (self.puck_data.current_reading['light'] is not None):
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if (self.puck_record.inactive == False) and \
+                (self.puck_record.light is not None):
             return True
         else:
             return False
 
 
-class PuckVoltage(CoordinatorEntity, SensorEntity):
+class PuckVoltage(FlairEntity, SensorEntity):
     """Representation of Puck Voltage."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -426,7 +469,13 @@ class PuckVoltage(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -462,7 +511,7 @@ class PuckVoltage(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return voltage measurement."""
 
-        return self.puck_data.attributes['voltage']
+        return self.puck_record.voltage
 
     @property
     def native_unit_of_measurement(self) -> UnitOfElectricPotential:
@@ -492,17 +541,20 @@ class PuckVoltage(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class PuckRSSI(CoordinatorEntity, SensorEntity):
+class PuckRSSI(FlairEntity, SensorEntity):
     """Representation of Puck RSSI."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -510,7 +562,13 @@ class PuckRSSI(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -546,7 +604,7 @@ class PuckRSSI(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return RSSI reading."""
 
-        return self.puck_data.attributes['current-rssi']
+        return self.puck_record.rssi
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -576,17 +634,20 @@ class PuckRSSI(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class PuckPressure(CoordinatorEntity, SensorEntity):
+class PuckPressure(FlairEntity, SensorEntity):
     """Representation of Puck pressure reading."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -594,7 +655,13 @@ class PuckPressure(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -630,7 +697,7 @@ class PuckPressure(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float | None:
         """Return pressure reading."""
 
-        pressure = self.puck_data.current_reading.get('room-pressure')
+        pressure = self.puck_record.pressure
         return round(pressure, 2) if pressure else pressure
 
     @property
@@ -655,17 +722,20 @@ class PuckPressure(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class DuctTemp(CoordinatorEntity, SensorEntity):
+class DuctTemp(FlairEntity, SensorEntity):
     """Representation of Duct Temperature."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('vents', vent_id),))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -673,7 +743,13 @@ class DuctTemp(CoordinatorEntity, SensorEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
+
+    @property
+    def vent_record(self) -> VentRecord:
+        """Handle coordinator vent record."""
+
+        return self.coordinator.topology.record('vents', self.vent_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -709,7 +785,7 @@ class DuctTemp(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return current temperature in Celsius."""
 
-        return self.vent_data.current_reading['duct-temperature-c']
+        return self.vent_record.duct_temperature_c
 
     @property
     def native_unit_of_measurement(self) -> UnitOfTemperature:
@@ -733,17 +809,20 @@ class DuctTemp(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.vent_record.inactive:
             return True
         else:
             return False
 
 
-class DuctPressure(CoordinatorEntity, SensorEntity):
+class DuctPressure(FlairEntity, SensorEntity):
     """Representation of Duct Pressure."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('vents', vent_id),))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -751,7 +830,13 @@ class DuctPressure(CoordinatorEntity, SensorEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
+
+    @property
+    def vent_record(self) -> VentRecord:
+        """Handle coordinator vent record."""
+
+        return self.coordinator.topology.record('vents', self.vent_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -787,7 +872,7 @@ class DuctPressure(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float | None:
         """Return current pressure in kPa."""
 
-        pressure = self.vent_data.current_reading.get('duct-pressure')
+        pressure = self.vent_record.duct_pressure
         return round(pressure, 2) if pressure else pressure
 
     @property
@@ -812,17 +897,20 @@ class DuctPressure(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.vent_record.inactive:
             return True
         else:
             return False
 
 
-class VentVoltage(CoordinatorEntity, SensorEntity):
+class VentVoltage(FlairEntity, SensorEntity):
     """Representation of Vent Voltage."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('vents', vent_id),))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -831,7 +919,13 @@ class VentVoltage(CoordinatorEntity, SensorEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
+
+    @property
+    def vent_record(self) -> VentRecord:
+        """Handle coordinator vent record."""
+
+        return self.coordinator.topology.record('vents', self.vent_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -867,7 +961,7 @@ class VentVoltage(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return voltage measurement."""
 
-        return self.vent_data.attributes['voltage']
+        return self.vent_record.voltage
 
     @property
     def native_unit_of_measurement(self) -> UnitOfElectricPotential:
@@ -897,17 +991,20 @@ class VentVoltage(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.vent_record.inactive:
             return True
         else:
             return False
 
 
-class VentRSSI(CoordinatorEntity, SensorEntity):
+class VentRSSI(FlairEntity, SensorEntity):
     """Representation of Vent RSSI."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('vents', vent_id),))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -915,7 +1012,13 @@ class VentRSSI(CoordinatorEntity, SensorEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
+
+    @property
+    def vent_record(self) -> VentRecord:
+        """Handle coordinator vent record."""
+
+        return self.coordinator.topology.record('vents', self.vent_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -951,7 +1054,7 @@ class VentRSSI(CoordinatorEntity, SensorEntity):
     def native_value(self) -> int:
         """Return RSSI reading."""
 
-        return self.vent_data.attributes['current-rssi']
+        return self.vent_record.rssi
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -981,17 +1084,20 @@ class VentRSSI(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.vent_record.inactive:
             return True
         else:
             return False
 
 
-class VentReportedState(CoordinatorEntity, SensorEntity):
+class VentReportedState(FlairEntity, SensorEntity):
     """Representation of Vent RSSI."""
 
     def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('vents', vent_id),))
         self.vent_id = vent_id
         self.structure_id = structure_id
 
@@ -999,7 +1105,13 @@ class VentReportedState(CoordinatorEntity, SensorEntity):
     def vent_data(self) -> Vent:
         """Handle coordinator vent data."""
 
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
+        return self.coordinator.topology.resource('vents', self.vent_id)
+
+    @property
+    def vent_record(self) -> VentRecord:
+        """Handle coordinator vent record."""
+
+        return self.coordinator.topology.record('vents', self.vent_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1035,7 +1147,7 @@ class VentReportedState(CoordinatorEntity, SensorEntity):
     def native_value(self) -> int:
         """Return the most recent percent open reading as returned by sensors on vent."""
 
-        return self.vent_data.current_reading['percent-open']
+        return self.vent_record.reported_percent_open
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -1059,17 +1171,20 @@ class VentReportedState(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.vent_record.inactive:
             return True
         else:
             return False
 
 
-class HoldTempUntil(CoordinatorEntity, SensorEntity):
+class HoldTempUntil(FlairEntity, SensorEntity):
     """Representation of Room Temperature Hold End Time."""
 
     def __init__(self, coordinator, structure_id, room_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('rooms', room_id), ('structures', structure_id)))
         self.room_id = room_id
         self.structure_id = structure_id
 
@@ -1078,7 +1193,13 @@ class HoldTempUntil(CoordinatorEntity, SensorEntity):
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
+        return self.coordinator.topology.resource('rooms', self.room_id)
+
+    @property
+    def room_record(self) -> RoomRecord:
+        """Handle coordinator room record."""
+
+        return self.coordinator.topology.record('rooms', self.room_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -1124,8 +1245,7 @@ class HoldTempUntil(CoordinatorEntity, SensorEntity):
         returns date/time when hold will end.
         """
 
-        if self.room_data.attributes['hold-until']:
-            return datetime.fromisoformat(self.room_data.attributes['hold-until'])
+        return self.room_record.hold_until
 
     @property
     def device_class(self) -> SensorDeviceClass:
@@ -1152,17 +1272,20 @@ class HoldTempUntil(CoordinatorEntity, SensorEntity):
         other than next event.
         """
 
-        if self.room_data.attributes['hold-until']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if self.room_record.hold_until:
             return True
         else:
             return False
 
 
-class LastButtonPressed(CoordinatorEntity, SensorEntity):
+class LastButtonPressed(FlairEntity, SensorEntity):
     """Representation of last button pressed on HVAC unit with only button control."""
 
     def __init__(self, coordinator, structure_id, hvac_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('hvac-units', hvac_id), ('hvac-units', hvac_id, 'puck')))
         self.hvac_id = hvac_id
         self.structure_id = structure_id
 
@@ -1170,7 +1293,7 @@ class LastButtonPressed(CoordinatorEntity, SensorEntity):
     def hvac_data(self) -> HVACUnit:
         """Handle coordinator HVAC unit data."""
 
-        return self.coordinator.data.structures[self.structure_id].hvac_units[self.hvac_id]
+        return self.coordinator.topology.resource('hvac-units', self.hvac_id)
 
     @property
     def structure_data(self) -> Structure:
@@ -1182,8 +1305,13 @@ class LastButtonPressed(CoordinatorEntity, SensorEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        puck_id = self.hvac_data.relationships['puck']['data']['id']
-        return self.coordinator.data.structures[self.structure_id].pucks[puck_id]
+        return self.coordinator.topology.related('hvac-units', self.hvac_id, 'puck')
+
+    @property
+    def puck_record(self) -> PuckRecord:
+        """Handle coordinator puck record."""
+
+        return self.coordinator.topology.record('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1235,17 +1363,20 @@ class LastButtonPressed(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if associated puck is available."""
 
-        if not self.puck_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.puck_record.inactive:
             return True
         else:
             return False
 
 
-class BridgeRSSI(CoordinatorEntity, SensorEntity):
+class BridgeRSSI(FlairEntity, SensorEntity):
     """Representation of Bridge RSSI."""
 
     def __init__(self, coordinator, structure_id, bridge_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('bridges', bridge_id),))
         self.bridge_id = bridge_id
         self.structure_id = structure_id
 
@@ -1253,7 +1384,13 @@ class BridgeRSSI(CoordinatorEntity, SensorEntity):
     def bridge_data(self) -> Bridge:
         """Handle coordinator bridge data."""
 
-        return self.coordinator.data.structures[self.structure_id].bridges[self.bridge_id]
+        return self.coordinator.topology.resource('bridges', self.bridge_id)
+
+    @property
+    def bridge_record(self) -> BridgeRecord:
+        """Handle coordinator bridge record."""
+
+        return self.coordinator.topology.record('bridges', self.bridge_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1289,7 +1426,7 @@ class BridgeRSSI(CoordinatorEntity, SensorEntity):
     def native_value(self) -> float:
         """Return RSSI reading."""
 
-        return self.bridge_data.attributes['current-rssi']
+        return self.bridge_record.rssi
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -1319,17 +1456,21 @@ class BridgeRSSI(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.bridge_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.bridge_record.inactive:
             return True
         else:
             return False
 
 
-class Gateway(CoordinatorEntity, SensorEntity):
+class Gateway(FlairEntity, SensorEntity):
     """Representation of device's associated gateway."""
 
     def __init__(self, coordinator, structure_id, device_id, device_type):
-        super().__init__(coordinator)
+        # The gateway's name is shown, so renaming the gateway updates this entity too.
+        super().__init__(coordinator, context=((device_type, device_id), (device_type, device_id, 'gateway')))
         self.device_id = device_id
         self.device_type = device_type
         self.structure_id = structure_id
@@ -1344,10 +1485,13 @@ class Gateway(CoordinatorEntity, SensorEntity):
     def device_data(self) -> Puck | Vent:
         """Handle coordinator device data."""
 
-        if self.device_type == 'pucks':
-            return self.structure_data.pucks[self.device_id]
-        else:
-            return self.structure_data.vents[self.device_id]
+        return self.coordinator.topology.resource(self.device_type, self.device_id)
+
+    @property
+    def device_record(self) -> PuckRecord | VentRecord:
+        """Handle coordinator device record."""
+
+        return self.coordinator.topology.record(self.device_type, self.device_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -1395,7 +1539,10 @@ class Gateway(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return true if device is available."""
 
-        if not self.device_data.attributes['inactive']:
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
+        if not self.device_record.inactive:
             return True
         else:
             return False
@@ -1410,20 +1557,8 @@ class Gateway(CoordinatorEntity, SensorEntity):
             if connected_gateway_id == self.device_data.id:
                 return 'Self'
             else:
-                if connected_gateway_type == 'puck':
-                    if gateway := self.structure_data.pucks.get(connected_gateway_id):
-                        return gateway.attributes['name']
-                    # If the gateway isn't found
-                    else:
-                        return None
-                elif connected_gateway_type == 'bridge':
-                    if gateway := self.structure_data.bridges.get(connected_gateway_id):
-                        return gateway.attributes['name']
-                    # If gateway isn't found
-                    else:
-                        return None
-                else:
-                    return None
+                # None if the gateway isn't found
+                return self.coordinator.topology.gateway_names.get((connected_gateway_type, connected_gateway_id))
         else:
             return None
         
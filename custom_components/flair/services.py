@@ -0,0 +1,234 @@
+"""Services for the Flair integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from flairaio.exceptions import FlairError
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    BULK_UPDATE_CONCURRENCY,
+    BULK_UPDATE_TYPES,
+    DOMAIN,
+    LOGGER,
+    PROFILE_ATTRIBUTES,
+    SERVICE_APPLY_PROFILE,
+    SERVICE_BULK_UPDATE,
+    SERVICE_SAVE_PROFILE,
+)
+from .coordinator import FlairDataUpdateCoordinator
+from .storage import ProfileStore
+from .util import ResourceKey
+
+BULK_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Required("updates"): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required("type"): vol.In(BULK_UPDATE_TYPES),
+                        vol.Required("id"): cv.string,
+                        vol.Required("attributes"): vol.All(dict, vol.Length(min=1)),
+                    }
+                )
+            ],
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required("structure_id"): cv.string,
+        vol.Required("name"): cv.string,
+    }
+)
+
+
+def find_coordinator(hass: HomeAssistant, resource_type: str, resource_id: str) -> FlairDataUpdateCoordinator | None:
+    """Return the coordinator whose snapshot holds a resource, if any."""
+
+    for coordinators in hass.data.get(DOMAIN, {}).values():
+        for coordinator in dict.fromkeys(coordinators.values()):
+            if (resource_type, resource_id) in coordinator.topology.resources:
+                return coordinator
+    return None
+
+
+async def async_write_targets(
+    hass: HomeAssistant, targets: list[tuple[str, str, dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    """Write (type, id, attributes) targets and refresh once at the end if anything was sent.
+
+    Targets are written concurrently, BULK_UPDATE_CONCURRENCY at a time.
+    A failing target doesn't stop the others. Returns a result for every
+    target, carrying its error if it failed and whether it was queued for
+    retry as Flair couldn't be reached.
+    """
+
+    semaphore = asyncio.Semaphore(BULK_UPDATE_CONCURRENCY)
+    written: dict[FlairDataUpdateCoordinator, set[ResourceKey]] = {}
+
+    async def async_write_target(resource_type: str, resource_id: str, attributes: dict[str, Any]) -> dict[str, Any]:
+        """Write a single target."""
+
+        result: dict[str, Any] = {"type": resource_type, "id": resource_id, "success": False}
+        if (coordinator := find_coordinator(hass, resource_type, resource_id)) is None:
+            result["error"] = "Unknown resource"
+            return result
+        async with semaphore:
+            try:
+                await coordinator.async_write(resource_type, resource_id, attributes)
+            except FlairError as error:
+                LOGGER.error(f'Updating Flair {resource_type} {resource_id} failed: {error}')
+                result["error"] = str(error)
+                return result
+        coordinator.async_set_pending(resource_type, resource_id, attributes)
+        # Writes that wouldn't change anything or were queued for retry need no refresh.
+        if (resource_type, resource_id) in coordinator.unconfirmed_writes:
+            written.setdefault(coordinator, set()).add((resource_type, resource_id))
+        result["success"] = True
+        result["queued"] = (resource_type, resource_id) in coordinator.journal
+        return result
+
+    results = await asyncio.gather(*(async_write_target(*target) for target in targets))
+    for coordinator, keys in written.items():
+        coordinator.unconfirmed_writes -= keys
+        await coordinator.async_request_refresh()
+    return list(results)
+
+
+def capture_profile(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> dict[str, dict[str, Any]]:
+    """Capture the PROFILE_ATTRIBUTES of a structure and its rooms and vents."""
+
+    profile: dict[str, dict[str, Any]] = {}
+    topology = coordinator.topology
+    for key, resource in topology.resources.items():
+        resource_type, resource_id = key
+        if resource_type not in PROFILE_ATTRIBUTES or topology.structures[key] != structure_id:
+            continue
+        profile[f'{resource_type}/{resource_id}'] = {
+            attribute: resource.attributes[attribute]
+            for attribute in PROFILE_ATTRIBUTES[resource_type]
+            if attribute in resource.attributes
+        }
+    return profile
+
+
+def profile_changes(
+    coordinator: FlairDataUpdateCoordinator, profile: dict[str, dict[str, Any]]
+) -> tuple[list[tuple[str, str, dict[str, Any]]], int]:
+    """Return the attributes of a profile that differ from the current snapshot.
+
+    Changes are returned as one (type, id, attributes) target per resource.
+    Also returns the number of resources in the profile that no longer exist.
+    """
+
+    targets: list[tuple[str, str, dict[str, Any]]] = []
+    missing = 0
+    for resource_key, attributes in profile.items():
+        resource_type, resource_id = resource_key.split('/', 1)
+        if (resource := coordinator.topology.resources.get((resource_type, resource_id))) is None:
+            missing += 1
+            continue
+        # Snapshots include values written but not confirmed yet.
+        changes = {
+            attribute: value for attribute, value in attributes.items()
+            if resource.attributes.get(attribute) != value
+        }
+        if changes:
+            targets.append((resource_type, resource_id, changes))
+    return targets, missing
+
+
+def structure_coordinator(hass: HomeAssistant, structure_id: str) -> FlairDataUpdateCoordinator:
+    """Return the coordinator of a structure. Raises HomeAssistantError if there is none."""
+
+    if (coordinator := find_coordinator(hass, 'structures', structure_id)) is None:
+        raise HomeAssistantError(f'Unknown Flair structure {structure_id}')
+    return coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Flair services."""
+
+    profiles = ProfileStore(hass)
+
+    async def async_bulk_update(call: ServiceCall) -> ServiceResponse:
+        """Write attributes to many resources at once and refresh once at the end."""
+
+        if not hass.data.get(DOMAIN):
+            raise HomeAssistantError("No Flair accounts are set up")
+
+        results = await async_write_targets(
+            hass, [(update["type"], update["id"], update["attributes"]) for update in call.data["updates"]]
+        )
+
+        if call.return_response:
+            return {"results": results}
+        return None
+
+    async def async_save_profile(call: ServiceCall) -> ServiceResponse:
+        """Save the current settings of a structure as a profile."""
+
+        structure_id, name = call.data["structure_id"], call.data["name"]
+        profile = capture_profile(structure_coordinator(hass, structure_id), structure_id)
+        await profiles.async_set(structure_id, name, profile)
+
+        if call.return_response:
+            return {"resources": len(profile)}
+        return None
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Apply a saved profile, writing only the attributes that differ.
+
+        Structure settings are written first as they decide which room
+        and vent settings Flair accepts.
+        """
+
+        structure_id, name = call.data["structure_id"], call.data["name"]
+        coordinator = structure_coordinator(hass, structure_id)
+        if (profile := await profiles.async_get(structure_id, name)) is None:
+            raise HomeAssistantError(f'No Flair profile named {name} for structure {structure_id}')
+
+        targets, missing = profile_changes(coordinator, profile)
+        structure_targets = [target for target in targets if target[0] == 'structures']
+        results = await async_write_targets(hass, structure_targets)
+        results += await async_write_targets(hass, [target for target in targets if target[0] != 'structures'])
+        LOGGER.debug(f'Applied Flair profile {name} to structure {structure_id}: {len(targets)} resources changed')
+
+        if call.return_response:
+            return {
+                "results": results,
+                "unchanged": len(profile) - len(targets) - missing,
+                "missing": missing,
+            }
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_UPDATE,
+        async_bulk_update,
+        schema=BULK_UPDATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PROFILE,
+        async_save_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
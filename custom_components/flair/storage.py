@@ -0,0 +1,249 @@
+"""Persisted snapshots for the Flair integration."""
+from __future__ import annotations
+
+from time import time
+from typing import Any
+
+from flairaio.model import FlairData
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER, STORAGE_SAVE_DELAY, STORAGE_VERSION, WRITE_QUEUE_TTL
+from .util import ResourceKey, restore_snapshot
+
+
+class SnapshotStore:
+    """Last good snapshot of a config entry, shared by all of its coordinators.
+
+    Coordinators bound to a single structure only replace that structure.
+    The snapshot dataclasses are never mutated once published, so they are
+    handed to storage as is and serialized in the executor when written.
+
+    The ids of the structures on the account are saved along with the
+    snapshot when they are known, as the snapshot may not have every one.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f'{DOMAIN}.{entry_id}')
+        self._data: FlairData | None = None
+        self._save_scheduled = False
+        self.structure_ids: list[str] | None = None
+
+    async def async_load(self) -> FlairData | None:
+        """Load the saved snapshot, if there is a usable one."""
+
+        if (stored := await self._store.async_load()) is None:
+            return None
+        self.structure_ids = stored.get('structure_ids')
+        try:
+            self._data = restore_snapshot(stored)
+        except (KeyError, TypeError) as error:
+            LOGGER.warning(f'Ignoring saved Flair snapshot that could not be restored: {error}')
+            return None
+        return self._data
+
+    @callback
+    def async_save(self, data: FlairData, structure_id: str | None = None) -> None:
+        """Schedule saving a snapshot fetched for the whole account or a single structure.
+
+        Structures that are no longer on the account aren't saved.
+        """
+
+        if structure_id is not None and self.structure_ids is not None and structure_id not in self.structure_ids:
+            return
+        if structure_id is None:
+            self._data = data
+            self.structure_ids = list(data.structures)
+        elif self._data is None:
+            self._data = data
+        else:
+            self._data = FlairData(
+                # Only one of the structure coordinators fetches the users.
+                users=data.users or self._data.users,
+                structures={**self._data.structures, structure_id: data.structures[structure_id]},
+            )
+
+        # The latest snapshot is read when the delayed save runs.
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot to write."""
+
+        self._save_scheduled = False
+        return {
+            'users': self._data.users,
+            'structures': self._data.structures,
+            'structure_ids': self.structure_ids,
+        }
+
+    async def async_set_structure_ids(self, structure_ids: list[str]) -> None:
+        """Save the structures on the account, dropping the snapshots of structures that are gone."""
+
+        self.structure_ids = structure_ids
+        if self._data is not None:
+            self._data = FlairData(
+                users=self._data.users,
+                structures={
+                    structure_id: structure for structure_id, structure in self._data.structures.items()
+                    if structure_id in structure_ids
+                },
+            )
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the saved snapshot."""
+
+        await self._store.async_remove()
+
+
+class ProfileStore:
+    """Structure profiles saved by the profile services.
+
+    Profiles are stored by structure id and profile name. Each profile maps
+    'type/id' resource keys to the attributes captured from the resource.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profile store."""
+
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f'{DOMAIN}.profiles')
+        self._profiles: dict[str, dict[str, dict[str, dict[str, Any]]]] | None = None
+
+    async def _async_profiles(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """Return all profiles, loading them on first use."""
+
+        if self._profiles is None:
+            self._profiles = await self._store.async_load() or {}
+        return self._profiles
+
+    async def async_get(self, structure_id: str, name: str) -> dict[str, dict[str, Any]] | None:
+        """Return a saved profile, or None if there is no such profile."""
+
+        return (await self._async_profiles()).get(structure_id, {}).get(name)
+
+    async def async_set(self, structure_id: str, name: str, profile: dict[str, dict[str, Any]]) -> None:
+        """Save a profile, replacing any profile with the same name."""
+
+        profiles = await self._async_profiles()
+        profiles.setdefault(structure_id, {})[name] = profile
+        await self._store.async_save(profiles)
+
+
+class WriteJournal:
+    """Writes waiting to be retried, shared by all coordinators of a config entry.
+
+    Writes are stored by 'type/id' resource key as the attributes and
+    relationships still to be written, along with the wall clock time they
+    expire at. A newer value for a queued attribute replaces the queued one.
+    The journal is saved right away so queued writes survive a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the write journal."""
+
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f'{DOMAIN}.{entry_id}.writes')
+        self._writes: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the writes that were queued before a restart."""
+
+        self._writes = await self._store.async_load() or {}
+
+    def __contains__(self, key: ResourceKey) -> bool:
+        """Return whether writes are queued for a resource."""
+
+        return f'{key[0]}/{key[1]}' in self._writes
+
+    def __len__(self) -> int:
+        """Return the number of resources with queued writes."""
+
+        return len(self._writes)
+
+    def keys(self) -> list[ResourceKey]:
+        """Return the resources with queued writes."""
+
+        return [tuple(resource_key.split('/', 1)) for resource_key in self._writes]
+
+    def get(self, key: ResourceKey) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Return the queued attributes and relationships of a resource, if any."""
+
+        if (write := self._writes.get(f'{key[0]}/{key[1]}')) is None:
+            return None
+        return write['attributes'], write['relationships']
+
+    @callback
+    def async_add(self, key: ResourceKey, attributes: dict[str, Any], relationships: dict[str, Any]) -> None:
+        """Queue a write, replacing values queued for the same attributes."""
+
+        write = self._writes.setdefault(f'{key[0]}/{key[1]}', {'attributes': {}, 'relationships': {}})
+        write['attributes'].update(attributes)
+        write['relationships'].update(relationships)
+        write['expires'] = time() + WRITE_QUEUE_TTL
+        self._async_save()
+
+    @callback
+    def async_mark_written(self, key: ResourceKey, attributes: dict[str, Any], relationships: dict[str, Any]) -> None:
+        """Remove written values, keeping the values that replaced them while they were sent."""
+
+        resource_key = f'{key[0]}/{key[1]}'
+        if (write := self._writes.get(resource_key)) is None:
+            return
+        for queued, written in ((write['attributes'], attributes), (write['relationships'], relationships)):
+            for name, value in written.items():
+                if name in queued and queued[name] == value:
+                    del queued[name]
+        if not write['attributes'] and not write['relationships']:
+            del self._writes[resource_key]
+        self._async_save()
+
+    @callback
+    def async_expire(self) -> list[tuple[ResourceKey, dict[str, Any]]]:
+        """Drop the writes that are older than WRITE_QUEUE_TTL and return their resources and attributes."""
+
+        now = time()
+        expired = [resource_key for resource_key, write in self._writes.items() if write['expires'] <= now]
+        dropped = [
+            (tuple(resource_key.split('/', 1)), self._writes.pop(resource_key)['attributes'])
+            for resource_key in expired
+        ]
+        if dropped:
+            self._async_save()
+        return dropped
+
+    @callback
+    def _async_save(self) -> None:
+        """Schedule saving the journal."""
+
+        self._store.async_delay_save(self._data_to_save)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of the journal to write.
+
+        The journal is serialized in the executor while it may still change.
+        """
+
+        return {
+            resource_key: {
+                'attributes': dict(write['attributes']),
+                'relationships': dict(write['relationships']),
+                'expires': write['expires'],
+            }
+            for resource_key, write in self._writes.items()
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queued writes for diagnostics."""
+
+        return {'queued_resources': len(self._writes)}
+
+    async def async_remove(self) -> None:
+        """Remove the saved journal."""
+
+        await self._store.async_remove()
@@ -9,10 +9,11 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LOGGER
 from .coordinator import FlairDataUpdateCoordinator
+from .discovery import async_setup_entity_discovery
+from .entity import FlairEntity
 
 
 async def async_setup_entry(
@@ -20,33 +21,39 @@ async def async_setup_entry(
 ) -> None:
     """Set Up Flair Switch Entities."""
 
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[str, FlairDataUpdateCoordinator] = hass.data[DOMAIN][entry.entry_id]
 
+    async_setup_entity_discovery(entry, coordinators, async_add_entities, build_entities)
+
+
+def build_entities(coordinator: FlairDataUpdateCoordinator, structure_id: str) -> list[SwitchEntity]:
+    """Create the switch entities of a structure."""
+
+    structure_data = coordinator.data.structures[structure_id]
     switches = []
 
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
-            if structure_data.hvac_units:
-                switches.extend((
-                    LockIR(coordinator, structure_id),
-                    NetworkRepair(coordinator, structure_id)
-                ))
-            
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    switches.extend((
-                        PuckLock(coordinator, structure_id, puck_id),
-                    ))
-
-    async_add_entities(switches)
-
-
-class LockIR(CoordinatorEntity, SwitchEntity):
+    # Structures
+    if structure_data.hvac_units:
+        switches.extend((
+            LockIR(coordinator, structure_id),
+            NetworkRepair(coordinator, structure_id)
+        ))
+        
+    # Pucks
+    if structure_data.pucks:
+        for puck_id, puck_data in structure_data.pucks.items():
+            switches.extend((
+                PuckLock(coordinator, structure_id, puck_id),
+            ))
+
+    return switches
+
+
+class LockIR(FlairEntity, SwitchEntity):
     """Representation of Structure HVAC IR lock."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -102,30 +109,34 @@ class LockIR(CoordinatorEntity, SwitchEntity):
 
         return self.structure_data.attributes['hvac-unit-group-lock']
 
+    @property
+    def available(self) -> bool:
+        """Return true if the device still exists."""
+
+        return super().available and self.coordinator.has_resources(self.coordinator_context)
+
     async def async_turn_on(self, **kwargs) -> None:
         """Lock the IR devices."""
 
         attributes = {"hvac-unit-group-lock": True}
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['hvac-unit-group-lock'] = True
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'hvac-unit-group-lock': True})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Unlock the IR devices."""
 
         attributes = {"hvac-unit-group-lock": False}
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['hvac-unit-group-lock'] = False
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'hvac-unit-group-lock': False})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
 
-class PuckLock(CoordinatorEntity, SwitchEntity):
+class PuckLock(FlairEntity, SwitchEntity):
     """Representation of puck lock switch."""
 
     def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('pucks', puck_id),))
         self.puck_id = puck_id
         self.structure_id = structure_id
 
@@ -133,7 +144,7 @@ class PuckLock(CoordinatorEntity, SwitchEntity):
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
+        return self.coordinator.topology.resource('pucks', self.puck_id)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -190,6 +201,9 @@ class PuckLock(CoordinatorEntity, SwitchEntity):
         isn't None within the Flair app.
         """
 
+        if not self.coordinator.has_resources(self.coordinator_context):
+            return False
+
         puck_inactive = self.puck_data.attributes['inactive']
         puck_locked = self.puck_data.attributes['locked']
 
@@ -202,26 +216,24 @@ class PuckLock(CoordinatorEntity, SwitchEntity):
         """Lock the puck."""
 
         attributes = {"locked": True}
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['locked'] = True
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('pucks', self.puck_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'locked': True})
+        await self.coordinator.async_request_resource_refresh('pucks', self.puck_data.id)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Unlock the puck."""
 
         attributes = {"locked": False}
-        await self.coordinator.client.update('pucks', self.puck_data.id, attributes=attributes, relationships={})
-        self.puck_data.attributes['locked'] = False
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('pucks', self.puck_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('pucks', self.puck_data.id, {'locked': False})
+        await self.coordinator.async_request_resource_refresh('pucks', self.puck_data.id)
 
 
-class NetworkRepair(CoordinatorEntity, SwitchEntity):
+class NetworkRepair(FlairEntity, SwitchEntity):
     """Representation of network repair switch."""
 
     def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(('structures', structure_id),))
         self.structure_id = structure_id
 
     @property
@@ -272,20 +284,24 @@ class NetworkRepair(CoordinatorEntity, SwitchEntity):
 
         return self.structure_data.attributes['setup-mode']
 
+    @property
+    def available(self) -> bool:
+        """Return true if the device still exists."""
+
+        return super().available and self.coordinator.has_resources(self.coordinator_context)
+
     async def async_turn_on(self, **kwargs) -> None:
         """Enable network repair mode."""
 
         attributes = {"setup-mode": True}
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['setup-mode'] = True
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'setup-mode': True})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Disable network repair mode."""
 
         attributes = {"setup-mode": False}
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['setup-mode'] = False
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write('structures', self.structure_data.id, attributes=attributes)
+        self.coordinator.async_set_pending('structures', self.structure_data.id, {'setup-mode': False})
+        await self.coordinator.async_request_resource_refresh('structures', self.structure_data.id)
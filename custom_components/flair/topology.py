@@ -0,0 +1,144 @@
+"""Index of Flair resources and the relationships between them."""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from flairaio.model import FlairData
+
+from .records import RECORD_TYPES
+from .util import ResourceKey, iter_resources
+
+# Gateway types as reported by the connected-gateway-type attribute.
+GATEWAY_TYPES = {
+    "pucks": "puck",
+    "bridges": "bridge",
+}
+GATEWAY_RESOURCE_TYPES = {gateway_type: resource_type for resource_type, gateway_type in GATEWAY_TYPES.items()}
+
+
+@dataclass(frozen=True)
+class Topology:
+    """Immutable index built once for every snapshot the coordinator publishes.
+
+    Resolves JSON:API relationships ahead of time so that entities don't have
+    to walk nested structures and relationship dictionaries on every access.
+    """
+
+    # Every resource by resource key.
+    resources: Mapping[ResourceKey, Any] = field(default_factory=dict)
+    # Id of the structure every resource belongs to.
+    structures: Mapping[ResourceKey, str] = field(default_factory=dict)
+    # Target of every to-one relationship, e.g. ('vents', vent_id, 'room'). The
+    # gateway a puck or vent connects through is indexed as its 'gateway'.
+    relations: Mapping[tuple[str, str, str], ResourceKey] = field(default_factory=dict)
+    # Reverse of relations by target and resource type, e.g. (('rooms', room_id), 'vents').
+    members: Mapping[tuple[ResourceKey, str], tuple[ResourceKey, ...]] = field(default_factory=dict)
+    # Name of every puck and bridge by gateway type and id, e.g. ('bridge', bridge_id).
+    gateway_names: Mapping[tuple[str, str], str] = field(default_factory=dict)
+    # Compact record of the fields entity state reads, for resource types that have one.
+    records: Mapping[ResourceKey, Any] = field(default_factory=dict)
+    # Last resource and record of resources that were removed since startup.
+    # Entities of removed resources read these until they are removed themselves.
+    removed: Mapping[ResourceKey, tuple[Any, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, data: FlairData, previous: Topology | None = None) -> Topology:
+        """Index a snapshot, carrying over the resources removed since the previous one.
+
+        Records of resources that are identical to the previous snapshot's,
+        which is the case for every resource that didn't change, are reused.
+        """
+
+        previous_resources = previous.resources if previous is not None else {}
+
+        resources: dict[ResourceKey, Any] = {}
+        structures: dict[ResourceKey, str] = {}
+        relations: dict[tuple[str, str, str], ResourceKey] = {}
+        members: defaultdict[tuple[ResourceKey, str], list[ResourceKey]] = defaultdict(list)
+        gateway_names: dict[tuple[str, str], str] = {}
+        records: dict[ResourceKey, Any] = {}
+
+        for structure_id, key, resource in iter_resources(data):
+            resources[key] = resource
+            structures[key] = structure_id
+            for relation, relationship in resource.relationships.items():
+                related = relationship.get('data') if isinstance(relationship, dict) else None
+                if isinstance(related, dict) and 'type' in related and 'id' in related:
+                    target = (related['type'], related['id'])
+                    relations[(*key, relation)] = target
+                    members[(target, key[0])].append(key)
+            gateway = GATEWAY_RESOURCE_TYPES.get(resource.attributes.get('connected-gateway-type'))
+            if gateway and (gateway_id := resource.attributes.get('connected-gateway-id')):
+                relations[(*key, 'gateway')] = (gateway, gateway_id)
+            if gateway_type := GATEWAY_TYPES.get(key[0]):
+                gateway_names[(gateway_type, key[1])] = resource.attributes.get('name')
+            if record_type := RECORD_TYPES.get(key[0]):
+                if previous_resources.get(key) is resource:
+                    records[key] = previous.records[key]
+                else:
+                    records[key] = record_type.from_resource(resource)
+
+        removed: dict[ResourceKey, tuple[Any, Any]] = {}
+        if previous is not None:
+            removed = {key: last for key, last in previous.removed.items() if key not in resources}
+            for key in previous.resources.keys() - resources.keys():
+                removed[key] = (previous.resources[key], previous.records.get(key))
+
+        return cls(
+            resources=MappingProxyType(resources),
+            structures=MappingProxyType(structures),
+            relations=MappingProxyType(relations),
+            members=MappingProxyType({target: tuple(keys) for target, keys in members.items()}),
+            gateway_names=MappingProxyType(gateway_names),
+            records=MappingProxyType(records),
+            removed=MappingProxyType(removed),
+        )
+
+    def resource(self, resource_type: str, resource_id: str) -> Any:
+        """Return a resource, or its last version if it was removed.
+
+        Raises KeyError if the resource was never part of a snapshot.
+        """
+
+        key = (resource_type, resource_id)
+        if (resource := self.resources.get(key)) is not None:
+            return resource
+        return self.removed[key][0]
+
+    def record(self, resource_type: str, resource_id: str) -> Any:
+        """Return the record of a resource, or its last record if it was removed.
+
+        Raises KeyError if the resource was never part of a snapshot.
+        """
+
+        key = (resource_type, resource_id)
+        if (record := self.records.get(key)) is not None:
+            return record
+        if (removed := self.removed[key][1]) is None:
+            raise KeyError(key)
+        return removed
+
+    def related(self, resource_type: str, resource_id: str, relation: str) -> Any | None:
+        """Return the target of a to-one relationship, or None if there isn't one."""
+
+        if (target := self.relations.get((resource_type, resource_id, relation))) is None:
+            return None
+        return self.resources.get(target)
+
+    def related_record(self, resource_type: str, resource_id: str, relation: str) -> Any | None:
+        """Return the record of the target of a to-one relationship, or None if there isn't one."""
+
+        if (target := self.relations.get((resource_type, resource_id, relation))) is None:
+            return None
+        return self.records.get(target)
+
+    def related_members(self, resource_type: str, resource_id: str, member_type: str) -> list[Any]:
+        """Return every resource of a type that relates to a resource, e.g. the vents of a room."""
+
+        return [
+            self.resources[key]
+            for key in self.members.get(((resource_type, resource_id), member_type), ())
+        ]
@@ -1,16 +1,49 @@
 """Utilities for Flair Integration"""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+import functools
+import json
+from typing import Any, TypeVar
+
 import async_timeout
 
 from flairaio import FlairClient
 from flairaio.exceptions import FlairAuthError
-from flairaio.model import Structure, User
+from flairaio.model import (
+    Bridge,
+    FlairData,
+    HVACUnit,
+    Puck,
+    Room,
+    Schedule,
+    Structure,
+    Thermostat,
+    User,
+    Vent,
+    Zone,
+)
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import LOGGER, FLAIR_ERRORS, TIMEOUT
+from .const import LOGGER, FLAIR_ERRORS, STRUCTURE_RESOURCES, TIMEOUT
+
+RESOURCE_MODELS = {
+    "rooms": Room,
+    "pucks": Puck,
+    "vents": Vent,
+    "bridges": Bridge,
+    "thermostats": Thermostat,
+    "hvac-units": HVACUnit,
+    "zones": Zone,
+    "schedules": Schedule,
+}
+
+_T = TypeVar("_T")
+
+# A Flair resource is identified by its JSON:API type and id, e.g. ('vents', '1234').
+ResourceKey = tuple[str, str]
 
 
 async def async_validate_api(hass: HomeAssistant, client_id: str, client_secret: str) -> bool:
@@ -46,6 +79,121 @@ async def async_validate_api(hass: HomeAssistant, client_id: str, client_secret:
     return True
 
 
+def iter_resources(data: FlairData) -> Iterator[tuple[str, ResourceKey, Any]]:
+    """Yield structure id, resource key and resource for every structure and related resource."""
+
+    for structure_id, structure in data.structures.items():
+        yield structure_id, (structure.type, structure_id), structure
+        for attribute in STRUCTURE_RESOURCES:
+            resources = getattr(structure, attribute)
+            # flairaio uses a placeholder string for collections it didn't fetch.
+            if not isinstance(resources, dict):
+                continue
+            for resource_id, resource in resources.items():
+                yield structure_id, (resource.type, resource_id), resource
+
+
+def resource_changed(old: Any, new: Any) -> bool:
+    """Determine if the server side state of a resource differs between two polls.
+
+    Only the resource's own payload is compared. Related resources nested
+    within a structure are compared separately.
+    """
+
+    if old is new:
+        return False
+    return (
+        old.attributes != new.attributes
+        or old.relationships != new.relationships
+        or getattr(old, 'current_reading', None) != getattr(new, 'current_reading', None)
+    )
+
+
+def generation_cached(method: Callable[[Any], _T]) -> property:
+    """Turn an entity method into a property cached per coordinator generation.
+
+    The value is computed once for every snapshot the coordinator publishes,
+    including snapshots published for pending writes, and recomputed after.
+    Only use it for values derived purely from coordinator data.
+    """
+
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Any) -> _T:
+        generation = self.coordinator.generation
+        cache: dict[str, tuple[int, Any]] = self.__dict__.setdefault('_generation_cache', {})
+        if (cached := cache.get(name)) is not None and cached[0] == generation:
+            return cached[1]
+        value = method(self)
+        cache[name] = (generation, value)
+        return value
+
+    return property(wrapper)
+
+
+def serialize_snapshot(data: Any) -> dict[str, Any]:
+    """Convert Flair dataclasses into plain JSON compatible objects."""
+
+    return json.loads(json.dumps(data, default=vars))
+
+
+def restore_snapshot(stored: dict[str, Any]) -> FlairData:
+    """Rebuild Flair dataclasses from a snapshot saved to storage."""
+
+    structures: dict[str, Structure] = {}
+    for structure_id, structure in stored['structures'].items():
+        collections = {
+            attribute: {
+                resource_id: RESOURCE_MODELS[resource_type](**resource)
+                for resource_id, resource in structure[attribute].items()
+            }
+            for attribute, resource_type in STRUCTURE_RESOURCES.items()
+        }
+        structures[structure_id] = Structure(
+            id=structure['id'],
+            attributes=structure['attributes'],
+            relationships=structure['relationships'],
+            **collections,
+        )
+    return FlairData(
+        users={user_id: User(**user) for user_id, user in stored['users'].items()},
+        structures=structures,
+    )
+
+
+def snapshot_diff(old: Any, new: Any, path: str = '') -> list[str]:
+    """Return one line for every value that differs between two snapshots.
+
+    Dictionaries are walked key by key so that only the changed leaves are
+    reported. Any other type (including lists) is compared as a whole.
+    """
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        lines: list[str] = []
+        for key in sorted(old.keys() | new.keys()):
+            key_path = f'{path}.{key}' if path else key
+            if key not in new:
+                lines.append(f'- {key_path}')
+            elif key not in old:
+                lines.append(f'+ {key_path}: {json.dumps(new[key])}')
+            else:
+                lines.extend(snapshot_diff(old[key], new[key], key_path))
+        return lines
+
+    if old != new:
+        return [f'~ {path}: {json.dumps(old)} -> {json.dumps(new)}']
+    return []
+
+
+def truncate(text: str, max_length: int) -> str:
+    """Cap text at max_length characters, noting how much was dropped."""
+
+    if len(text) <= max_length:
+        return text
+    return f'{text[:max_length]}... [truncated {len(text) - max_length} characters]'
+
+
 class NoUserError(Exception):
     """ No User from Flair API. """
 
@@ -0,0 +1,188 @@
+"""Helpers for the Flair tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from flairaio.exceptions import FlairError
+from flairaio.model import FlairData, Puck, Structure, Structures, Users, Vent
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.flair.const import CONF_NUMBER_WRITE_DELAY, DOMAIN, LOGGER, STRUCTURE_RESOURCES
+from custom_components.flair.coordinator import FlairDataUpdateCoordinator
+from custom_components.flair.storage import SnapshotStore, WriteJournal
+
+ENTRY_ID = "entry"
+STRUCTURE_ID = "structure"
+PUCK_ID = "puck"
+VENT_ID = "vent"
+
+
+class FakeClient:
+    """Flair client that serves a snapshot as if it was the account on Flair.
+
+    Writes are recorded and not applied to the snapshot. Values listed in
+    rejected are refused. Every request times out while available is False,
+    writes alone time out while accepting_writes is False and structures
+    listed in unreachable time out when fetched on their own.
+    """
+
+    def __init__(self, data: FlairData) -> None:
+        """Initialize the fake client with the account's snapshot."""
+
+        self.data = data
+        self.available = True
+        self.accepting_writes = True
+        self.unreachable: set[str] = set()
+        self.updates: list[tuple[str, str, dict[str, Any]]] = []
+        self.rejected: list[dict[str, Any]] = []
+
+    def _check_available(self) -> None:
+        """Time out if Flair can't be reached."""
+
+        if not self.available:
+            raise asyncio.TimeoutError
+
+    def _find(self, resource_type: str, resource_id: str) -> Any:
+        """Return a resource of the snapshot."""
+
+        for structure in self.data.structures.values():
+            if resource_type == 'structures' and structure.id == resource_id:
+                return structure
+            for attribute, collection_type in STRUCTURE_RESOURCES.items():
+                if collection_type == resource_type and resource_id in getattr(structure, attribute):
+                    return getattr(structure, attribute)[resource_id]
+        raise FlairError('Not Found')
+
+    async def get_users(self) -> Users:
+        """Return the users of the account."""
+
+        self._check_available()
+        return Users(users=self.data.users)
+
+    async def get_structures(self) -> Structures:
+        """Return the structures of the account."""
+
+        self._check_available()
+        return Structures(structures=dict(self.data.structures))
+
+    async def get_structure(self, structure_id: str) -> Structure:
+        """Return a single structure."""
+
+        self._check_available()
+        if structure_id in self.unreachable:
+            raise asyncio.TimeoutError
+        return self._find('structures', structure_id)
+
+    async def get_puck(self, puck_id: str) -> Puck:
+        """Return a copy of a single puck without its reading."""
+
+        self._check_available()
+        puck = self._find('pucks', puck_id)
+        return Puck(id=puck.id, attributes=dict(puck.attributes), relationships=dict(puck.relationships))
+
+    async def get_related(self, resource: Any, related_type: str) -> Any:
+        """Return the payloads of a structure's resources or the current reading of a device."""
+
+        self._check_available()
+        if related_type == 'current-reading':
+            return {'attributes': dict(self._find(resource.type, resource.id).current_reading)}
+        attribute = next(attribute for attribute, value in STRUCTURE_RESOURCES.items() if value == related_type)
+        return [
+            {'id': item.id, 'attributes': dict(item.attributes), 'relationships': dict(item.relationships)}
+            for item in getattr(self.data.structures[resource.id], attribute).values()
+        ]
+
+    async def update(
+            self, resource_type: str, item_id: str, attributes: dict[str, Any], relationships: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Record a write, raising FlairError if its attributes are rejected."""
+
+        self._check_available()
+        if not self.accepting_writes:
+            raise asyncio.TimeoutError
+        self.updates.append((resource_type, item_id, dict(attributes)))
+        if attributes in self.rejected:
+            self.rejected.remove(attributes)
+            raise FlairError('Unprocessable Entity: value out of range')
+        return {}
+
+
+def snapshot(puck_attributes: dict[str, Any], vent: bool = False) -> FlairData:
+    """Return a snapshot of a structure with a single puck and optionally a vent."""
+
+    puck = Puck(
+        id=PUCK_ID,
+        attributes={
+            'name': 'Puck', 'inactive': False, 'connected-gateway-id': None, 'connected-gateway-type': None,
+            **puck_attributes,
+        },
+        relationships={},
+        current_reading={},
+    )
+    vents = {}
+    if vent:
+        vents[VENT_ID] = Vent(
+            id=VENT_ID,
+            attributes={
+                'name': 'Vent', 'inactive': False, 'percent-open': 100, 'voltage': 3.0, 'current-rssi': -60,
+                'connected-gateway-id': None, 'connected-gateway-type': None,
+            },
+            relationships={},
+            current_reading={'duct-temperature-c': 20.0, 'duct-pressure': 100.0, 'percent-open': 100},
+        )
+    structure = Structure(
+        id=STRUCTURE_ID,
+        attributes={'name': 'Home', 'mode': 'manual'},
+        relationships={},
+        rooms={},
+        pucks={PUCK_ID: puck},
+        vents=vents,
+        bridges={},
+        thermostats={},
+        hvac_units={},
+        zones={},
+        schedules={},
+    )
+    return FlairData(users={}, structures={STRUCTURE_ID: structure})
+
+
+async def async_setup_coordinator(
+        hass: HomeAssistant, client: FakeClient, structure_id: str | None = None
+) -> FlairDataUpdateCoordinator:
+    """Return a coordinator that completed its first refresh against a fake client."""
+
+    entry = SimpleNamespace(entry_id=ENTRY_ID, options={CONF_NUMBER_WRITE_DELAY: 0})
+    coordinator = FlairDataUpdateCoordinator(
+        hass, entry, client, SnapshotStore(hass, ENTRY_ID), WriteJournal(hass, ENTRY_ID), structure_id
+    )
+    await coordinator.async_refresh()
+    return coordinator
+
+
+def entity_platform(hass: HomeAssistant, domain: str) -> EntityPlatform:
+    """Return a platform of the integration to add entities of a domain to."""
+
+    return EntityPlatform(
+        hass=hass,
+        logger=LOGGER,
+        domain=domain,
+        platform_name=DOMAIN,
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+
+
+async def async_add_entities(hass: HomeAssistant, domain: str, entities: Iterable[Entity]) -> list[Entity]:
+    """Add entities to Home Assistant as the integration's platform of a domain does."""
+
+    entities = list(entities)
+    await entity_platform(hass, domain).async_add_entities(entities)
+    return entities
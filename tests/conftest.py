@@ -0,0 +1,50 @@
+"""Fixtures for the Flair tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import inspect
+
+import pytest
+
+from homeassistant import bootstrap
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return a new event loop for a test."""
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def hass(event_loop: asyncio.AbstractEventLoop, tmp_path) -> Iterator[HomeAssistant]:
+    """Return a Home Assistant instance with its registries loaded, stopped after the test."""
+
+    # Home Assistant creates its storage directory on the first start.
+    (tmp_path / '.storage').mkdir()
+
+    async def async_start() -> HomeAssistant:
+        hass = HomeAssistant(str(tmp_path))
+        hass.config_entries = ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        return hass
+
+    hass = event_loop.run_until_complete(async_start())
+    yield hass
+    event_loop.run_until_complete(hass.async_stop(force=True))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run coroutine tests in the event loop of the hass fixture."""
+
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    pyfuncitem.funcargs['event_loop'].run_until_complete(pyfuncitem.obj(**arguments))
+    return True
@@ -0,0 +1,30 @@
+"""Tests for the compiled capabilities of Flair HVAC units."""
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from custom_components.flair.capabilities import hvac_capabilities
+
+ATTRIBUTES = {
+    'constraints': {'ON': {'COOL': {'ON': ['FAN AUTO', 'FAN HIGH']}, 'HEAT': {'OFF': ['FAN AUTO']}},
+                    'temperature-scale': 'C'},
+    'codesets': [],
+    'swing': 'On',
+}
+
+
+def test_capabilities_are_looked_up_by_attributes() -> None:
+    """Unchanged attributes aren't serialized again and equal attributes share compiled capabilities."""
+
+    attributes = {**ATTRIBUTES}
+    with patch('custom_components.flair.capabilities.json.dumps', wraps=json.dumps) as dumps:
+        capabilities = hvac_capabilities(attributes)
+        assert hvac_capabilities(attributes) is capabilities
+        assert dumps.call_count == 1
+
+        assert hvac_capabilities({**ATTRIBUTES}) is capabilities
+        assert dumps.call_count == 2
+
+    assert capabilities.fan_speeds == {'COOL': ('FAN AUTO', 'FAN HIGH'), 'HEAT': ('FAN AUTO',)}
+    assert capabilities.swing
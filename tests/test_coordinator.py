@@ -0,0 +1,114 @@
+"""Tests for the Flair coordinator."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic, time
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.flair.const import (
+    HISTORY_CAPACITY,
+    PENDING_WRITE_TTL,
+    WRITE_COALESCE_DELAY,
+    WRITE_QUEUE_TTL,
+)
+from custom_components.flair.history import ReadingHistory
+
+from .common import PUCK_ID, STRUCTURE_ID, FakeClient, async_setup_coordinator, snapshot
+
+KEY = ('pucks', PUCK_ID)
+
+
+def setpoint(coordinator) -> int:
+    """Return the low set-point bound the coordinator shows for the puck."""
+
+    return coordinator.topology.resources[KEY].attributes['setpoint-bound-low']
+
+
+async def test_rejected_scheduled_write_can_be_retried(hass: HomeAssistant) -> None:
+    """A value Flair rejected is no longer shown and writing it again is sent."""
+
+    client = FakeClient(snapshot({'setpoint-bound-low': 10}))
+    client.rejected.append({'setpoint-bound-low': 15})
+    coordinator = await async_setup_coordinator(hass, client)
+
+    # Set the way the number entities do.
+    coordinator.async_schedule_write(*KEY, {'setpoint-bound-low': 15})
+    coordinator.async_set_pending(*KEY, {'setpoint-bound-low': 15})
+    assert setpoint(coordinator) == 15
+    await asyncio.sleep(WRITE_COALESCE_DELAY * 4)
+
+    assert len(client.updates) == 1
+    assert setpoint(coordinator) == 10
+
+    coordinator.async_schedule_write(*KEY, {'setpoint-bound-low': 15})
+    coordinator.async_set_pending(*KEY, {'setpoint-bound-low': 15})
+    await asyncio.sleep(WRITE_COALESCE_DELAY * 4)
+
+    assert client.updates == [KEY + ({'setpoint-bound-low': 15},)] * 2
+    assert coordinator.suppressed_writes == 0
+    await coordinator.async_shutdown()
+
+
+async def test_resource_refresh_timeout_waits_for_next_poll(hass: HomeAssistant, caplog) -> None:
+    """A confirmation fetch that times out is logged at debug level and doesn't raise."""
+
+    client = FakeClient(snapshot({'setpoint-bound-low': 10}))
+    with patch('custom_components.flair.coordinator.RESOURCE_REFRESH_COOLDOWN', 0):
+        coordinator = await async_setup_coordinator(hass, client)
+    await coordinator.async_write(*KEY, {'setpoint-bound-low': 15})
+    generation = coordinator.generation
+
+    client.available = False
+    with caplog.at_level(logging.DEBUG, logger='custom_components.flair'):
+        await coordinator.async_request_resource_refresh(*KEY)
+        await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+
+    assert 'waiting for the next poll' in caplog.text
+    assert coordinator.generation == generation
+    await coordinator.async_shutdown()
+
+
+async def test_queued_write_is_shown_until_it_expires(hass: HomeAssistant) -> None:
+    """A queued value is shown past PENDING_WRITE_TTL and reverted once the write expires."""
+
+    client = FakeClient(snapshot({'setpoint-bound-low': 10}))
+    coordinator = await async_setup_coordinator(hass, client)
+    # Flair can't be reached, so writes are queued right away.
+    client.available = False
+    await coordinator.async_refresh()
+
+    assert await coordinator.async_write(*KEY, {'setpoint-bound-low': 15}) is None
+    coordinator.async_set_pending(*KEY, {'setpoint-bound-low': 15})
+    assert KEY in coordinator.journal
+
+    # Flair is back but writes still time out, so the write stays queued.
+    client.available = True
+    client.accepting_writes = False
+    with patch('custom_components.flair.coordinator.monotonic', return_value=monotonic() + PENDING_WRITE_TTL * 2):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert KEY in coordinator.journal
+        assert setpoint(coordinator) == 15
+
+        with patch('custom_components.flair.storage.time', return_value=time() + WRITE_QUEUE_TTL * 2):
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+        assert KEY not in coordinator.journal
+        assert setpoint(coordinator) == 10
+    await coordinator.async_shutdown()
+
+
+async def test_history_is_written_in_the_background(hass: HomeAssistant) -> None:
+    """Readings of a refresh are appended to the history before shutdown completes."""
+
+    coordinator = await async_setup_coordinator(hass, FakeClient(snapshot({}, vent=True)))
+    path = coordinator.histories[STRUCTURE_ID].path
+    await coordinator.async_shutdown()
+
+    readings = ReadingHistory(path, HISTORY_CAPACITY).readings()
+    vent_readings = [metrics[:2] for _, device_type, _, metrics in readings if device_type == 'vents']
+    assert vent_readings == [(20.0, 100.0)]
@@ -0,0 +1,124 @@
+"""Tests for the handling of Flair devices that are added or removed."""
+from __future__ import annotations
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+from flairaio.model import FlairData
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.flair import binary_sensor, cover, sensor
+from custom_components.flair.discovery import async_setup_entity_discovery
+
+from .common import (
+    STRUCTURE_ID,
+    VENT_ID,
+    FakeClient,
+    async_add_entities,
+    async_setup_coordinator,
+    entity_platform,
+    snapshot,
+)
+
+OTHER_ID = "other"
+
+
+async def test_entities_of_removed_vent_become_unavailable(hass: HomeAssistant) -> None:
+    """Entities of a removed vent are unavailable and don't stop other listeners."""
+
+    client = FakeClient(snapshot({}, vent=True))
+    coordinator = await async_setup_coordinator(hass, client)
+    entities = []
+    for domain, platform in (('binary_sensor', binary_sensor), ('cover', cover), ('sensor', sensor)):
+        entities += await async_add_entities(hass, domain, (
+            entity for entity in platform.build_entities(coordinator, STRUCTURE_ID)
+            if ('vents', VENT_ID) in entity.coordinator_context
+        ))
+    entity_ids = [entity.entity_id for entity in entities if entity.enabled]
+    assert entity_ids
+    assert all(hass.states.get(entity_id).state != STATE_UNAVAILABLE for entity_id in entity_ids)
+
+    # Registered last, like the device cleanup, and records the states it sees.
+    seen = []
+    coordinator.async_add_listener(lambda: seen.extend(hass.states.get(entity_id).state for entity_id in entity_ids))
+
+    client.data = snapshot({})
+    await coordinator.async_refresh()
+
+    # The cleanup ran before any entity was updated.
+    assert STATE_UNAVAILABLE not in seen
+    assert all(hass.states.get(entity_id).state == STATE_UNAVAILABLE for entity_id in entity_ids)
+    await coordinator.async_shutdown()
+
+
+async def test_entities_are_added_again_when_removed_vent_comes_back(hass: HomeAssistant) -> None:
+    """A vent whose entities were removed along with its device gets new entities when it comes back."""
+
+    client = FakeClient(snapshot({}, vent=True))
+    coordinator = await async_setup_coordinator(hass, client)
+    platform = entity_platform(hass, 'cover')
+    entry = SimpleNamespace(async_on_unload=lambda unload: None)
+    async_setup_entity_discovery(
+        entry,
+        {STRUCTURE_ID: coordinator},
+        lambda entities: hass.async_create_task(platform.async_add_entities(entities)),
+        cover.build_entities,
+    )
+    await hass.async_block_till_done()
+    entity_ids = list(platform.entities)
+    assert entity_ids
+
+    client.data = snapshot({})
+    await coordinator.async_refresh()
+    # Removing the device removes its entities from the registry.
+    entity_registry = er.async_get(hass)
+    for entity_id in entity_ids:
+        entity_registry.async_remove(entity_id)
+    await hass.async_block_till_done()
+    assert not platform.entities
+
+    client.data = snapshot({}, vent=True)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert list(platform.entities) == entity_ids
+    assert all(hass.states.get(entity_id).state != STATE_UNAVAILABLE for entity_id in entity_ids)
+    await coordinator.async_shutdown()
+
+
+async def test_entities_follow_vent_to_another_structure_coordinator(hass: HomeAssistant) -> None:
+    """A vent that moves to a structure fetched by another coordinator gets entities of that coordinator."""
+
+    home = snapshot({}, vent=True).structures[STRUCTURE_ID]
+    other = replace(home, id=OTHER_ID, pucks={}, vents={})
+    client = FakeClient(FlairData(users={}, structures={STRUCTURE_ID: home, OTHER_ID: other}))
+    coordinators = {
+        structure_id: await async_setup_coordinator(hass, client, structure_id)
+        for structure_id in (STRUCTURE_ID, OTHER_ID)
+    }
+    platform = entity_platform(hass, 'cover')
+    async_setup_entity_discovery(
+        SimpleNamespace(async_on_unload=lambda unload: None),
+        coordinators,
+        lambda entities: hass.async_create_task(platform.async_add_entities(entities)),
+        cover.build_entities,
+    )
+    await hass.async_block_till_done()
+    entity_ids = list(platform.entities)
+    assert entity_ids
+
+    client.data = FlairData(users={}, structures={
+        STRUCTURE_ID: replace(home, vents={}),
+        OTHER_ID: replace(other, vents=home.vents),
+    })
+    for coordinator in coordinators.values():
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert list(platform.entities) == entity_ids
+    assert all(entity.coordinator is coordinators[OTHER_ID] for entity in platform.entities.values())
+    assert all(hass.states.get(entity_id).state != STATE_UNAVAILABLE for entity_id in entity_ids)
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
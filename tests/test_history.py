@@ -0,0 +1,70 @@
+"""Tests for the Flair reading history."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.flair.history import HISTORY_METRICS, ReadingHistory
+
+
+def reading(timestamp: float, device_id: str) -> tuple[float, str, str, tuple[float, ...]]:
+    """Return a puck reading with every metric set to its timestamp."""
+
+    return timestamp, 'pucks', device_id, (timestamp,) * HISTORY_METRICS
+
+
+def test_history_wraps_around_and_persists(tmp_path) -> None:
+    """The oldest readings are overwritten once full and the rest survive reopening."""
+
+    path = str(tmp_path / 'flair.history')
+    history = ReadingHistory(path, 3)
+    history.append([reading(1, 'a'), reading(2, 'b')])
+    history.append([reading(3, 'a'), reading(4, 'a')])
+    readings = history.readings()
+    # Closing while the readings are still referenced must not fail.
+    history.close()
+
+    assert readings == [reading(2, 'b'), reading(3, 'a'), reading(4, 'a')]
+    assert ReadingHistory(path, 3).readings() == readings
+
+
+def test_history_interrupted_while_wrapping_keeps_older_readings(tmp_path) -> None:
+    """Readings being overwritten when the append is interrupted aren't read back as part of the ring."""
+
+    path = str(tmp_path / 'flair.history')
+    history = ReadingHistory(path, 3)
+    history.append([reading(1, 'a'), reading(2, 'b'), reading(3, 'a')])
+
+    write_header = ReadingHistory._write_header
+    head = history._head
+
+    def crash_before_advancing(self) -> None:
+        """Stop before the header counts the new readings."""
+
+        if self._head != head:
+            raise OSError('Interrupted')
+        write_header(self)
+
+    with patch.object(ReadingHistory, '_write_header', crash_before_advancing), pytest.raises(OSError):
+        history.append([reading(4, 'b')])
+    history.close()
+
+    assert ReadingHistory(path, 3).readings() == [reading(2, 'b'), reading(3, 'a')]
+
+
+def test_history_as_dict_summarizes_devices(tmp_path) -> None:
+    """Diagnostics report the readings held and the span they cover for each device."""
+
+    history = ReadingHistory(str(tmp_path / 'flair.history'), 10)
+    history.append([reading(1, 'a'), reading(2, 'b'), reading(3, 'a')])
+
+    assert history.as_dict() == {
+        'capacity': 10,
+        'count': 3,
+        'devices': {
+            'pucks/a': {'readings': 2, 'first': 1, 'last': 3},
+            'pucks/b': {'readings': 1, 'first': 2, 'last': 2},
+        },
+    }
+    history.close()
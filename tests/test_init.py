@@ -0,0 +1,158 @@
+"""Tests for the setup of the Flair integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from flairaio.model import FlairData
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.flair import async_reconcile_structures, async_setup_entry, binary_sensor, cover
+from custom_components.flair.const import CONF_STRUCTURE_COORDINATORS, DOMAIN
+from custom_components.flair.storage import SnapshotStore
+
+from .common import ENTRY_ID, STRUCTURE_ID, VENT_ID, FakeClient, async_add_entities, snapshot
+
+ADDED_ID = "added"
+REMOVED_ID = "removed"
+
+
+def account(structure_ids: list[str]) -> FakeClient:
+    """Return a client of an account with the given structures."""
+
+    structure = snapshot({}).structures[STRUCTURE_ID]
+    return FakeClient(FlairData(users={}, structures={
+        structure_id: replace(structure, id=structure_id) for structure_id in structure_ids
+    }))
+
+
+async def test_reconcile_structures_reloads_and_prunes(hass: HomeAssistant) -> None:
+    """Structures removed from the account are pruned and added ones are saved before reloading."""
+
+    entry = SimpleNamespace(entry_id=ENTRY_ID)
+    structure = snapshot({}).structures[STRUCTURE_ID]
+    saved = FlairData(users={}, structures={
+        STRUCTURE_ID: structure,
+        REMOVED_ID: replace(structure, id=REMOVED_ID),
+    })
+    store = SnapshotStore(hass, ENTRY_ID)
+    store.async_save(saved)
+
+    with patch.object(hass.config_entries, 'async_reload') as async_reload:
+        await async_reconcile_structures(
+            hass, entry, account([STRUCTURE_ID, ADDED_ID]), store, [STRUCTURE_ID, REMOVED_ID]
+        )
+        await hass.async_block_till_done()
+        async_reload.assert_called_once_with(ENTRY_ID)
+
+        # The coordinator of the removed structure may still be polling until the reload.
+        store.async_save(saved, REMOVED_ID)
+
+        restored_store = SnapshotStore(hass, ENTRY_ID)
+        restored = await restored_store.async_load()
+        assert restored_store.structure_ids == [STRUCTURE_ID, ADDED_ID]
+        assert list(restored.structures) == [STRUCTURE_ID]
+
+        await async_reconcile_structures(
+            hass, entry, account([STRUCTURE_ID, ADDED_ID]), restored_store, [STRUCTURE_ID, ADDED_ID]
+        )
+        async_reload.assert_called_once_with(ENTRY_ID)
+
+
+async def async_setup_structure_coordinators(hass: HomeAssistant, client: FakeClient) -> dict:
+    """Set up an entry with a coordinator for each structure and return the coordinators."""
+
+    entry = ConfigEntry(
+        version=2,
+        minor_version=1,
+        domain=DOMAIN,
+        title='Flair',
+        data={CONF_CLIENT_ID: 'client', CONF_CLIENT_SECRET: 'secret'},
+        source='user',
+        options={CONF_STRUCTURE_COORDINATORS: True},
+        entry_id=ENTRY_ID,
+    )
+    with (
+        patch('custom_components.flair.FlairApiClient', return_value=client),
+        patch.object(hass.config_entries, 'async_forward_entry_setups', AsyncMock()),
+    ):
+        await async_setup_entry(hass, entry)
+    return hass.data[DOMAIN][ENTRY_ID]
+
+
+async def test_structure_failing_first_refresh_does_not_fail_setup(hass: HomeAssistant) -> None:
+    """A structure that can't be fetched is retried on its own while the others are set up."""
+
+    client = account([STRUCTURE_ID, ADDED_ID])
+    client.unreachable.add(ADDED_ID)
+    with patch.object(client, 'get_users', wraps=client.get_users) as get_users:
+        coordinators = await async_setup_structure_coordinators(hass, client)
+        assert get_users.call_count == 1
+
+    assert coordinators[STRUCTURE_ID].last_update_success
+    assert not coordinators[ADDED_ID].last_update_success
+
+    client.unreachable.clear()
+    await coordinators[ADDED_ID].async_refresh()
+    assert list(coordinators[ADDED_ID].data.structures) == [ADDED_ID]
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
+
+
+async def test_setup_fails_if_every_structure_fails(hass: HomeAssistant) -> None:
+    """Setup is retried when none of the structures can be fetched."""
+
+    client = account([STRUCTURE_ID, ADDED_ID])
+    client.unreachable.update((STRUCTURE_ID, ADDED_ID))
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_structure_coordinators(hass, client)
+
+
+async def test_restored_entities_show_saved_values_until_refreshed(hass: HomeAssistant) -> None:
+    """Entities start from the saved snapshot, marked stale, while the first refresh is still running."""
+
+    store = SnapshotStore(hass, ENTRY_ID)
+    store.async_save(snapshot({}, vent=True))
+    await store.async_set_structure_ids([STRUCTURE_ID])
+
+    live = snapshot({}, vent=True)
+    live.structures[STRUCTURE_ID].vents[VENT_ID].attributes['percent-open'] = 50
+    client = FakeClient(live)
+    reachable = asyncio.Event()
+    get_structure = client.get_structure
+
+    async def async_get_structure(structure_id: str):
+        await reachable.wait()
+        return await get_structure(structure_id)
+
+    with patch.object(client, 'get_structure', async_get_structure):
+        coordinators = await async_setup_structure_coordinators(hass, client)
+        coordinator = coordinators[STRUCTURE_ID]
+        entities = await async_add_entities(hass, 'cover', cover.build_entities(coordinator, STRUCTURE_ID))
+        sensors = await async_add_entities(hass, 'binary_sensor', (
+            entity for entity in binary_sensor.build_entities(coordinator, STRUCTURE_ID)
+            if ('vents', VENT_ID) in entity.coordinator_context
+        ))
+        assert sensors
+        assert all(hass.states.get(entity.entity_id).state != STATE_UNAVAILABLE for entity in sensors)
+        state = hass.states.get(entities[0].entity_id)
+        assert state.attributes['current_tilt_position'] == 100
+        assert state.attributes['stale']
+
+        # The first refresh runs in the background, so wait for it to publish.
+        refreshed = hass.loop.create_future()
+        coordinator.async_add_listener(lambda: refreshed.done() or refreshed.set_result(None))
+        reachable.set()
+        await refreshed
+
+    state = hass.states.get(entities[0].entity_id)
+    assert state.attributes['current_tilt_position'] == 50
+    assert 'stale' not in state.attributes
+    await coordinator.async_shutdown()
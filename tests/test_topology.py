@@ -0,0 +1,58 @@
+"""Tests for the Flair topology index."""
+from __future__ import annotations
+
+from dataclasses import replace
+
+from flairaio.model import HVACUnit
+
+from custom_components.flair.records import HVACUnitRecord
+from custom_components.flair.topology import Topology
+
+from .common import PUCK_ID, STRUCTURE_ID, VENT_ID, snapshot
+
+HVAC_ID = "hvac"
+
+
+def test_hvac_unit_record_and_related_records() -> None:
+    """HVAC units get a record and the records of their puck are resolved ahead of time."""
+
+    data = snapshot({'current-temperature-c': 21.0})
+    hvac_unit = HVACUnit(
+        id=HVAC_ID,
+        attributes={'name': 'Heat pump', 'power': 'On', 'mode': 'Cool', 'fan-speed': 'Auto', 'temperature': 22},
+        relationships={'puck': {'data': {'type': 'pucks', 'id': PUCK_ID}}, 'room': {'data': None}},
+    )
+    structure = replace(data.structures[STRUCTURE_ID], hvac_units={HVAC_ID: hvac_unit})
+    topology = Topology.build(replace(data, structures={STRUCTURE_ID: structure}))
+
+    assert topology.record('hvac-units', HVAC_ID) == HVACUnitRecord(
+        name='Heat pump', power='On', mode='Cool', fan_speed='Auto', swing=None, temperature=22,
+    )
+    assert topology.related_record('hvac-units', HVAC_ID, 'puck').temperature_c == 21.0
+    assert topology.related_record('hvac-units', HVAC_ID, 'room') is None
+
+
+def test_connected_gateway_is_a_relation() -> None:
+    """A device's gateway resolves like a relationship so its listeners follow the gateway."""
+
+    data = snapshot({'connected-gateway-type': 'bridge', 'connected-gateway-id': 'bridge'})
+    topology = Topology.build(data)
+
+    assert topology.relations[('pucks', PUCK_ID, 'gateway')] == ('bridges', 'bridge')
+    assert ('vents', 'vent', 'gateway') not in Topology.build(snapshot({}, vent=True)).relations
+
+
+def test_records_of_unchanged_resources_are_reused() -> None:
+    """Only resources that were replaced by a new snapshot get new records."""
+
+    data = snapshot({'current-temperature-c': 21.0}, vent=True)
+    topology = Topology.build(data)
+    structure = data.structures[STRUCTURE_ID]
+    puck = replace(structure.pucks[PUCK_ID], attributes={**structure.pucks[PUCK_ID].attributes})
+    rebuilt = Topology.build(
+        replace(data, structures={STRUCTURE_ID: replace(structure, pucks={PUCK_ID: puck})}), topology
+    )
+
+    assert rebuilt.records[('vents', VENT_ID)] is topology.records[('vents', VENT_ID)]
+    assert rebuilt.records[('pucks', PUCK_ID)] is not topology.records[('pucks', PUCK_ID)]
+    assert rebuilt.records[('pucks', PUCK_ID)] == topology.records[('pucks', PUCK_ID)]